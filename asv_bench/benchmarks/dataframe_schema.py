@@ -1,4 +1,5 @@
 # Airspeed Velocity Benchmarks for pandera
+import numpy as np
 import pandas as pd
 
 from pandera import (
@@ -51,6 +52,64 @@ class Validate:
          self.schema.validate(self.df)
 
 
+class ValidateCopy:
+    """
+    Benchmarking memory usage of schema.validate with and without copies
+    """
+
+    params = [True, False]
+    param_names = ["copy"]
+
+    def setup(self, copy):
+        n_rows = 1_000_000
+        self.schema = DataFrameSchema(
+                {
+                    "a": Column(Int, coerce=True),
+                    "b": Column(Float, coerce=True),
+                    "c": Column(Float, Check.ge(0)),
+                    "d": Column(Bool),
+                    },
+                )
+        self.df = pd.DataFrame(
+                {
+                    "a": np.arange(n_rows).astype(float),
+                    "b": np.random.random(n_rows),
+                    "c": np.random.random(n_rows),
+                    "d": np.random.random(n_rows) > 0.5,
+                    })
+
+    def time_df_schema(self, copy):
+        self.schema.validate(self.df, copy=copy)
+
+    def peakmem_df_schema(self, copy):
+        self.schema.validate(self.df, copy=copy)
+
+
+class CoerceDtype:
+    """
+    Benchmarking the coercion of wide dataframes
+    """
+
+    params = [10, 100, 500]
+    param_names = ["n_columns"]
+
+    def setup(self, n_columns):
+        self.schema = DataFrameSchema(
+                {f"col_{i}": Column(Int) for i in range(n_columns)},
+                coerce=True,
+                )
+        self.df = pd.DataFrame(
+                np.random.randint(0, 100, (10_000, n_columns)).astype(float),
+                columns=[f"col_{i}" for i in range(n_columns)],
+                )
+
+    def time_coerce_dtype(self, n_columns):
+        self.schema.coerce_dtype(self.df)
+
+    def time_df_schema(self, n_columns):
+        self.schema.validate(self.df, copy=False)
+
+
 class Decorators:
     """
     Benchmarking input and output decorator performance.
@@ -0,0 +1,64 @@
+# Airspeed Velocity Benchmarks for pandera
+import numpy as np
+import pandas as pd
+
+from pandera import Column, DataFrameSchema, Float, Int, String
+from pandera.engines import pandas_engine
+
+
+class EngineDtype:
+    """
+    Benchmarking the resolution of data types by the pandas engine
+    """
+
+    params = [
+        "numpy_dtype",
+        "extension_dtype",
+        "string_alias",
+        "python_type",
+        "pandera_dtype",
+    ]
+    param_names = ["data_type"]
+
+    def setup(self, data_type):
+        self.data_type = {
+            "numpy_dtype": np.dtype("int64"),
+            "extension_dtype": pd.Int64Dtype(),
+            "string_alias": "int64",
+            "python_type": int,
+            "pandera_dtype": pandas_engine.Engine.dtype("int64"),
+        }[data_type]
+
+    def time_engine_dtype(self, data_type):
+        for _ in range(1000):
+            pandas_engine.Engine.dtype(self.data_type)
+
+
+class ValidateDtypes:
+    """
+    Benchmarking the per-column overhead of data type checks. Nullable
+    columns have nothing to validate besides their data type.
+    """
+
+    params = [[10, 200], [False, True]]
+    param_names = ["n_columns", "nullable"]
+
+    def setup(self, n_columns, nullable):
+        dtypes = [Int, Float, String]
+        self.schema = DataFrameSchema(
+            {
+                f"col_{i}": Column(dtypes[i % 3], nullable=nullable)
+                for i in range(n_columns)
+            }
+        )
+        self.df = pd.DataFrame(
+            {
+                f"col_{i}": [[1, 2, 3], [1.0, 2.0, 3.0], ["a", "b", "c"]][
+                    i % 3
+                ]
+                for i in range(n_columns)
+            }
+        )
+
+    def time_df_schema(self, n_columns, nullable):
+        self.schema.validate(self.df, copy=False)
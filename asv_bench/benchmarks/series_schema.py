@@ -1,4 +1,5 @@
 # Airspeed Velocity Benchmarks for pandera
+import numpy as np
 import pandas as pd
 
 from pandera import (
@@ -33,3 +34,28 @@ class Validate:
 
     def peakmem_series_schema(self):
          self.schema.validate(self.series)
+
+
+class ValidateBuiltinChecks:
+    """
+    Benchmarking Series schema.validate with built-in checks
+    """
+
+    def setup(self):
+        n_rows = 1_000_000
+        self.schema = SeriesSchema(
+                Float,
+                checks=[
+                    Check.ge(0),
+                    Check.lt(1),
+                    Check.in_range(0, 1),
+                    Check.notin([-1, 2]),
+                    ],
+                name="my_series")
+        self.series = pd.Series(np.random.random(n_rows), name="my_series")
+
+    def time_series_schema(self):
+        self.schema.validate(self.series)
+
+    def peakmem_series_schema(self):
+        self.schema.validate(self.series)
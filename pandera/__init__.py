@@ -27,6 +27,7 @@ from pandera.dtypes import (
     UInt32,
     UInt64,
 )
+from pandera.engines import arrow_engine
 from pandera.engines.numpy_engine import Object
 from pandera.engines.pandas_engine import (
     BOOL,
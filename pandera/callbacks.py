@@ -0,0 +1,214 @@
+"""Callbacks fired around the phases of dataframe validation.
+
+Callbacks receive a :class:`ValidationEvent` at the end of each phase of
+:meth:`~pandera.schemas.DataFrameSchema.validate`, with the time spent in
+the phase, the errors it found and the size of the data it validated, so
+that validation metrics can be exported:
+
+>>> import pandas as pd
+>>> import pandera as pa
+>>> from pandera import callbacks
+>>>
+>>> events = []
+>>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+>>> with callbacks.registered(events.append):
+...     validated = schema.validate(pd.DataFrame({"a": [1, 2, 3]}))
+>>> [(event.phase, event.n_rows, event.n_errors) for event in events]
+[('required_columns', 3, 0), ('schema_components', 3, 0)]
+
+Phases are only instrumented while callbacks are registered.
+"""
+
+import contextlib
+import time
+from typing import Callable, Iterator, List, Optional, Union, cast
+
+import pandas as pd
+
+from . import errors
+from .error_handlers import SchemaErrorHandler
+
+# phases of dataframe validation, in the order they run
+PHASES = (
+    "strictness",
+    "required_columns",
+    "coercion",
+    "schema_components",
+    "dataframe_checks",
+    "uniqueness",
+)
+
+_CALLBACKS: List[Callable[["ValidationEvent"], None]] = []
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+class ValidationEvent:
+    """A phase of dataframe validation that has run."""
+
+    def __init__(
+        self,
+        schema,
+        phase: str,
+        data: Union[pd.DataFrame, pd.Series],
+        duration: float,
+        schema_errors: List[errors.SchemaError],
+    ) -> None:
+        """Initialize a validation event.
+
+        :param schema: schema validating the data.
+        :param phase: one of :data:`PHASES`.
+        :param data: data validated by the phase.
+        :param duration: wall time of the phase in seconds.
+        :param schema_errors: errors found by the phase. With
+            ``lazy=False``, this is the error that stopped validation, if
+            the phase raised it.
+        """
+        self.schema = schema
+        self.phase = phase
+        self.data = data
+        self.duration = duration
+        self.schema_errors = schema_errors
+        self._n_bytes: Optional[int] = None
+
+    @property
+    def n_rows(self) -> int:
+        """Number of rows validated by the phase."""
+        return len(self.data)
+
+    @property
+    def n_bytes(self) -> int:
+        """Number of bytes of the data validated by the phase, including its
+        index. The contents of Python objects, like strings in ``object``
+        columns, aren't counted."""
+        if self._n_bytes is None:
+            n_bytes = self.data.memory_usage(index=True)
+            self._n_bytes = int(
+                n_bytes.sum() if isinstance(n_bytes, pd.Series) else n_bytes
+            )
+        return self._n_bytes
+
+    @property
+    def n_errors(self) -> int:
+        """Number of errors found by the phase."""
+        return len(self.schema_errors)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} phase={self.phase!r}, "
+            f"n_rows={self.n_rows}, n_errors={self.n_errors}, "
+            f"duration={self.duration}>"
+        )
+
+
+def register(
+    callback: Callable[[ValidationEvent], None],
+) -> Callable[[ValidationEvent], None]:
+    """Register a callback fired at the end of each phase of dataframe
+    validation.
+
+    Callbacks are fired by the thread that runs the phase, and exceptions
+    they raise are propagated to the caller of validation.
+
+    :param callback: function called with a :class:`ValidationEvent`.
+    :returns: the callback, so that ``register`` can be used as a decorator.
+    """
+    _CALLBACKS.append(callback)
+    return callback
+
+
+def unregister(callback: Callable[[ValidationEvent], None]) -> None:
+    """Unregister a callback.
+
+    :param callback: registered callback.
+    :raises ValueError: if the callback isn't registered.
+    """
+    _CALLBACKS.remove(callback)
+
+
+@contextlib.contextmanager
+def registered(*callbacks: Callable[[ValidationEvent], None]) -> Iterator:
+    """Register callbacks for the duration of the context.
+
+    :param callbacks: functions called with a :class:`ValidationEvent`.
+    """
+    for callback in callbacks:
+        register(callback)
+    try:
+        yield
+    finally:
+        for callback in callbacks:
+            unregister(callback)
+
+
+class _PhaseEvents:  # pylint:disable=too-few-public-methods
+    """Fire the events of the phases of a validation."""
+
+    def __init__(self, schema, error_handler: SchemaErrorHandler) -> None:
+        self.schema = schema
+        self.error_handler = error_handler
+        self.callbacks = list(_CALLBACKS)
+
+    @contextlib.contextmanager
+    def phase(
+        self, phase: str, data: Union[pd.DataFrame, pd.Series]
+    ) -> Iterator:
+        """Fire the event of a phase when it ends, even if it raises a
+        schema error."""
+        n_collected = len(self.error_handler.collected_errors)
+        raised: List[errors.SchemaError] = []
+        start = time.perf_counter()
+        try:
+            yield
+        except errors.SchemaError as exc:
+            raised = [exc]
+            raise
+        except errors.SchemaErrors as exc:
+            raised = [
+                schema_error_dict["error"]
+                for schema_error_dict in exc.schema_errors
+            ]
+            raise
+        finally:
+            collected = [
+                cast(errors.SchemaError, schema_error_dict["error"])
+                for schema_error_dict in (
+                    self.error_handler.collected_errors[n_collected:]
+                )
+            ]
+            event = ValidationEvent(
+                self.schema,
+                phase,
+                data,
+                time.perf_counter() - start,
+                collected + raised,
+            )
+            for callback in self.callbacks:
+                callback(event)
+
+
+class _NoPhaseEvents:  # pylint:disable=too-few-public-methods
+    """Phases of a validation without registered callbacks."""
+
+    @staticmethod
+    def phase(phase: str, data: Union[pd.DataFrame, pd.Series]):
+        """Context manager that doesn't fire any event."""
+        # pylint: disable=unused-argument
+        return _NULL_PHASE
+
+
+_NO_PHASE_EVENTS = _NoPhaseEvents()
+
+
+def phase_events(schema, error_handler: SchemaErrorHandler):
+    """Events of the phases of a validation.
+
+    :param schema: schema validating the data.
+    :param error_handler: error handler collecting the errors of the
+        validation.
+    :returns: object whose ``phase(phase, data)`` method returns a context
+        manager wrapping a phase.
+    """
+    if not _CALLBACKS:
+        return _NO_PHASE_EVENTS
+    return _PhaseEvents(schema, error_handler)
@@ -2,8 +2,47 @@
 
 from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from . import constants
+
+# bytes used by the column code, position, failure value code and index
+# label code of a stored failure case
+FAILURE_CASE_BYTES = 4 + 8 + 4 + 4
+
+
+def max_failure_cases(
+    n_failure_cases: Optional[int] = None,
+) -> Optional[int]:
+    """Maximum number of failure cases of a check to build.
+
+    No more failure cases than fit into
+    ``pandera.constants.MAX_FAILURE_CASE_BYTES`` can be kept, so checks don't
+    build the others in the first place.
+
+    :param n_failure_cases: number of failure cases reported by the check.
+    """
+    if constants.MAX_FAILURE_CASE_BYTES is None:
+        return n_failure_cases
+    limit = constants.MAX_FAILURE_CASE_BYTES // FAILURE_CASE_BYTES
+    return limit if n_failure_cases is None else min(n_failure_cases, limit)
+
+
+def first_failure_cases(
+    check_obj: Union[pd.Series, pd.DataFrame],
+    failed: np.ndarray,
+    n_failure_cases: Optional[int] = None,
+) -> Union[pd.Series, pd.DataFrame]:
+    """Build the first failure cases of a check.
+
+    :param check_obj: object validated by the check.
+    :param failed: boolean array that is True for the failing rows.
+    :param n_failure_cases: number of failure cases reported by the check.
+    """
+    positions = np.flatnonzero(failed)[: max_failure_cases(n_failure_cases)]
+    return check_obj.iloc[positions]
+
 
 def prepare_series_check_output(
     check_obj: Union[pd.Series, pd.DataFrame],
@@ -23,14 +62,49 @@ def prepare_series_check_output(
             else check_obj.isna()
         )
         check_output = check_output | isna
-    failure_cases = check_obj[~check_output]
-    if not failure_cases.empty and n_failure_cases is not None:
-        failure_cases = failure_cases.groupby(check_output).head(
-            n_failure_cases
+    n_failure_cases = max_failure_cases(n_failure_cases)
+    if n_failure_cases is not None and check_output.index.equals(
+        check_obj.index
+    ):
+        failure_cases = first_failure_cases(
+            check_obj,
+            (~check_output).to_numpy(dtype=bool, na_value=False),
+            n_failure_cases,
         )
+    else:
+        failure_cases = check_obj[~check_output]
+        if n_failure_cases is not None:
+            failure_cases = failure_cases.iloc[:n_failure_cases]
     return check_output, failure_cases
 
 
+def prepare_vectorized_check_output(
+    check_obj: Union[pd.Series, pd.DataFrame],
+    passed: np.ndarray,
+    ignore_na: bool = True,
+    n_failure_cases: Optional[int] = None,
+) -> Tuple[pd.Series, Union[pd.Series, pd.DataFrame]]:
+    """Prepare the check output and failure cases for a boolean array.
+
+    Same as :func:`prepare_series_check_output`, but null values and failure
+    cases are only looked up when some elements failed the check.
+    """
+    failed = np.flatnonzero(~passed)
+    if failed.size and ignore_na:
+        failed_isna = (
+            check_obj.iloc[failed].isna().any(axis="columns").to_numpy()
+            if isinstance(check_obj, pd.DataFrame)
+            else pd.isna(check_obj.values[failed])
+        )
+        if failed_isna.any():
+            passed[failed[failed_isna]] = True
+            failed = failed[~failed_isna]
+    return (
+        pd.Series(passed, index=check_obj.index, copy=False),
+        check_obj.iloc[failed[: max_failure_cases(n_failure_cases)]],
+    )
+
+
 def prepare_dataframe_check_output(
     check_obj: pd.DataFrame,
     check_output: pd.DataFrame,
@@ -57,6 +131,8 @@ def prepare_dataframe_check_output(
         .rename_axis(["column", "index"])
         .reset_index()
     )
+    # failure cases are only limited once duplicates are dropped
+    n_failure_cases = max_failure_cases(n_failure_cases)
     if not failure_cases.empty and n_failure_cases is not None:
         failure_cases = failure_cases.drop_duplicates().head(n_failure_cases)
     return check_output, failure_cases
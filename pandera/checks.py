@@ -1,4 +1,5 @@
 """Data validation checks."""
+# pylint: disable=too-many-lines
 
 import inspect
 import operator
@@ -21,8 +22,9 @@ from typing import (
 
 import pandas as pd
 
-from . import check_utils, constants, errors
+from . import check_utils, constants, errors, expressions
 from . import strategies as st
+from . import vectorized_checks
 
 CheckResult = namedtuple(
     "CheckResult",
@@ -259,6 +261,11 @@ class _CheckBase(metaclass=_CheckMeta):
         self.failure_cases = None
 
         self._statistics = None
+        # vectorized representation of built-in checks
+        self._expression: Optional[vectorized_checks.CheckExpression] = None
+        self._dataframe_expression: Optional[
+            expressions.DataFrameExpression
+        ] = None
 
     @property
     def statistics(self) -> Dict[str, Any]:
@@ -270,6 +277,24 @@ class _CheckBase(metaclass=_CheckMeta):
         """Set check statistics."""
         self._statistics = statistics
 
+    @property
+    def vectorized_expression(
+        self,
+    ) -> Optional[vectorized_checks.CheckExpression]:
+        """Vectorized expression of a built-in check that can be evaluated
+        directly on the values of a Series, if any."""
+        if self.element_wise or self.groupby is not None:
+            return None
+        return self._expression
+
+    @property
+    def dataframe_expression(
+        self,
+    ) -> Optional[expressions.DataFrameExpression]:
+        """Expression on the columns of a dataframe checked by
+        :meth:`Check.expr`, if any."""
+        return self._dataframe_expression
+
     @staticmethod
     def _format_groupby_input(
         groupby_obj: GroupbyObject,
@@ -345,6 +370,7 @@ class _CheckBase(metaclass=_CheckMeta):
         self,
         df_or_series: Union[pd.DataFrame, pd.Series],
         column: Optional[str] = None,
+        fail_fast: bool = False,
     ) -> CheckResult:
         # pylint: disable=too-many-branches
         """Validate pandas DataFrame or Series.
@@ -352,6 +378,11 @@ class _CheckBase(metaclass=_CheckMeta):
         :param df_or_series: pandas DataFrame of Series to validate.
         :param column: for dataframe checks, apply the check function to this
             column.
+        :param fail_fast: if True, built-in, expression and element-wise
+            checks are evaluated one block of rows at a time, stopping at the
+            first block with failure cases, or at the block where
+            ``n_failure_cases`` failure cases are found if it's set. The
+            check output then only covers the evaluated rows.
         :returns: CheckResult tuple containing:
 
             ``check_output``: boolean scalar, ``Series`` or ``DataFrame``
@@ -381,6 +412,48 @@ class _CheckBase(metaclass=_CheckMeta):
                 "Series, a dictionary of Series, or DataFrame"
             )
 
+        columns = None
+        if self._dataframe_expression is not None:
+            if isinstance(check_obj, pd.Series):
+                check_obj = check_obj.to_frame()
+            # only report the columns that the expression depends on
+            columns = sorted(self._dataframe_expression.columns, key=str)
+
+        evaluate_rows = vectorized_checks.row_evaluator(
+            check_obj,
+            self.vectorized_expression,
+            self._dataframe_expression,
+            element_wise_fn=(
+                partial(self._check_fn, **self._check_kwargs)
+                if self.element_wise
+                else None
+            ),
+        )
+        vectorized_output = None
+        if evaluate_rows is not None and fail_fast:
+            vectorized_output = vectorized_checks.evaluate_until_failure(
+                check_obj,
+                evaluate_rows,
+                self.ignore_na,
+                self.n_failure_cases,
+                columns,
+            )
+        elif evaluate_rows is not None and not self.element_wise:
+            passed = evaluate_rows(slice(None))
+            if passed is not None:
+                vectorized_output = vectorized_checks.vectorized_check_output(
+                    check_obj,
+                    passed,
+                    self.ignore_na,
+                    self.n_failure_cases,
+                    columns,
+                )
+        if vectorized_output is not None:
+            check_output, failure_cases = vectorized_output
+            return CheckResult(
+                check_output, check_output.all(), check_obj, failure_cases
+            )
+
         # apply check function to check object
         check_fn = partial(self._check_fn, **self._check_kwargs)
 
@@ -521,12 +594,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series == value
 
-        return cls(
+        check = cls(
             _equal,
             name=cls.equal_to.__name__,
             error=f"equal_to({value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("eq", value)
+        return check
 
     eq = equal_to
 
@@ -550,12 +625,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series != value
 
-        return cls(
+        check = cls(
             _not_equal,
             name=cls.not_equal_to.__name__,
             error=f"not_equal_to({value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("ne", value)
+        return check
 
     ne = not_equal_to
 
@@ -582,12 +659,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series > min_value
 
-        return cls(
+        check = cls(
             _greater_than,
             name=cls.greater_than.__name__,
             error=f"greater_than({min_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("gt", min_value)
+        return check
 
     gt = greater_than
 
@@ -614,12 +693,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series >= min_value
 
-        return cls(
+        check = cls(
             _greater_or_equal,
             name=cls.greater_than_or_equal_to.__name__,
             error=f"greater_than_or_equal_to({min_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("ge", min_value)
+        return check
 
     ge = greater_than_or_equal_to
 
@@ -646,12 +727,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series < max_value
 
-        return cls(
+        check = cls(
             _less_than,
             name=cls.less_than.__name__,
             error=f"less_than({max_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("lt", max_value)
+        return check
 
     lt = less_than
 
@@ -678,12 +761,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series <= max_value
 
-        return cls(
+        check = cls(
             _less_or_equal,
             name=cls.less_than_or_equal_to.__name__,
             error=f"less_than_or_equal_to({max_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.Compare("le", max_value)
+        return check
 
     le = less_than_or_equal_to
 
@@ -733,12 +818,16 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return left_op(min_value, series) & right_op(max_value, series)
 
-        return cls(
+        check = cls(
             _in_range,
             name=cls.in_range.__name__,
             error=f"in_range({min_value}, {max_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.in_range(
+            min_value, max_value, include_min, include_max
+        )
+        return check
 
     @classmethod
     @st.register_check_strategy(st.isin_strategy)
@@ -773,12 +862,14 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return series.isin(allowed_values)
 
-        return cls(
+        check = cls(
             _isin,
             name=cls.isin.__name__,
             error=f"isin({set(allowed_values)})",
             **kwargs,
         )
+        check._expression = vectorized_checks.IsIn(allowed_values)
+        return check
 
     @classmethod
     @st.register_check_strategy(st.notin_strategy)
@@ -813,12 +904,16 @@ class Check(_CheckBase):
             """Comparison function for check"""
             return ~series.isin(forbidden_values)
 
-        return cls(
+        check = cls(
             _notin,
             name=cls.notin.__name__,
             error=f"notin({set(forbidden_values)})",
             **kwargs,
         )
+        check._expression = vectorized_checks.IsIn(
+            forbidden_values, negate=True
+        )
+        return check
 
     @classmethod
     @st.register_check_strategy(st.str_matches_strategy)
@@ -971,9 +1066,71 @@ class Check(_CheckBase):
                     series.str.len() >= min_value
                 )
 
-        return cls(
+        check = cls(
             _str_length,
             name=cls.str_length.__name__,
             error=f"str_length({min_value}, {max_value})",
             **kwargs,
         )
+        check._expression = vectorized_checks.str_length(min_value, max_value)
+        return check
+
+    @classmethod
+    @register_check_statistics(["expr", "ignore_na"])
+    def expr(cls, expr: str, ignore_na: bool = False, **kwargs) -> "Check":
+        """Ensure that the rows of a dataframe satisfy a boolean expression.
+
+        The expression references columns by name and supports arithmetic,
+        comparisons, ``&``, ``|``, ``~`` and the ``isna`` and ``notna``
+        methods of columns. As in :meth:`pandas.DataFrame.eval`, ``&`` and
+        ``|`` have a lower precedence than comparisons. The expression is
+        parsed once, and the columns it references are validated against the
+        columns of the :class:`~pandera.schemas.DataFrameSchema` it's used
+        in.
+
+        Numeric and boolean columns are evaluated with ``numexpr`` if it's
+        installed, otherwise with numpy, and other columns with
+        :meth:`pandas.DataFrame.eval`.
+
+        :param expr: boolean expression, e.g. ``"a > b * 2 & c.notna()"``.
+        :param ignore_na: whether rows with null values in the columns
+            referenced by the expression pass the check. Defaults to False,
+            since the expression can handle null values explicitly.
+        :param kwargs: key-word arguments passed into the `Check` initializer.
+
+        :returns: :class:`Check` object
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema(
+        ...     {"a": pa.Column(int), "b": pa.Column(float)},
+        ...     checks=pa.Check.expr("a > b * 2 & b.notna()"),
+        ... )
+        >>> schema(pd.DataFrame({"a": [3, 5], "b": [1.0, 2.0]}))
+           a    b
+        0  3  1.0
+        1  5  2.0
+
+        """
+        if kwargs.get("element_wise") or kwargs.get("groupby") is not None:
+            raise ValueError(
+                "expression checks can't be element-wise or grouped"
+            )
+        dataframe_expression = expressions.DataFrameExpression(expr)
+
+        def _expr(df: pd.DataFrame) -> pd.Series:
+            """Evaluate the expression on a dataframe"""
+            return pd.Series(dataframe_expression.evaluate(df), index=df.index)
+
+        check = cls(
+            _expr,
+            name=cls.expr.__name__,
+            error=f"expr('{expr}')",
+            ignore_na=ignore_na,
+            **kwargs,
+        )
+        check._dataframe_expression = dataframe_expression
+        return check
@@ -1,3 +1,11 @@
 """Constants for use across the library"""
 
 N_FAILURE_CASES = 10  # The number of failure cases to report.
+
+# Maximum number of bytes used by the failure cases collected by lazy
+# validation. Failure cases beyond the limit are dropped, and checks don't
+# build more failure cases than fit into it. None means no limit.
+MAX_FAILURE_CASE_BYTES = None
+
+# Number of failure values sampled per error by summary reports.
+N_REPORT_EXAMPLES = 5
@@ -0,0 +1,508 @@
+"""Apache Arrow engine and data types.
+
+Arrow data types validate Arrow-backed pandas columns, i.e. columns with a
+:class:`pandas.ArrowDtype`, which are supported from pandas 1.5. Arrow tables
+are converted to such dataframes with
+``table.to_pandas(types_mapper=pd.ArrowDtype)``. The data types of columns
+are checked from their metadata and data is coerced with Arrow compute casts,
+so that the columns keep their Arrow memory layout instead of being converted
+to numpy arrays:
+
+>>> import pandas as pd
+>>> import pyarrow
+>>> import pandera as pa
+>>>
+>>> schema = pa.DataFrameSchema(
+...     {
+...         "id": pa.Column(pyarrow.int32(), coerce=True),
+...         "name": pa.Column(pyarrow.large_string()),
+...     }
+... )
+>>> df = pd.DataFrame(
+...     {
+...         "id": pd.Series([1, 2], dtype="int64[pyarrow]"),
+...         "name": pd.Series(["a", "b"], dtype="large_string[pyarrow]"),
+...     }
+... )
+>>> schema.validate(df).dtypes
+id             int32[pyarrow]
+name    large_string[pyarrow]
+dtype: object
+
+Arrow data types without a dedicated pandera data type are boxed by
+:class:`DataType` as they are.
+"""
+
+# pylint:disable=too-many-ancestors
+
+# docstrings are inherited
+# pylint:disable=missing-class-docstring
+
+# pylint doesn't know about __init__ generated with dataclass
+# pylint:disable=unexpected-keyword-arg,no-value-for-parameter
+import dataclasses
+from typing import Any, Tuple, Union
+
+import pandas as pd
+import pyarrow
+import pyarrow.compute as pc
+
+from .. import dtypes, errors
+from ..dtypes import immutable
+from . import engine, pandas_engine, utils
+
+ArrowArray = Union[pyarrow.Array, pyarrow.ChunkedArray]
+
+
+def _cast(array: ArrowArray, arrow_type: pyarrow.DataType) -> ArrowArray:
+    """Cast an Arrow array with Arrow compute.
+
+    Arrays are dictionary-encoded before they are cast to a dictionary type,
+    since Arrow only casts dictionaries to other dictionaries.
+    """
+    if pyarrow.types.is_dictionary(arrow_type) and not (
+        pyarrow.types.is_dictionary(array.type)
+    ):
+        # compute functions are generated when pyarrow.compute is imported
+        # pylint: disable=no-member
+        array = pc.dictionary_encode(pc.cast(array, arrow_type.value_type))
+    return pc.cast(array, arrow_type)
+
+
+def _coercible(series: pd.Series, arrow_type: pyarrow.DataType) -> bool:
+    try:
+        _cast(pyarrow.array(series, from_pandas=True), arrow_type)
+        return True
+    except (pyarrow.ArrowException, TypeError, ValueError):
+        return False
+
+
+def _arrow_coercible(
+    series: pd.Series, arrow_type: pyarrow.DataType
+) -> pd.Series:
+    return utils.bisect_coercible(series, arrow_type, _coercible)
+
+
+@immutable(init=True)
+class DataType(dtypes.DataType):
+    """Base `DataType` for boxing Arrow data types."""
+
+    type: Any = dataclasses.field(default=None, repr=False, init=False)
+    """Native Arrow data type boxed by the data type."""
+
+    def __init__(self, dtype: pyarrow.DataType):
+        super().__init__()
+        object.__setattr__(self, "type", dtype)
+
+    def coerce(self, data_container: Any) -> Any:
+        """Coerce a pandas object to an Arrow-backed pandas object of the
+        data type, with an Arrow compute cast."""
+        if isinstance(data_container, pd.DataFrame):
+            return data_container.transform(self.coerce)
+        if not pandas_engine.PANDAS_1_5_0_PLUS:
+            raise TypeError(
+                "Coercion to Arrow data types requires pandas >= 1.5.0"
+            )
+        if getattr(data_container.dtype, "pyarrow_dtype", None) == self.type:
+            return data_container
+
+        try:
+            array = _cast(
+                pyarrow.array(data_container, from_pandas=True), self.type
+            )
+        except (pyarrow.ArrowException, TypeError, ValueError) as exc:
+            failure_cases, check_output = utils.numpy_pandas_coerce_failures(
+                data_container, self.type, _arrow_coercible
+            )
+            raise errors.ParserError(
+                f"Could not coerce {type(data_container)} data_container "
+                f"into type {self}",
+                failure_cases=failure_cases,
+                check_output=check_output,
+            ) from exc
+
+        # ArrowExtensionArray only exists from pandas 1.5.0, which is checked
+        # above
+        values = getattr(pd.arrays, "ArrowExtensionArray")(array)
+        if isinstance(data_container, pd.Index):
+            return pd.Index(values, name=data_container.name)
+        return pd.Series(
+            values, index=data_container.index, name=data_container.name
+        )
+
+    def check(self, pandera_dtype: dtypes.DataType) -> bool:
+        try:
+            pandera_dtype = Engine.dtype(pandera_dtype)
+        except TypeError:
+            return False
+        return self.type == pandera_dtype.type
+
+    def __str__(self) -> str:
+        return f"{self.type}[pyarrow]"
+
+    def __repr__(self) -> str:
+        return f"DataType({self})"
+
+
+class Engine(  # pylint:disable=too-few-public-methods
+    metaclass=engine.Engine,
+    base_pandera_dtypes=DataType,
+):
+    """Apache Arrow data type engine."""
+
+    @classmethod
+    @engine.cached_dtype
+    def dtype(cls, data_type: Any) -> DataType:
+        """Convert input into an Arrow-compatible
+        Pandera :class:`~pandera.dtypes.DataType` object."""
+        if pandas_engine.PANDAS_1_5_0_PLUS and isinstance(
+            data_type, pd.ArrowDtype
+        ):
+            data_type = data_type.pyarrow_dtype
+        elif isinstance(data_type, str):
+            alias = data_type
+            if alias.endswith("[pyarrow]"):
+                alias = alias[: -len("[pyarrow]")]
+            try:
+                data_type = pyarrow.type_for_alias(alias)
+            except ValueError:
+                raise TypeError(
+                    f"Data type '{data_type}' not understood by "
+                    f"{cls.__name__}."
+                ) from None
+
+        try:
+            return engine.Engine.dtype(cls, data_type)
+        except TypeError:
+            if isinstance(data_type, pyarrow.DataType):
+                return DataType(data_type)
+            raise
+
+
+###############################################################################
+# boolean
+###############################################################################
+
+
+@Engine.register_dtype(equivalents=[pyarrow.bool_()])
+@immutable
+class Bool(DataType, dtypes.Bool):
+    """Semantic representation of a :func:`pyarrow.bool_`."""
+
+    type = pyarrow.bool_()
+
+    def __init__(self) -> None:  # pylint:disable=super-init-not-called
+        pass
+
+
+###############################################################################
+# signed integer
+###############################################################################
+
+
+@Engine.register_dtype(equivalents=[pyarrow.int64()])
+@immutable
+class Int64(DataType, dtypes.Int):
+    """Semantic representation of a :func:`pyarrow.int64`."""
+
+    type = pyarrow.int64()
+    bit_width: int = 64
+
+    def __init__(self) -> None:  # pylint:disable=super-init-not-called
+        pass
+
+
+@Engine.register_dtype(equivalents=[pyarrow.int32()])
+@immutable
+class Int32(Int64):
+    """Semantic representation of a :func:`pyarrow.int32`."""
+
+    type = pyarrow.int32()
+    bit_width: int = 32
+
+
+@Engine.register_dtype(equivalents=[pyarrow.int16()])
+@immutable
+class Int16(Int32):
+    """Semantic representation of a :func:`pyarrow.int16`."""
+
+    type = pyarrow.int16()
+    bit_width: int = 16
+
+
+@Engine.register_dtype(equivalents=[pyarrow.int8()])
+@immutable
+class Int8(Int16):
+    """Semantic representation of a :func:`pyarrow.int8`."""
+
+    type = pyarrow.int8()
+    bit_width: int = 8
+
+
+###############################################################################
+# unsigned integer
+###############################################################################
+
+
+@Engine.register_dtype(equivalents=[pyarrow.uint64()])
+@immutable
+class UInt64(DataType, dtypes.UInt):
+    """Semantic representation of a :func:`pyarrow.uint64`."""
+
+    type = pyarrow.uint64()
+    bit_width: int = 64
+
+    def __init__(self) -> None:  # pylint:disable=super-init-not-called
+        pass
+
+
+@Engine.register_dtype(equivalents=[pyarrow.uint32()])
+@immutable
+class UInt32(UInt64):
+    """Semantic representation of a :func:`pyarrow.uint32`."""
+
+    type = pyarrow.uint32()
+    bit_width: int = 32
+
+
+@Engine.register_dtype(equivalents=[pyarrow.uint16()])
+@immutable
+class UInt16(UInt32):
+    """Semantic representation of a :func:`pyarrow.uint16`."""
+
+    type = pyarrow.uint16()
+    bit_width: int = 16
+
+
+@Engine.register_dtype(equivalents=[pyarrow.uint8()])
+@immutable
+class UInt8(UInt16):
+    """Semantic representation of a :func:`pyarrow.uint8`."""
+
+    type = pyarrow.uint8()
+    bit_width: int = 8
+
+
+###############################################################################
+# float
+###############################################################################
+
+
+@Engine.register_dtype(equivalents=[pyarrow.float64()])
+@immutable
+class Float64(DataType, dtypes.Float):
+    """Semantic representation of a :func:`pyarrow.float64`."""
+
+    type = pyarrow.float64()
+    bit_width: int = 64
+
+    def __init__(self) -> None:  # pylint:disable=super-init-not-called
+        pass
+
+
+@Engine.register_dtype(equivalents=[pyarrow.float32()])
+@immutable
+class Float32(Float64):
+    """Semantic representation of a :func:`pyarrow.float32`."""
+
+    type = pyarrow.float32()
+    bit_width: int = 32
+
+
+@Engine.register_dtype(equivalents=[pyarrow.float16()])
+@immutable
+class Float16(Float32):
+    """Semantic representation of a :func:`pyarrow.float16`."""
+
+    type = pyarrow.float16()
+    bit_width: int = 16
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class Decimal(DataType):
+    """Semantic representation of a :func:`pyarrow.decimal128`."""
+
+    type: pyarrow.Decimal128Type = dataclasses.field(default=None, init=False)
+    precision: int = 28
+    scale: int = 0
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, precision: int = 28, scale: int = 0
+    ) -> None:
+        object.__setattr__(self, "precision", precision)
+        object.__setattr__(self, "scale", scale)
+        object.__setattr__(self, "type", pyarrow.decimal128(precision, scale))
+
+    @classmethod
+    def from_parametrized_dtype(cls, arrow_dtype: pyarrow.Decimal128Type):
+        """Convert a :class:`pyarrow.Decimal128Type` to
+        a Pandera :class:`pandera.engines.arrow_engine.Decimal`."""
+        return cls(precision=arrow_dtype.precision, scale=arrow_dtype.scale)
+
+
+###############################################################################
+# string
+###############################################################################
+
+
+@Engine.register_dtype(equivalents=[pyarrow.string()])
+@immutable
+class String(DataType, dtypes.String):
+    """Semantic representation of a :func:`pyarrow.string`."""
+
+    type = pyarrow.string()
+
+    def __init__(self) -> None:  # pylint:disable=super-init-not-called
+        pass
+
+
+@Engine.register_dtype(equivalents=[pyarrow.large_string()])
+@immutable
+class LargeString(String):
+    """Semantic representation of a :func:`pyarrow.large_string`, whose
+    offsets are 64-bit."""
+
+    type = pyarrow.large_string()
+
+
+###############################################################################
+# time
+###############################################################################
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class Timestamp(DataType, dtypes.Timestamp):
+    """Semantic representation of a :func:`pyarrow.timestamp`."""
+
+    type: pyarrow.TimestampType = dataclasses.field(default=None, init=False)
+    unit: str = "ns"
+    tz: Any = None
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, unit: str = "ns", tz: Any = None
+    ) -> None:
+        object.__setattr__(self, "unit", unit)
+        object.__setattr__(self, "tz", tz)
+        object.__setattr__(self, "type", pyarrow.timestamp(unit, tz))
+
+    @classmethod
+    def from_parametrized_dtype(cls, arrow_dtype: pyarrow.TimestampType):
+        """Convert a :class:`pyarrow.TimestampType` to
+        a Pandera :class:`pandera.engines.arrow_engine.Timestamp`."""
+        return cls(unit=arrow_dtype.unit, tz=arrow_dtype.tz)
+
+
+###############################################################################
+# nested
+###############################################################################
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class Dictionary(DataType):
+    """Semantic representation of a :func:`pyarrow.dictionary`, i.e. a
+    categorical."""
+
+    type: pyarrow.DictionaryType = dataclasses.field(default=None, init=False)
+    index_type: Any = pyarrow.int32()
+    value_type: Any = pyarrow.string()
+    ordered: bool = False
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self,
+        index_type: Any = pyarrow.int32(),
+        value_type: Any = pyarrow.string(),
+        ordered: bool = False,
+    ) -> None:
+        object.__setattr__(self, "index_type", index_type)
+        object.__setattr__(self, "value_type", value_type)
+        object.__setattr__(self, "ordered", ordered)
+        object.__setattr__(
+            self, "type", pyarrow.dictionary(index_type, value_type, ordered)
+        )
+
+    @classmethod
+    def from_parametrized_dtype(cls, arrow_dtype: pyarrow.DictionaryType):
+        """Convert a :class:`pyarrow.DictionaryType` to
+        a Pandera :class:`pandera.engines.arrow_engine.Dictionary`."""
+        return cls(
+            index_type=arrow_dtype.index_type,
+            value_type=arrow_dtype.value_type,
+            ordered=arrow_dtype.ordered,
+        )
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class List(DataType):
+    """Semantic representation of a :func:`pyarrow.list_`."""
+
+    type: pyarrow.ListType = dataclasses.field(default=None, init=False)
+    value_type: Any
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, value_type: Any
+    ) -> None:
+        object.__setattr__(self, "value_type", value_type)
+        object.__setattr__(self, "type", pyarrow.list_(value_type))
+
+    @classmethod
+    def from_parametrized_dtype(cls, arrow_dtype: pyarrow.ListType):
+        """Convert a :class:`pyarrow.ListType` to
+        a Pandera :class:`pandera.engines.arrow_engine.List`."""
+        return cls(value_type=arrow_dtype.value_type)
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class Struct(DataType):
+    """Semantic representation of a :func:`pyarrow.struct`."""
+
+    type: pyarrow.StructType = dataclasses.field(default=None, init=False)
+    fields: Tuple[Tuple[str, Any], ...]
+    """Names and Arrow data types of the fields, as pairs or as a dict."""
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, fields: Any
+    ) -> None:
+        type_ = pyarrow.struct(
+            list(fields.items()) if isinstance(fields, dict) else list(fields)
+        )
+        object.__setattr__(self, "type", type_)
+        # fields are stored as a tuple so that the data type is hashable
+        object.__setattr__(
+            self, "fields", tuple((field.name, field.type) for field in type_)
+        )
+
+    @classmethod
+    def from_parametrized_dtype(cls, arrow_dtype: pyarrow.StructType):
+        """Convert a :class:`pyarrow.StructType` to
+        a Pandera :class:`pandera.engines.arrow_engine.Struct`."""
+        return cls(
+            fields=tuple((field.name, field.type) for field in arrow_dtype)
+        )
+
+
+###############################################################################
+# pandas
+###############################################################################
+
+if pandas_engine.PANDAS_1_5_0_PLUS:
+
+    class _PandasArrowDtype(DataType):
+        """Resolves Arrow data types with the Arrow engine in pandas schemas,
+        including the data types of Arrow-backed pandas columns."""
+
+        @classmethod
+        def from_parametrized_dtype(
+            cls, arrow_dtype: Union[pd.ArrowDtype, DataType]
+        ):
+            """Convert an Arrow data type to a Pandera Arrow data type."""
+            return Engine.dtype(arrow_dtype)
+
+    # only the conversion is registered, so that the data types registered
+    # with the pandas engine are all pandas data types
+    # pylint: disable=protected-access
+    pandas_engine.Engine._register_from_parametrized_dtype(_PandasArrowDtype)
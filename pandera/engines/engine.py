@@ -4,7 +4,7 @@
 import functools
 import inspect
 from abc import ABCMeta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -16,6 +16,7 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    cast,
     get_type_hints,
 )
 
@@ -24,9 +25,13 @@ import typing_inspect
 from pandera.dtypes import DataType
 
 _DataType = TypeVar("_DataType", bound=DataType)
+_DtypeMethod = TypeVar("_DtypeMethod", bound=Callable[[Any, Any], DataType])
 _Engine = TypeVar("_Engine", bound="Engine")
 _EngineType = Type[_Engine]
 
+# maximum number of resolved data types cached per engine
+DTYPE_CACHE_SIZE = 256
+
 
 if TYPE_CHECKING:  # pragma: no cover
 
@@ -51,6 +56,8 @@ else:
 class _DtypeRegistry:
     dispatch: Dispatch
     equivalents: Dict[Any, DataType]
+    # first-in first-out cache of the data types resolved by cached_dtype
+    cache: Dict[Any, DataType] = field(default_factory=dict)
 
 
 class Engine(ABCMeta):
@@ -71,6 +78,9 @@ class Engine(ABCMeta):
             namespace["_base_pandera_dtypes"] = (base_pandera_dtypes,)
 
         namespace["_registered_dtypes"] = set()
+        # instances of these types can be equal but resolve to different
+        # data types, so they aren't cached by ``cached_dtype``
+        namespace.setdefault("_uncached_dtypes", ())
         engine = super().__new__(cls, name, bases, namespace, **kwargs)
 
         @functools.singledispatch
@@ -116,6 +126,7 @@ class Engine(ABCMeta):
         for source_dtype in dtypes:
             cls._check_source_dtype(source_dtype)
             cls._registry[cls].dispatch.register(source_dtype, _method)
+        cls._registry[cls].cache.clear()
 
     def _register_equivalents(
         cls, pandera_dtype_cls: Type[DataType], *source_dtypes: Any
@@ -124,6 +135,7 @@ class Engine(ABCMeta):
         for source_dtype in source_dtypes:
             cls._check_source_dtype(source_dtype)
             cls._registry[cls].equivalents[source_dtype] = pandera_dtype
+        cls._registry[cls].cache.clear()
 
     def register_dtype(
         cls: _EngineType,
@@ -212,9 +224,62 @@ class Engine(ABCMeta):
                 f"Data type '{data_type}' not understood by {cls.__name__}."
             ) from None
 
+    def clear_dtype_cache(cls) -> None:
+        """Remove the data types resolved by the engine from its cache."""
+        cls._registry[cls].cache.clear()
+
     def get_registered_dtypes(  # pylint:disable=W1401
         cls,
     ) -> List[Type[DataType]]:
         """Return the :class:`pandera.dtypes.DataType`\s registered
         with this engine."""
         return list(cls._registered_dtypes)
+
+
+def cached_dtype(dtype_fn: _DtypeMethod) -> _DtypeMethod:
+    """Cache the data types resolved by the ``dtype`` method of an engine.
+
+    Data types of the engine are returned as they are. Other inputs are
+    cached by type and value, so that resolving the data types of the same
+    columns over and over, e.g. ``numpy.dtype("int64")``, is a dictionary
+    lookup. Unhashable inputs, inputs that can't be resolved and instances
+    of the ``_uncached_dtypes`` of the engine, whose equal values can
+    resolve to different data types, aren't cached. The oldest data types
+    are evicted from the cache beyond :data:`DTYPE_CACHE_SIZE` entries.
+    """
+
+    @functools.wraps(dtype_fn)
+    def _dtype(cls, data_type: Any) -> DataType:
+        data_type_cls = type(data_type)
+        # isinstance checks against the abstract base data types are slow,
+        # so data types of the engine are first looked up by class
+        if data_type_cls in cls._registered_dtypes:
+            return data_type
+        if isinstance(data_type, cls._uncached_dtypes):
+            return dtype_fn(cls, data_type)
+        cache = cls._registry[cls].cache
+        # the type is part of the key because values of different types can
+        # be equal, e.g. True == 1
+        key = (data_type_cls, data_type)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable data type
+            return dtype_fn(cls, data_type)
+
+        if isinstance(data_type, cls._base_pandera_dtypes):
+            return data_type
+        pandera_dtype = dtype_fn(cls, data_type)
+        if len(cache) >= DTYPE_CACHE_SIZE:
+            try:
+                # evict the oldest data type
+                del cache[next(iter(cache))]
+            except (KeyError, RuntimeError, StopIteration):
+                # modified by another thread
+                pass
+        cache[key] = pandera_dtype
+        return pandera_dtype
+
+    return cast(_DtypeMethod, _dtype)
@@ -49,12 +49,14 @@ class DataType(dtypes.DataType):
         try:
             return data_container.astype(self.type)
         except (ValueError, TypeError) as exc:
+            failure_cases, check_output = utils.numpy_pandas_coerce_failures(
+                data_container, self.type
+            )
             raise errors.ParserError(
                 f"Could not coerce {type(data_container)} data_container "
                 f"into type {self.type}",
-                failure_cases=utils.numpy_pandas_coerce_failure_cases(
-                    data_container, self.type
-                ),
+                failure_cases=failure_cases,
+                check_output=check_output,
             ) from exc
 
     def __str__(self) -> str:
@@ -70,6 +72,7 @@ class Engine(  # pylint:disable=too-few-public-methods
     """Numpy data type engine."""
 
     @classmethod
+    @engine.cached_dtype
     def dtype(cls, data_type: Any) -> dtypes.DataType:
         """Convert input into a numpy-compatible
         Pandera :class:`~pandera.dtypes.DataType` object."""
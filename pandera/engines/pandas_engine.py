@@ -16,6 +16,7 @@ from typing import Any, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow
 from packaging import version
 
 from .. import dtypes, errors
@@ -32,6 +33,7 @@ def pandas_version():
 
 
 PANDAS_1_3_0_PLUS = pandas_version().release >= (1, 3, 0)
+PANDAS_1_5_0_PLUS = pandas_version().release >= (1, 5, 0)
 
 try:
     from typing import Literal  # type: ignore
@@ -75,12 +77,14 @@ class DataType(dtypes.DataType):
         try:
             return data_container.astype(self.type)
         except (ValueError, TypeError) as exc:
+            failure_cases, check_output = utils.numpy_pandas_coerce_failures(
+                data_container, self.type
+            )
             raise errors.ParserError(
                 f"Could not coerce {type(data_container)} data_container "
                 f"into type {self.type}",
-                failure_cases=utils.numpy_pandas_coerce_failure_cases(
-                    data_container, self.type
-                ),
+                failure_cases=failure_cases,
+                check_output=check_output,
             ) from exc
 
     def check(self, pandera_dtype: dtypes.DataType) -> bool:
@@ -112,10 +116,19 @@ class Engine(  # pylint:disable=too-few-public-methods
 ):
     """Pandas data type engine."""
 
+    # unordered categorical dtypes with the same categories in a different
+    # order are equal
+    _uncached_dtypes = (pd.CategoricalDtype,)
+
     @classmethod
+    @engine.cached_dtype
     def dtype(cls, data_type: Any) -> "DataType":
         """Convert input into a pandas-compatible
         Pandera :class:`~pandera.dtypes.DataType` object."""
+        if PANDAS_1_5_0_PLUS and isinstance(data_type, pyarrow.DataType):
+            # Arrow data types are equal to their string aliases, e.g.
+            # pyarrow.float32() == "float", so they aren't looked up as is
+            data_type = pd.ArrowDtype(data_type)
         try:
             return engine.Engine.dtype(cls, data_type)
         except TypeError:
@@ -610,6 +623,175 @@ class Interval(DataType):
         return cls(subtype=pd_dtype.subtype)  # type: ignore
 
 
+###############################################################################
+# memory optimization
+###############################################################################
+
+
+def _compact_transform(coerce):
+    """Coerce each column of a dataframe on its own, since compact data types
+    depend on the values of each column."""
+
+    def _coerce(self, data_container: PandasObject) -> PandasObject:
+        if isinstance(data_container, pd.DataFrame):
+            return data_container.transform(lambda col: coerce(self, col))
+        return coerce(self, data_container)
+
+    return _coerce
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class CompactInt(DataType):
+    """Integer data type that coerces data to the smallest integer type that
+    fits its values, to reduce memory usage while validating.
+
+    Data with null values is coerced to the smallest pandas nullable integer
+    type, e.g. :class:`~pandera.engines.pandas_engine.INT8`. Validation
+    accepts data of any integer type.
+    """
+
+    type: None = dataclasses.field(default=None, init=False)
+    unsigned: bool = False
+    """Whether to use unsigned types for data without negative values."""
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, unsigned: bool = False
+    ) -> None:
+        object.__setattr__(self, "unsigned", unsigned)
+
+    @_compact_transform
+    def coerce(self, data_container: PandasObject) -> PandasObject:
+        nullable = bool(data_container.isna().any())
+        coerced = Engine.dtype("Int64" if nullable else "int64").coerce(
+            data_container
+        )
+        if coerced.isna().all():
+            return coerced
+        low, high = coerced.min(), coerced.max()
+        prefix = "u" if self.unsigned and low >= 0 else ""
+        for bit_width in (8, 16, 32, 64):
+            info = np.iinfo(f"{prefix}int{bit_width}")
+            if info.min <= low and high <= info.max:
+                break
+        return Engine.dtype(
+            f"{prefix.upper()}Int{bit_width}"
+            if nullable
+            else f"{prefix}int{bit_width}"
+        ).coerce(coerced)
+
+    def check(self, pandera_dtype: dtypes.DataType) -> bool:
+        try:
+            pandera_dtype = Engine.dtype(pandera_dtype)
+        except TypeError:
+            return False
+        return dtypes.is_int(pandera_dtype)
+
+    def __str__(self) -> str:
+        return f"CompactInt(unsigned={self.unsigned})"
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class CompactFloat(DataType):
+    """Float data type that coerces data to ``float32`` if its values are
+    equal in ``float32`` and ``float64`` within a relative tolerance, and
+    to ``float64`` otherwise, to reduce memory usage while validating.
+
+    Validation accepts data of any float type.
+    """
+
+    type: None = dataclasses.field(default=None, init=False)
+    rtol: float = 0.0
+    """Relative tolerance of the values in ``float32``. By default, data is
+    only coerced to ``float32`` if it doesn't lose precision."""
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, rtol: float = 0.0
+    ) -> None:
+        object.__setattr__(self, "rtol", rtol)
+
+    @_compact_transform
+    def coerce(self, data_container: PandasObject) -> PandasObject:
+        coerced = Engine.dtype("float64").coerce(data_container)
+        downcast = coerced.astype("float32")
+        with np.errstate(invalid="ignore", over="ignore"):
+            lossless = np.allclose(
+                downcast.to_numpy(),
+                coerced.to_numpy(),
+                rtol=self.rtol,
+                atol=0.0,
+                equal_nan=True,
+            )
+        return downcast if lossless else coerced
+
+    def check(self, pandera_dtype: dtypes.DataType) -> bool:
+        try:
+            pandera_dtype = Engine.dtype(pandera_dtype)
+        except TypeError:
+            return False
+        return dtypes.is_float(pandera_dtype)
+
+    def __str__(self) -> str:
+        return f"CompactFloat(rtol={self.rtol})"
+
+
+@Engine.register_dtype
+@immutable(init=True)
+class CompactCategory(DataType):
+    """Data type that coerces data to a categorical if it has few distinct
+    values compared to its length, to reduce memory usage while validating.
+
+    Data is first coerced to the data type of its values. Validation accepts
+    data of that type and categoricals whose categories are of that type.
+    """
+
+    type: None = dataclasses.field(default=None, init=False)
+    dtype: Any = str
+    """Data type of the values."""
+    max_cardinality: float = 0.5
+    """Data is coerced to a categorical if its number of distinct values is
+    less than this ratio of its length."""
+
+    def __init__(  # pylint:disable=super-init-not-called
+        self, dtype: Any = str, max_cardinality: float = 0.5
+    ) -> None:
+        object.__setattr__(self, "dtype", dtype)
+        object.__setattr__(self, "max_cardinality", max_cardinality)
+
+    @_compact_transform
+    def coerce(self, data_container: PandasObject) -> PandasObject:
+        values_dtype = Engine.dtype(self.dtype)
+        if isinstance(data_container.dtype, pd.CategoricalDtype) and (
+            values_dtype.check(
+                Engine.dtype(data_container.dtype.categories.dtype)
+            )
+        ):
+            return data_container
+        coerced = values_dtype.coerce(data_container)
+        if coerced.nunique() < self.max_cardinality * len(coerced):
+            return coerced.astype("category")
+        return coerced
+
+    def check(self, pandera_dtype: dtypes.DataType) -> bool:
+        try:
+            pandera_dtype = Engine.dtype(pandera_dtype)
+        except TypeError:
+            return False
+        values_dtype = Engine.dtype(self.dtype)
+        if isinstance(pandera_dtype, Category):
+            return values_dtype.check(
+                Engine.dtype(pandera_dtype.type.categories.dtype)
+            )
+        return values_dtype.check(pandera_dtype)
+
+    def __str__(self) -> str:
+        return (
+            f"CompactCategory(dtype={Engine.dtype(self.dtype)}, "
+            f"max_cardinality={self.max_cardinality})"
+        )
+
+
 class PandasDtype(Enum):
     # pylint: disable=line-too-long,invalid-name
     """Enumerate all valid pandas data types.
@@ -1,7 +1,7 @@
 """Engine module utilities."""
 
 import itertools
-from typing import Any, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -10,53 +10,193 @@ from .. import check_utils
 from .type_aliases import PandasObject
 
 
-def numpy_pandas_coercible(series: pd.Series, type_: Any) -> pd.Series:
-    """Checks whether a series is coercible with respect to a type.
+def _coercible(series: pd.Series, type_: Any) -> bool:
+    try:
+        series.astype(type_)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+
+def _bisect_coercion_failures(
+    series: pd.Series,
+    type_: Any,
+    coercible: Callable[[pd.Series, Any], bool] = _coercible,
+) -> np.ndarray:
+    """Positions of the values of a series that aren't coercible to a type.
 
     Bisects the series until all the failure cases are found.
     """
-
-    def _bisect(series):
-        assert (
-            series.shape[0] >= 2
-        ), "cannot bisect a pandas Series of length < 2"
-        bisect_index = series.shape[0] // 2
-        return [series.iloc[:bisect_index], series.iloc[bisect_index:]]
-
-    def _coercible(series):
-        try:
-            series.astype(type_)
-            return True
-        except (ValueError, TypeError):
-            return False
-
-    search_list = [series] if series.size == 1 else _bisect(series)
-    failure_index = []
+    search_list = [np.arange(len(series))]
+    failure_positions = []
     while search_list:
         candidates = []
-        for _series in search_list:
-            if _series.shape[0] == 1 and not _coercible(_series):
+        for positions in search_list:
+            if coercible(series.iloc[positions], type_):
+                continue
+            if len(positions) == 1:
                 # if series is reduced to a single value and isn't coercible,
-                # keep track of its index value.
-                failure_index.append(_series.index[0])
-            elif not _coercible(_series):
+                # keep track of its position.
+                failure_positions.append(positions[0])
+            else:
                 # if the series length > 1, add it to the candidates list
                 # to be further bisected
-                candidates.append(_series)
+                candidates.append(positions)
 
-        # the new search list is a flat list of bisected series views.
+        # the new search list is a flat list of bisected positions.
         search_list = list(
-            itertools.chain.from_iterable([_bisect(c) for c in candidates])
+            itertools.chain.from_iterable(
+                np.array_split(c, [len(c) // 2]) for c in candidates
+            )
         )
-    return pd.Series(~series.index.isin(failure_index), index=series.index)
+    return np.array(failure_positions, dtype=np.int64)
 
 
-def numpy_pandas_coerce_failure_cases(
-    data_container: Union[PandasObject, np.ndarray], type_: Any
-) -> PandasObject:
+def _numeric_failure_candidates(
+    series: pd.Series, dtype: Any
+) -> Optional[np.ndarray]:
+    """Boolean mask of the values of a series that are likely not coercible
+    to a numeric data type, or None if there's no vectorized conversion for
+    the data type of the series."""
+    if pd.api.types.is_complex_dtype(series.dtype):
+        return None
+    source_is_numeric = isinstance(series.dtype, np.dtype) and (
+        series.dtype.kind in "biuf"
+    )
+    numeric = (
+        series.to_numpy()
+        if source_is_numeric
+        else pd.to_numeric(series, errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
+    ).astype(float, copy=False)
+    notna = series.notna().to_numpy()
+    if not pd.api.types.is_integer_dtype(dtype):
+        # null and infinite values are coercible to floats
+        return np.isnan(numeric) & notna
+    finite = np.isfinite(numeric)
+    if isinstance(dtype, np.dtype) and source_is_numeric:
+        # numpy integers truncate floats, but don't accept null or infinite
+        # values
+        return ~finite
+    integral = np.zeros(len(numeric), dtype=bool)
+    np.equal(numeric, np.trunc(numeric), out=integral, where=finite)
+    info = np.iinfo(getattr(dtype, "numpy_dtype", dtype))
+    candidates = ~integral | (numeric < info.min) | (numeric > info.max)
+    if not isinstance(dtype, np.dtype):
+        # null values are coercible to nullable integers
+        candidates &= notna
+    return candidates
+
+
+def _coercion_failure_candidates(
+    series: pd.Series, type_: Any
+) -> Optional[np.ndarray]:
+    """Boolean mask of the values of a series that are likely not coercible
+    to a type, computed in a single vectorized pass.
+
+    Returns None if there's no vectorized conversion for the data types of
+    the series and the type.
+    """
+    try:
+        dtype = pd.api.types.pandas_dtype(type_)
+    except TypeError:
+        return None
+
+    try:
+        if pd.api.types.is_integer_dtype(dtype) or (
+            pd.api.types.is_float_dtype(dtype)
+            or pd.api.types.is_complex_dtype(dtype)
+        ):
+            return _numeric_failure_candidates(series, dtype)
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            converted = pd.to_datetime(series, errors="coerce")
+        elif pd.api.types.is_timedelta64_dtype(dtype):
+            converted = pd.to_timedelta(series, errors="coerce")
+        else:
+            return None
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return (converted.isna() & series.notna()).to_numpy()
+
+
+def bisect_coercible(
+    series: pd.Series,
+    type_: Any,
+    coercible: Callable[[pd.Series, Any], bool] = _coercible,
+) -> pd.Series:
+    """Checks whether a series is coercible with respect to a type, by
+    bisecting the series until all the failure cases are found.
+
+    :param coercible: function returning whether all the values of a series
+        are coercible to the type.
+    """
+    failed = np.zeros(len(series), dtype=bool)
+    failed[_bisect_coercion_failures(series, type_, coercible)] = True
+    return pd.Series(~failed, index=series.index)
+
+
+def numpy_pandas_coercible(series: pd.Series, type_: Any) -> pd.Series:
+    """Checks whether a series is coercible with respect to a type.
+
+    Values that are likely not coercible are found with a vectorized
+    conversion to the type, like :func:`pandas.to_numeric` or
+    :func:`pandas.to_datetime`, and are confirmed one value at a time. The
+    other values are coerced at once. If they aren't coercible, or if the
+    type has no vectorized conversion, the series is bisected until all the
+    failure cases are found.
+    """
+    candidates = _coercion_failure_candidates(series, type_)
+    if candidates is None:
+        return bisect_coercible(series, type_)
+    failed = np.zeros(len(series), dtype=bool)
+
+    candidate_positions = np.flatnonzero(candidates)
+    if pd.api.types.infer_dtype(
+        series.iloc[candidate_positions], skipna=False
+    ) in {"string", "empty"}:
+        # strings that are equal are coerced the same way
+        codes, uniques = pd.factorize(series.iloc[candidate_positions])
+        failed[candidate_positions] = ~np.array(
+            [
+                _coercible(pd.Series([value], dtype=series.dtype), type_)
+                for value in uniques
+            ],
+            dtype=bool,
+        )[codes]
+    else:
+        for position in candidate_positions:
+            failed[position] = not _coercible(
+                series.iloc[position : position + 1], type_
+            )
+
+    other_positions = np.flatnonzero(np.logical_not(candidates))
+    if other_positions.size and not _coercible(
+        series.iloc[other_positions], type_
+    ):
+        # the vectorized conversion missed some failure cases
+        failed[
+            other_positions[
+                _bisect_coercion_failures(series.iloc[other_positions], type_)
+            ]
+        ] = True
+    return pd.Series(~failed, index=series.index)
+
+
+def numpy_pandas_coerce_failures(
+    data_container: Union[PandasObject, np.ndarray],
+    type_: Any,
+    coercible: Callable[[pd.Series, Any], pd.Series] = numpy_pandas_coercible,
+) -> Tuple[pd.DataFrame, PandasObject]:
     """
     Get the failure cases resulting from trying to coerce a pandas/numpy object
-    into particular data type.
+    into particular data type, and the boolean output that is False for the
+    values that aren't coercible.
+
+    The boolean output of numpy arrays and indexes has a default index, so
+    that failure cases are located by position.
+
+    :param coercible: function returning the boolean output of a series.
     """
     # pylint: disable=import-outside-toplevel,cyclic-import
     from pandera import error_formatters
@@ -71,12 +211,14 @@ def numpy_pandas_coerce_failure_cases(
                 "only numpy arrays of 1 or 2 dimensions are supported"
             )
 
+    is_index = False
     if isinstance(data_container, pd.Index):
+        is_index = True
         data_container = data_container.to_series()
 
     if isinstance(data_container, pd.DataFrame):
         check_output = data_container.apply(
-            numpy_pandas_coercible,
+            coercible,
             args=(type_,),
         )
         _, failure_cases = check_utils.prepare_dataframe_check_output(
@@ -85,7 +227,7 @@ def numpy_pandas_coerce_failure_cases(
             ignore_na=False,
         )
     elif isinstance(data_container, pd.Series):
-        check_output = numpy_pandas_coercible(data_container, type_)
+        check_output = coercible(data_container, type_)
         _, failure_cases = check_utils.prepare_series_check_output(
             data_container,
             check_output,
@@ -96,6 +238,19 @@ def numpy_pandas_coerce_failure_cases(
             f"type of data_container {type(data_container)} not understood. "
             "Must be a pandas Series, Index, or DataFrame."
         )
-    return error_formatters.reshape_failure_cases(
-        failure_cases, ignore_na=False
+    if is_index:
+        check_output = check_output.reset_index(drop=True)
+    return (
+        error_formatters.reshape_failure_cases(failure_cases, ignore_na=False),
+        check_output,
     )
+
+
+def numpy_pandas_coerce_failure_cases(
+    data_container: Union[PandasObject, np.ndarray], type_: Any
+) -> PandasObject:
+    """
+    Get the failure cases resulting from trying to coerce a pandas/numpy object
+    into particular data type.
+    """
+    return numpy_pandas_coerce_failures(data_container, type_)[0]
@@ -81,11 +81,7 @@ def reshape_failure_cases(
     ):
         reshaped_failure_cases = (
             failure_cases.rename_axis("column", axis=1)
-            .assign(
-                index=lambda df: (
-                    df.index.to_frame().apply(tuple, axis=1).astype(str)
-                )
-            )
+            .assign(index=lambda df: df.index.to_flat_index().map(str))
             .set_index("index", drop=True)
             .unstack()
             .rename("failure_case")
@@ -97,11 +93,9 @@ def reshape_failure_cases(
         reshaped_failure_cases = (
             failure_cases.rename("failure_case")
             .to_frame()
-            .assign(
-                index=lambda df: (
-                    df.index.to_frame().apply(tuple, axis=1).astype(str)
-                )
-            )[["failure_case", "index"]]
+            .assign(index=lambda df: df.index.to_flat_index().map(str))[
+                ["failure_case", "index"]
+            ]
             .reset_index(drop=True)
         )
     elif isinstance(failure_cases, pd.DataFrame):
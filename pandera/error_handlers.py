@@ -2,7 +2,9 @@
 
 from typing import Dict, List, Union
 
+from . import constants
 from .errors import SchemaError
+from .failure_cases import FailureCaseStore
 
 
 class SchemaErrorHandler:
@@ -16,6 +18,9 @@ class SchemaErrorHandler:
         """
         self._lazy = lazy
         self._collected_errors = []  # type: ignore
+        self._failure_case_store = FailureCaseStore(
+            constants.MAX_FAILURE_CASE_BYTES
+        )
 
     def collect_error(
         self,
@@ -36,6 +41,7 @@ class SchemaErrorHandler:
         # SchemaError collected.
         del schema_error.data
         schema_error.data = None
+        self._failure_case_store.add(schema_error)
 
         self._collected_errors.append(
             {
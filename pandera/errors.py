@@ -1,7 +1,7 @@
 """pandera-specific errors."""
 
 from collections import defaultdict, namedtuple
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -20,9 +20,11 @@ ErrorData = namedtuple(
 class ParserError(Exception):
     """Raised when data cannot be parsed from the raw into its clean form."""
 
-    def __init__(self, message, failure_cases):
+    def __init__(self, message, failure_cases, check_output=None):
         super().__init__(message)
         self.failure_cases = failure_cases
+        # boolean output that is False for the values that failed parsing
+        self.check_output = check_output
 
 
 class SchemaInitError(Exception):
@@ -34,26 +36,65 @@ class SchemaDefinitionError(Exception):
 
 
 class SchemaError(Exception):
-    """Raised when object does not pass schema validation constraints."""
+    """Raised when object does not pass schema validation constraints.
+
+    The error message and failure cases can be passed as functions, which
+    are called when they are first accessed, so that errors that are caught
+    and discarded don't pay for formatting them.
+    """
 
     def __init__(
         self,
         schema,
         data,
-        message,
+        message: Union[str, Callable[[], str]],
         failure_cases=None,
         check=None,
         check_index=None,
         check_output=None,
     ):
-        super().__init__(message)
+        super().__init__()
+        self._message = message
         self.schema = schema
         self.data = data
+        self._failure_case_frame: Optional[pd.DataFrame] = None
         self.failure_cases = failure_cases
         self.check = check
         self.check_index = check_index
         self.check_output = check_output
 
+    @property
+    def message(self) -> str:
+        """Error message."""
+        if callable(self._message):
+            self._message = self._message()
+        return self._message
+
+    @property
+    def args(self):  # type: ignore[override]
+        """Exception arguments, holding the formatted error message."""
+        return (self.message,)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    @property
+    def failure_cases(self) -> Optional[pd.DataFrame]:
+        """Failure cases of the error, built on first access."""
+        if not callable(self._failure_cases):
+            return self._failure_cases
+        if self._failure_case_frame is None:
+            self._failure_case_frame = self._failure_cases()
+        return self._failure_case_frame
+
+    @failure_cases.setter
+    def failure_cases(self, failure_cases) -> None:
+        self._failure_cases = failure_cases
+        self._failure_case_frame = None
+
 
 class BaseStrategyOnlyError(Exception):
     """Custom error for reporting strategies that must be base strategies."""
@@ -76,6 +117,17 @@ except SchemaErrors as err:
 """
 
 
+def _check_identifier(check) -> Optional[str]:
+    """Identify the check of a schema error in failure cases."""
+    if check is None or isinstance(check, str):
+        return check
+    if check.error is not None:
+        return check.error
+    if check.name is not None:
+        return check.name
+    return str(check)
+
+
 class SchemaErrors(Exception):
     """Raised when multiple schema are lazily collected into one error."""
 
@@ -84,15 +136,62 @@ class SchemaErrors(Exception):
         schema_errors: List[Dict[str, Any]],
         data: Union[pd.Series, pd.DataFrame],
     ):
-        error_counts, failure_cases = self._parse_schema_errors(schema_errors)
-        super().__init__(self._message(error_counts, failure_cases))
+        super().__init__()
         self.schema_errors = schema_errors
-        self.error_counts = error_counts
-        self.failure_cases = failure_cases
+        self.error_counts = self._count_errors(schema_errors)
         self.data = data
+        self._failure_cases: Optional[pd.DataFrame] = None
+        self._message: Optional[str] = None
+
+    @property
+    def failure_cases(self) -> pd.DataFrame:
+        """Dataframe of the failure cases of all errors.
+
+        The dataframe is built and cached on first access.
+        """
+        if self._failure_cases is None:
+            self._failure_cases = self._parse_schema_errors(self.schema_errors)
+        return self._failure_cases
+
+    @property
+    def message(self) -> str:
+        """Error message summarizing the errors, formatted on first
+        access."""
+        if self._message is None:
+            self._message = self._format_message(
+                self.error_counts,
+                self.failure_cases,
+                self.n_dropped_failure_cases,
+            )
+        return self._message
+
+    @property
+    def n_dropped_failure_cases(self) -> int:
+        """Number of failure cases dropped to stay within the memory limit
+        set by ``pandera.constants.MAX_FAILURE_CASE_BYTES``."""
+        stores = {}
+        for schema_error_dict in self.schema_errors:
+            # pylint: disable=protected-access
+            store = getattr(
+                schema_error_dict["error"]._failure_cases, "store", None
+            )
+            if store is not None:
+                stores[id(store)] = store
+        return sum(store.n_dropped for store in stores.values())
+
+    @property
+    def args(self):  # type: ignore[override]
+        """Exception arguments, holding the formatted error message."""
+        return (self.message,)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
 
     @staticmethod
-    def _message(error_counts, schema_errors):
+    def _format_message(error_counts, schema_errors, n_dropped=0):
         """Format error message."""
         msg = (
             f"A total of {sum(error_counts.values())} "
@@ -103,6 +202,11 @@ class SchemaErrors(Exception):
         msg += "\n------------\n"
         for k, v in error_counts.items():
             msg += f"- {k}: {v}\n"
+        if n_dropped:
+            msg += (
+                f"\n{n_dropped} failure cases were dropped to stay within "
+                "the memory limit of failure cases.\n"
+            )
 
         def failure_cases(x):
             return list(set(x))
@@ -126,9 +230,18 @@ class SchemaErrors(Exception):
         return msg
 
     @staticmethod
-    def _parse_schema_errors(schema_errors: List[Dict[str, Any]]):
-        """Parse schema error dicts to produce data for error message."""
+    def _count_errors(schema_errors: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count schema errors by reason code."""
         error_counts = defaultdict(int)  # type: ignore
+        for schema_error_dict in schema_errors:
+            error_counts[schema_error_dict["reason_code"]] += 1
+        return error_counts
+
+    @staticmethod
+    def _parse_schema_errors(
+        schema_errors: List[Dict[str, Any]],
+    ) -> pd.DataFrame:
+        """Parse schema error dicts to produce the failure cases dataframe."""
         check_failure_cases = []
 
         column_order = [
@@ -144,18 +257,7 @@ class SchemaErrors(Exception):
             reason_code = schema_error_dict["reason_code"]
             err = schema_error_dict["error"]
 
-            error_counts[reason_code] += 1
-            check_identifier = (
-                None
-                if err.check is None
-                else err.check
-                if isinstance(err.check, str)
-                else err.check.error
-                if err.check.error is not None
-                else err.check.name
-                if err.check.name is not None
-                else str(err.check)
-            )
+            check_identifier = _check_identifier(err.check)
 
             if err.failure_cases is not None:
                 if "column" in err.failure_cases:
@@ -188,4 +290,4 @@ class SchemaErrors(Exception):
             .sort_values("schema_context", ascending=False)
             .drop_duplicates()
         )
-        return error_counts, failure_cases
+        return failure_cases
@@ -0,0 +1,346 @@
+"""Expression strings for dataframe-level checks.
+
+Expressions like ``"a > b * 2 & c.notna()"`` are parsed once into a syntax
+tree that references columns by name. Following the semantics of
+:meth:`pandas.DataFrame.eval`, ``&`` and ``|`` have a lower precedence than
+comparisons.
+
+Expressions are evaluated with ``numexpr`` when it's installed, otherwise
+with numpy one block of rows at a time, so that the temporary arrays of each
+block stay in the CPU cache. Data that numpy can't evaluate, like strings
+or extension arrays, falls back to :meth:`pandas.DataFrame.eval`. In all
+cases, the results are the same as with pandas, including for divisions of
+integers by zero.
+"""
+
+import ast
+import io
+import operator
+import sys
+import tokenize
+from functools import reduce
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import numpy as np
+import pandas as pd
+
+from .vectorized_checks import FUSED_BLOCK_SIZE
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    HAS_NUMEXPR = False
+else:
+    HAS_NUMEXPR = True
+
+# numpy dtype kinds of boolean and numeric arrays
+EVALUATED_KINDS = "biuf"
+
+
+def _pandas_division(divide: Callable) -> Callable:
+    """Make the division of integers by zero give the same results as
+    pandas, e.g. ``1 % 0`` is NaN and ``1 // 0`` is infinite, instead of 0
+    in numpy."""
+
+    def _divide(left: Any, right: Any) -> Any:
+        zero = np.asarray(right) == 0
+        if not (
+            np.asarray(left).dtype.kind in "biu"
+            and np.asarray(right).dtype.kind in "biu"
+            and zero.any()
+        ):
+            return divide(left, right)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                zero,
+                divide(np.asarray(left, dtype=float), 0.0),
+                divide(left, np.where(zero, 1, right)),
+            )
+
+    return _divide
+
+
+_BINARY_OPERATORS: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: _pandas_division(operator.floordiv),
+    ast.Mod: _pandas_division(operator.mod),
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS: Dict[type, Callable] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Invert: operator.invert,
+    ast.Not: operator.invert,
+}
+
+_COMPARISON_OPERATORS: Dict[type, Callable] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_BOOLEAN_OPERATORS: Dict[type, Callable] = {
+    ast.And: operator.and_,
+    ast.Or: operator.or_,
+}
+
+# literals are parsed as ast.Num, ast.Str and ast.NameConstant before
+# python 3.8
+if sys.version_info[:2] >= (3, 8):
+    _LITERALS: Tuple[type, ...] = (ast.Constant,)
+else:  # pragma: no cover
+    _LITERALS = (ast.Constant, ast.Num, ast.Str, ast.NameConstant)
+
+# keywords that replace the operators with the same precedence in pandas eval
+_BOOLEAN_KEYWORDS = {"&": "and", "|": "or"}
+
+_NULL_METHODS: Dict[str, Callable] = {
+    "isna": pd.isna,
+    "isnull": pd.isna,
+    "notna": pd.notna,
+    "notnull": pd.notna,
+}
+
+# operators that numexpr supports, with their symbols. The modulo of
+# integers by zero is 0 in numexpr, so it's evaluated with numpy.
+_NUMEXPR_SYMBOLS: Dict[type, str] = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Pow: "**",
+    ast.USub: "-",
+    ast.UAdd: "+",
+    ast.Invert: "~",
+    ast.Not: "~",
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.And: "&",
+    ast.Or: "|",
+}
+
+
+def _literal_value(node: ast.AST) -> Any:
+    """Value of a literal node."""
+    for field in ("value", "n", "s"):
+        if hasattr(node, field):
+            return getattr(node, field)
+    raise TypeError(f"{type(node).__name__} node is not a literal")
+
+
+def _parse(expr: str) -> ast.Expression:
+    """Parse an expression string, giving ``&`` and ``|`` the precedence of
+    ``and`` and ``or``."""
+    try:
+        tokens = [
+            (
+                (tokenize.NAME, _BOOLEAN_KEYWORDS[token.string])
+                if token.type == tokenize.OP
+                and token.string in _BOOLEAN_KEYWORDS
+                else (token.type, token.string)
+            )
+            for token in tokenize.generate_tokens(io.StringIO(expr).readline)
+        ]
+        tree = ast.parse(tokenize.untokenize(tokens).strip(), mode="eval")
+    except (tokenize.TokenError, SyntaxError) as exc:
+        raise ValueError(f"invalid expression '{expr}': {exc}") from exc
+    return cast(ast.Expression, tree)
+
+
+def _children(node: ast.AST, expr: str) -> Sequence[ast.AST]:
+    """Operands of an expression node.
+
+    :raises ValueError: if the node uses unsupported syntax.
+    """
+    if isinstance(node, ast.BoolOp):
+        return node.values
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return [node.left, node.right]
+    if isinstance(node, ast.UnaryOp):
+        return [node.operand]
+    if isinstance(node, ast.Compare) and all(
+        type(op) in _COMPARISON_OPERATORS for op in node.ops
+    ):
+        return [node.left, *node.comparators]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in _NULL_METHODS
+        and not node.args
+        and not node.keywords
+    ):
+        return [node.func.value]
+    if isinstance(node, (ast.Name, *_LITERALS)):
+        return []
+    raise ValueError(
+        f"unsupported syntax ({type(node).__name__}) in expression '{expr}'"
+    )
+
+
+def _validate(node: ast.AST, expr: str) -> None:
+    """Validate that an expression only uses supported syntax."""
+    for child in _children(node, expr):
+        _validate(child, expr)
+
+
+def _apply(node: ast.AST, operands: List[Any]) -> Any:
+    """Apply the operation of an expression node to its evaluated
+    operands."""
+    if isinstance(node, ast.BoolOp):
+        return reduce(_BOOLEAN_OPERATORS[type(node.op)], operands)
+    if isinstance(node, ast.BinOp):
+        return _BINARY_OPERATORS[type(node.op)](*operands)
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPERATORS[type(node.op)](*operands)
+    if isinstance(node, ast.Compare):
+        return reduce(
+            operator.and_,
+            (
+                _COMPARISON_OPERATORS[type(op)](left, right)
+                for op, left, right in zip(node.ops, operands, operands[1:])
+            ),
+        )
+    return _NULL_METHODS[node.func.attr](*operands)  # type: ignore
+
+
+def _evaluate(node: ast.AST, namespace: Mapping[str, Any]) -> Any:
+    """Evaluate an expression on arrays or pandas objects."""
+    if isinstance(node, ast.Name):
+        return namespace[node.id]
+    if isinstance(node, _LITERALS):
+        return _literal_value(node)
+    return _apply(
+        node,
+        [_evaluate(child, namespace) for child in _children(node, "")],
+    )
+
+
+def _numexpr_format(node: ast.AST, operands: List[str]) -> str:
+    """Format an expression node with its operands in numexpr syntax."""
+    if isinstance(node, ast.BoolOp):
+        symbol = _NUMEXPR_SYMBOLS[type(node.op)]
+        return f" {symbol} ".join(f"({operand})" for operand in operands)
+    if isinstance(node, ast.UnaryOp):
+        return f"{_NUMEXPR_SYMBOLS[type(node.op)]}({operands[0]})"
+    if isinstance(node, ast.Compare):
+        return " & ".join(
+            f"(({left}) {_NUMEXPR_SYMBOLS[type(op)]} ({right}))"
+            for op, left, right in zip(node.ops, operands, operands[1:])
+        )
+    symbol = _NUMEXPR_SYMBOLS[type(node.op)]  # type: ignore
+    left, right = operands
+    return f"({left}) {symbol} ({right})"
+
+
+def _numexpr_source(node: ast.AST) -> Optional[str]:
+    """Translate an expression into numexpr syntax, or None if numexpr
+    doesn't support the expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, _LITERALS):
+        value = _literal_value(node)
+        return repr(value) if isinstance(value, (bool, int, float)) else None
+    if isinstance(node, ast.Call) or (
+        isinstance(node, ast.BinOp) and type(node.op) not in _NUMEXPR_SYMBOLS
+    ):
+        return None
+    operands = [_numexpr_source(child) for child in _children(node, "")]
+    if None in operands:
+        return None
+    return _numexpr_format(node, cast(List[str], operands))
+
+
+class DataFrameExpression:
+    """Boolean expression on the columns of a dataframe."""
+
+    def __init__(self, expr: str) -> None:
+        """Parse an expression string.
+
+        :param expr: expression referencing columns by name, e.g.
+            ``"a > b * 2 & c.notna()"``.
+        :raises ValueError: if the expression is invalid or uses unsupported
+            syntax.
+        """
+        self.expr = expr
+        self._tree = _parse(expr)
+        _validate(self._tree.body, expr)
+        self.columns: FrozenSet[str] = frozenset(
+            node.id
+            for node in ast.walk(self._tree)
+            if isinstance(node, ast.Name)
+        )
+        self._numexpr_source = (
+            _numexpr_source(self._tree.body) if HAS_NUMEXPR else None
+        )
+
+    def evaluate(
+        self, frame: pd.DataFrame, block_size: int = FUSED_BLOCK_SIZE
+    ) -> np.ndarray:
+        """Evaluate the expression on a dataframe.
+
+        :param frame: dataframe with the columns referenced by the
+            expression.
+        :param block_size: number of rows evaluated at a time by numpy.
+        :returns: boolean array that is True for the rows that satisfy the
+            expression.
+        """
+        arrays = {column: frame[column].values for column in self.columns}
+        if not all(
+            isinstance(array, np.ndarray)
+            and array.dtype.kind in EVALUATED_KINDS
+            for array in arrays.values()
+        ):
+            result = frame.eval(self.expr, engine="python")
+            if isinstance(result, pd.Series):
+                # comparisons with missing values of nullable data types
+                # are missing, so they don't satisfy the expression
+                return result.fillna(False).to_numpy(dtype=bool)
+            return np.full(len(frame), bool(result))
+
+        if self._numexpr_source is not None:
+            return np.broadcast_to(
+                numexpr.evaluate(self._numexpr_source, local_dict=arrays),
+                len(frame),
+            ).astype(bool)
+
+        passed = np.empty(len(frame), dtype=bool)
+        for start in range(0, len(frame), block_size):
+            stop = start + block_size
+            block = {
+                column: array[start:stop] for column, array in arrays.items()
+            }
+            passed[start:stop] = _evaluate(self._tree.body, block)
+        return passed
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.expr!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DataFrameExpression):
+            return NotImplemented
+        return self.expr == other.expr
+
+    def __hash__(self) -> int:
+        return hash(self.expr)
@@ -0,0 +1,530 @@
+"""Columnar storage of the failure cases of schema errors.
+
+Lazy validation collects the failure cases of every failing check. Instead
+of keeping a long-format dataframe per check, failure cases are stored in
+numpy arrays: for each failure case, the code of its column, its position in
+the validated object, its failure value and its index label. Failure values
+and index labels with many repeated values are factorized into codes. The
+long-format dataframes are only built when they're accessed.
+
+The memory used by the failure cases of a validation is capped by
+:data:`pandera.constants.MAX_FAILURE_CASE_BYTES`, so that validating
+data where almost every value is invalid doesn't run out of memory.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from .check_utils import FAILURE_CASE_BYTES
+from .error_formatters import reshape_failure_cases
+
+# number of failure values sampled to decide whether to factorize them
+_CARDINALITY_SAMPLE_SIZE = 1000
+
+# columns of the long format of failure cases
+_LONG_FORMAT_COLUMNS = [
+    {"index", "failure_case"},
+    {"column", "index", "failure_case"},
+]
+
+
+class CheckFailureCases:
+    """Failure cases of a check, as returned by the check.
+
+    Calling the object reshapes the failure cases into the long format of
+    the failure cases of schema errors.
+    """
+
+    def __init__(
+        self,
+        failure_cases: Union[pd.Series, pd.DataFrame],
+        ignore_na: bool,
+        check_output: Any = None,
+        checked_object: Any = None,
+        n_failure_cases: Optional[int] = None,
+    ) -> None:
+        """Initialize the failure cases of a check.
+
+        :param failure_cases: failure cases returned by the check.
+        :param ignore_na: whether the check ignores null values.
+        :param check_output: boolean output of the check, used to find the
+            positions of the failure cases in the checked object.
+        :param checked_object: object validated by the check.
+        :param n_failure_cases: number of failure cases reported by the
+            check. If None, all failure cases are reported.
+        """
+        self.failure_cases = failure_cases
+        self.ignore_na = ignore_na
+        self.check_output = check_output
+        self.checked_object = checked_object
+        self.n_failure_cases = n_failure_cases
+
+    def _failed(self) -> Optional[np.ndarray]:
+        """Boolean array that is True for the failing rows of the checked
+        object, or None if the output of the check isn't aligned with
+        them."""
+        check_output = self.check_output
+        checked_object = self.checked_object
+        if (
+            not isinstance(check_output, pd.Series)
+            or not isinstance(checked_object, (pd.Series, pd.DataFrame))
+            or len(check_output) != len(checked_object)
+            or check_output.dtype != bool
+            or not (
+                check_output.index is checked_object.index
+                or check_output.index.equals(checked_object.index)
+            )
+        ):
+            return None
+        return ~check_output.to_numpy()
+
+    def positions(self) -> Optional[np.ndarray]:
+        """Positions of the failure cases in the checked object, or None if
+        they can't be found from the output of the check."""
+        failed = self._failed()
+        if failed is None:
+            return None
+        # checks report the first failure cases in the order of the rows
+        return np.flatnonzero(failed)[: len(self.failure_cases)]
+
+    def n_not_built(self) -> int:
+        """Number of failure cases that weren't built by the check to stay
+        within the memory limit of failure cases."""
+        failed = self._failed()
+        if failed is None:
+            return 0
+        n_failed = int(np.count_nonzero(failed))
+        if self.n_failure_cases is not None:
+            n_failed = min(n_failed, self.n_failure_cases)
+        return max(n_failed - len(self.failure_cases), 0)
+
+    def __call__(self) -> pd.DataFrame:
+        return reshape_failure_cases(self.failure_cases, self.ignore_na)
+
+
+def _as_array(values: Union[pd.Series, pd.Index]):
+    """Array of the values of a pandas object, keeping extension types."""
+    if pd.api.types.is_extension_array_dtype(values.dtype):
+        return values.array
+    return values.to_numpy()
+
+
+def _encode(values) -> Tuple[Optional[np.ndarray], Any]:
+    """Encode values as codes into a table of unique values.
+
+    Values are only factorized when a sample of them has many repeated
+    values, otherwise the codes are None and the table holds the values.
+    Only numpy arrays of primitive types are factorized: objects that compare
+    equal but have different types, like ``1`` and ``True``, would be
+    merged.
+    """
+    if (
+        not isinstance(values, np.ndarray)
+        or values.dtype.kind not in "biufcmM"
+        or not values.size
+    ):
+        return None, values
+    sample = values[:: max(len(values) // _CARDINALITY_SAMPLE_SIZE, 1)]
+    if len(pd.unique(sample)) > len(sample) // 2:
+        return None, values
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32, copy=False), uniques
+
+
+def _head(codes: Optional[np.ndarray], table: Any, n_values: int):
+    """Codes and table of the first ``n_values`` values of an encoding."""
+    if codes is None:
+        return None, table[:n_values]
+    codes = codes[:n_values]
+    # values are encoded in the order in which they first occur, so the
+    # first codes of an encoding only reference the first unique values
+    return codes, table[: int(codes.max()) + 1 if codes.size else 0]
+
+
+def _decode(codes: Optional[np.ndarray], table: Any) -> Any:
+    """Decode values encoded by :func:`_encode`."""
+    if codes is None:
+        return table
+    return pd.api.extensions.take(table, codes, allow_fill=True)
+
+
+def _nbytes(values) -> int:
+    if values is None:
+        return 0
+    return getattr(values, "nbytes", 8 * len(values))
+
+
+class _Chunk(NamedTuple):
+    """Failure cases of one schema error."""
+
+    # columns of the long-format dataframe of the failure cases
+    frame_columns: Tuple[str, ...]
+    # a single code when all failure cases are in the column of the error
+    column_codes: np.ndarray
+    positions: np.ndarray
+    value_codes: Optional[np.ndarray]
+    values: Any
+    label_codes: Optional[np.ndarray]
+    labels: Any
+    n_dropped: int
+
+    @property
+    def has_column(self) -> bool:
+        """Whether the failure cases have a column."""
+        return "column" in self.frame_columns
+
+    @property
+    def n_cases(self) -> int:
+        """Number of stored failure cases."""
+        return len(self.positions)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the failure cases."""
+        return (
+            # the column code of all the failure cases of an error isn't
+            # counted, like the other attributes of the error
+            (self.column_codes.nbytes if self.has_column else 0)
+            + self.positions.nbytes
+            + _nbytes(self.value_codes)
+            + _nbytes(self.label_codes)
+            + _nbytes(self.values)
+            + _nbytes(self.labels)
+        )
+
+    def head(self, n_cases: int) -> "_Chunk":
+        """First failure cases of the chunk, counting the others as
+        dropped."""
+        value_codes, values = _head(self.value_codes, self.values, n_cases)
+        label_codes, labels = _head(self.label_codes, self.labels, n_cases)
+        return self._replace(  # pylint: disable=no-member
+            column_codes=(
+                self.column_codes[:n_cases]
+                if self.has_column
+                else self.column_codes
+            ),
+            positions=self.positions[:n_cases],
+            value_codes=value_codes,
+            values=values,
+            label_codes=label_codes,
+            labels=labels,
+            n_dropped=self.n_dropped + max(self.n_cases - n_cases, 0),
+        )
+
+
+def _failure_case_arrays(
+    error,
+) -> Optional[Tuple[Tuple[str, ...], Optional[List], Any, Any, Any]]:
+    """Arrays of the failure cases of a schema error.
+
+    :returns: the columns of the long-format dataframe of failure cases, the
+        column of each failure case if they have one, the positions of the
+        failure cases in the validated object if they're known, and their
+        failure values and index labels. None if the failure cases aren't in
+        the long format of failure cases.
+    """
+    # pylint: disable=protected-access
+    failure_cases = error._failure_cases
+    if (
+        isinstance(failure_cases, CheckFailureCases)
+        and isinstance(failure_cases.failure_cases, pd.Series)
+        and not isinstance(failure_cases.failure_cases.index, pd.MultiIndex)
+    ):
+        series = failure_cases.failure_cases
+        positions = failure_cases.positions()
+        if failure_cases.ignore_na:
+            notna = series.notna().to_numpy() & ~pd.isna(series.index)
+            series = series[notna]
+            if positions is not None:
+                positions = positions[notna]
+        return (
+            ("index", "failure_case"),
+            None,
+            positions,
+            _as_array(series),
+            _as_array(series.index),
+        )
+
+    if callable(failure_cases):
+        failure_cases = failure_cases()
+        error.failure_cases = failure_cases
+    if (
+        not isinstance(failure_cases, pd.DataFrame)
+        or set(failure_cases.columns) not in _LONG_FORMAT_COLUMNS
+    ):
+        return None
+    return (
+        tuple(failure_cases.columns),
+        (
+            failure_cases["column"].tolist()
+            if "column" in failure_cases
+            else None
+        ),
+        None,
+        _as_array(failure_cases["failure_case"]),
+        _as_array(failure_cases["index"]),
+    )
+
+
+class StoredFailureCases:  # pylint: disable=too-few-public-methods
+    """Failure cases of a schema error kept in a :class:`FailureCaseStore`.
+
+    Calling the object builds the long-format dataframe of failure cases.
+    """
+
+    def __init__(self, store: "FailureCaseStore", error_id: int) -> None:
+        self.store = store
+        self.error_id = error_id
+
+    def __call__(self) -> pd.DataFrame:
+        return self.store.error_failure_cases(self.error_id)
+
+
+class FailureCaseStore:
+    """Failure cases of schema errors, stored in numpy arrays.
+
+    Failure cases beyond the memory limit of the store are dropped, and
+    counted in :attr:`n_dropped`.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        """Initialize a store of failure cases.
+
+        :param max_bytes: maximum number of bytes used by the stored failure
+            cases. If None, the memory used isn't limited.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._columns: List[Hashable] = []
+        self._column_codes: Dict[Any, int] = {}
+        self._chunks: List[_Chunk] = []
+
+    def _column_code(self, column: Hashable) -> int:
+        # tuple column names of MultiIndex columns and nan are hashable
+        key = (type(column), column)
+        if key not in self._column_codes:
+            self._column_codes[key] = len(self._columns)
+            self._columns.append(column)
+        return self._column_codes[key]
+
+    @property
+    def n_dropped(self) -> int:
+        """Number of failure cases dropped to stay within the memory
+        limit."""
+        return sum(chunk.n_dropped for chunk in self._chunks)
+
+    def _capacity(self, case_bytes: int) -> Optional[int]:
+        """Number of failure cases that fit in the remaining memory."""
+        if self.max_bytes is None:
+            return None
+        return max(self.max_bytes - self.nbytes, 0) // case_bytes
+
+    def _n_fitting_cases(self, values: Any, labels: Any) -> int:
+        """Number of failure cases with some failure values and index labels
+        that fit in the remaining memory."""
+        capacity = self._capacity(
+            FAILURE_CASE_BYTES
+            + getattr(values.dtype, "itemsize", 8)
+            + getattr(labels.dtype, "itemsize", 8)
+        )
+        return len(values) if capacity is None else min(len(values), capacity)
+
+    def _copy_chunk(self, failure_cases: StoredFailureCases) -> _Chunk:
+        """Copy failure cases from another store, without decoding them."""
+        # pylint: disable=protected-access
+        other = failure_cases.store
+        chunk = other._chunks[failure_cases.error_id]
+        return chunk._replace(
+            column_codes=np.array(
+                [
+                    self._column_code(other._columns[c])
+                    for c in chunk.column_codes
+                ],
+                dtype=np.int32,
+            )
+        )
+
+    def _encode_failure_cases(self, error) -> Optional[_Chunk]:
+        """Encode the failure cases of a schema error, or return None if
+        they aren't in the long format of failure cases."""
+        # pylint: disable=protected-access
+        failure_cases = error._failure_cases
+        if isinstance(failure_cases, StoredFailureCases):
+            return self._copy_chunk(failure_cases)
+
+        arrays = _failure_case_arrays(error)
+        if arrays is None:
+            return None
+        frame_columns, columns, positions, values, labels = arrays
+
+        # only encode the failure cases that fit in the remaining memory
+        n_cases = self._n_fitting_cases(values, labels)
+        has_column = columns is not None
+        if columns is None:
+            # the column of failure cases of dataframe-level errors is unknown
+            columns = [
+                (
+                    None
+                    if hasattr(error.schema, "columns")
+                    else getattr(error.schema, "name", None)
+                )
+            ]
+        value_codes, encoded_values = _encode(values[:n_cases])
+        label_codes, encoded_labels = _encode(labels[:n_cases])
+        return _Chunk(
+            frame_columns=frame_columns,
+            column_codes=np.array(
+                [
+                    self._column_code(c)
+                    for c in (columns[:n_cases] if has_column else columns)
+                ],
+                dtype=np.int32,
+            ),
+            positions=(
+                np.full(n_cases, -1, dtype=np.int64)
+                if positions is None
+                else positions[:n_cases].astype(np.int64, copy=False)
+            ),
+            value_codes=value_codes,
+            values=encoded_values,
+            label_codes=label_codes,
+            labels=encoded_labels,
+            n_dropped=len(values)
+            - n_cases
+            + (
+                failure_cases.n_not_built()
+                if isinstance(failure_cases, CheckFailureCases)
+                else 0
+            ),
+        )
+
+    def add(self, error) -> None:
+        """Move the failure cases of a schema error into the store.
+
+        The failure cases of the error are replaced with a
+        :class:`StoredFailureCases` that builds them from the store.
+        Failure cases that aren't in the long format of failure cases are
+        left as they are.
+
+        :param error: ``SchemaError`` whose failure cases are stored.
+        """
+        # pylint: disable=protected-access
+        failure_cases = error._failure_cases
+        if failure_cases is None or (
+            isinstance(failure_cases, StoredFailureCases)
+            and failure_cases.store is self
+        ):
+            return
+        chunk = self._encode_failure_cases(error)
+        if chunk is None:
+            return
+        capacity = self._capacity(
+            max(-(-chunk.nbytes // max(chunk.n_cases, 1)), FAILURE_CASE_BYTES)
+        )
+        if capacity is not None and capacity < chunk.n_cases:
+            chunk = chunk.head(capacity)
+        self._chunks.append(chunk)
+        self.nbytes += chunk.nbytes
+        error.failure_cases = StoredFailureCases(self, len(self._chunks) - 1)
+
+    def positions(self, error_id: int) -> np.ndarray:
+        """Positions of the failure cases of an error in the validated
+        object, with -1 for unknown positions."""
+        return self._chunks[error_id].positions
+
+    def n_failure_cases(self, error_id: int) -> int:
+        """Number of failure cases of an error, including dropped ones."""
+        chunk = self._chunks[error_id]
+        return chunk.n_cases + chunk.n_dropped
+
+    def take(self, error_id: int, cases: np.ndarray) -> pd.DataFrame:
+        """Index labels and failure values of some of the stored failure
+        cases of an error.
+
+        Only the requested failure cases are decoded.
+
+        :param error_id: id of the error in the store.
+        :param cases: indices of the failure cases of the error.
+        """
+        chunk = self._chunks[error_id]
+        data = {}
+        for name, codes, table in [
+            ("index", chunk.label_codes, chunk.labels),
+            ("failure_case", chunk.value_codes, chunk.values),
+        ]:
+            data[name] = (
+                pd.api.extensions.take(table, cases)
+                if codes is None
+                else _decode(codes[cases], table)
+            )
+        return pd.DataFrame(data)
+
+    def error_failure_cases(self, error_id: int) -> pd.DataFrame:
+        """Long-format dataframe of the failure cases of an error."""
+        chunk = self._chunks[error_id]
+        data: Dict[str, Any] = {}
+        if chunk.has_column:
+            data["column"] = [self._columns[c] for c in chunk.column_codes]
+        data["index"] = _decode(chunk.label_codes, chunk.labels)
+        data["failure_case"] = _decode(chunk.value_codes, chunk.values)
+        return pd.DataFrame(data, columns=list(chunk.frame_columns))
+
+
+def _is_row_output(check_output: Any, index: pd.Index) -> bool:
+    """Whether the output of a check is a boolean Series aligned with the
+    rows of a validated object."""
+    if not isinstance(check_output, pd.Series) or check_output.dtype != bool:
+        return False
+    return len(check_output) == len(index) and (
+        check_output.index is index
+        or check_output.index.equals(index)
+        # checks of index components are evaluated on the index values with
+        # a default index
+        or check_output.index.equals(pd.RangeIndex(len(index)))
+    )
+
+
+def failure_positions(error, index: pd.Index) -> Optional[np.ndarray]:
+    """Positions of the rows of a validated object that failed a schema
+    error.
+
+    The positions are found from the output of the check when it's aligned
+    with the rows or has a default index, so that all failing rows are found
+    even if the check only reports its first failure cases. Otherwise, the
+    index labels of the failure cases are looked up in the index, so all the
+    rows with the label of a failure case are considered failing.
+
+    :param error: ``SchemaError`` collected by lazy validation.
+    :param index: index of the validated object.
+    :returns: sorted positions of the failing rows, or None if the error
+        doesn't concern individual rows, like a missing column.
+    """
+    check_output = error.check_output
+    if isinstance(check_output, pd.DataFrame):
+        check_output = check_output.all(axis="columns")
+    if _is_row_output(check_output, index):
+        return np.flatnonzero(~check_output.to_numpy())
+
+    failure_cases = error.failure_cases
+    if (
+        not isinstance(failure_cases, pd.DataFrame)
+        or "index" not in failure_cases
+        or failure_cases["index"].isna().all()
+    ):
+        return None
+    if isinstance(index, pd.MultiIndex):
+        # labels of failure cases are formatted as tuples
+        index = index.to_flat_index().map(str)
+    positions = index.get_indexer_for(failure_cases["index"].dropna().unique())
+    return np.unique(positions[positions >= 0])
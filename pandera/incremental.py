@@ -0,0 +1,788 @@
+"""Validate dataframes incrementally, one batch of rows at a time."""
+
+import warnings
+from concurrent.futures import Executor
+from copy import copy as shallow_copy
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import errors
+from .checks import Check
+from .error_formatters import reshape_failure_cases
+from .errors import _check_identifier
+from .hypotheses import Hypothesis
+from .schema_components import Index, MultiIndex
+from .schemas import (
+    DataFrameSchema,
+    _handle_check_results,
+    _run_dataframe_check,
+)
+
+# stands in for aggregate checks when validating a single batch so that the
+# positions of the other checks, which are reported in errors, don't change.
+_AGGREGATE_CHECK_PLACEHOLDER = Check(lambda _: True, name="aggregate_check")
+
+
+class _FailureCaseReservoir:
+    """Bounded uniform sample of the failure cases of a schema error.
+
+    Failure cases of the same error in different batches are sampled with
+    reservoir sampling, so that memory usage doesn't grow with the number of
+    batches.
+    """
+
+    def __init__(
+        self,
+        error: errors.SchemaError,
+        max_size: Optional[int],
+        random_state: np.random.RandomState,  # pylint: disable=no-member
+    ) -> None:
+        self.error = error
+        self.max_size = max_size
+        self.n_failure_cases = 0
+        self._random_state = random_state
+        self._failure_cases: Optional[pd.DataFrame] = None
+        # positions of the sampled failure cases among all failure cases
+        self._positions = np.array([], dtype=np.int64)
+
+    def add(self, failure_cases: Optional[pd.DataFrame]) -> None:
+        """Add the failure cases of a batch to the reservoir."""
+        if failure_cases is None:
+            return
+        positions = np.arange(
+            self.n_failure_cases, self.n_failure_cases + len(failure_cases)
+        )
+        self.n_failure_cases += len(failure_cases)
+        if self._failure_cases is None:
+            combined, n_sampled = failure_cases, 0
+        else:
+            combined = pd.concat(
+                [self._failure_cases, failure_cases], ignore_index=True
+            )
+            n_sampled = len(self._failure_cases)
+        combined_positions = np.concatenate([self._positions, positions])
+
+        # indices of the reservoir slots into the combined failure cases
+        slots = list(range(n_sampled))
+        if self.max_size is None:
+            slots.extend(range(n_sampled, len(combined)))
+        else:
+            fill = positions < self.max_size
+            slots.extend(n_sampled + np.flatnonzero(fill))
+            replace = np.flatnonzero(~fill)
+            if replace.size:
+                # failure case t replaces a random slot with probability
+                # max_size / (t + 1)
+                draws = self._random_state.randint(0, positions[replace] + 1)
+                hits = draws < self.max_size
+                for i, slot in zip(replace[hits], draws[hits]):
+                    slots[slot] = n_sampled + i
+        self._failure_cases = combined.iloc[slots]
+        self._positions = combined_positions[slots]
+
+    @property
+    def failure_cases(self) -> Optional[pd.DataFrame]:
+        """Sampled failure cases, in the order in which they occurred."""
+        if self._failure_cases is None:
+            return None
+        return self._failure_cases.iloc[
+            np.argsort(self._positions, kind="stable")
+        ].reset_index(drop=True)
+
+
+def _unique_subsets(unique: Union[str, List]) -> List[List]:
+    """Subsets of columns that should be jointly unique."""
+    if isinstance(unique, str):
+        return [[unique]]
+    return [unique] if all(isinstance(x, str) for x in unique) else unique
+
+
+def _column_names(col_name: Any, col: Any, columns: pd.Index) -> List:
+    """Names of the columns of a dataframe validated by a column schema."""
+    if col.regex:
+        try:
+            return list(col.get_regex_columns(columns))
+        except errors.SchemaError:
+            return []
+    return [col_name] if col_name in columns else []
+
+
+def _is_aggregate(
+    check: Union[Check, Hypothesis],
+    check_obj: Union[pd.DataFrame, pd.Series],
+    column: Optional[str] = None,
+) -> bool:
+    """Whether the output of a check isn't aligned with the rows of the
+    validated data."""
+    if check.groupby is not None or isinstance(check, Hypothesis):
+        return True
+    if check.element_wise:
+        return False
+    try:
+        return check(check_obj, column).failure_cases is None
+    except Exception:  # pylint: disable=broad-except
+        # checks that fail to run are reported by the batch validation
+        return False
+
+
+def _replace_aggregates(
+    checks: List[Union[Check, Hypothesis]],
+    check_obj: Union[pd.DataFrame, pd.Series],
+    column: Optional[str] = None,
+) -> Tuple[List[Union[Check, Hypothesis]], List[int]]:
+    """Replace the aggregate checks of a list of checks with placeholders.
+
+    :returns: the checks used to validate single batches, and the indexes
+        of the aggregate checks.
+    """
+    batch_checks = list(checks)
+    aggregates = []
+    for check_index, check in enumerate(checks):
+        if _is_aggregate(check, check_obj, column):
+            aggregates.append(check_index)
+            batch_checks[check_index] = _AGGREGATE_CHECK_PLACEHOLDER
+    return batch_checks, aggregates
+
+
+def _error_key(reason_code: str, error: errors.SchemaError) -> Tuple:
+    """Identify the same schema error in different batches."""
+    check = (
+        error.check
+        if error.check is None or isinstance(error.check, str)
+        else id(error.check)
+    )
+    return (
+        reason_code,
+        type(error.schema).__name__,
+        getattr(error.schema, "name", None),
+        check,
+        error.check_index,
+    )
+
+
+class IncrementalValidator:
+    """Validate a dataframe incrementally, one batch of rows at a time.
+
+    Each batch is validated with the schema. Checks that depend on all of the
+    rows validated so far are evaluated across batches:
+
+    - uniqueness of columns, of index levels and of combinations of columns
+      is checked against hashes of the values of previous batches.
+    - aggregate checks, i.e. checks whose output isn't aligned with the rows
+      of the validated data, are evaluated once on all batches by
+      :meth:`finish`. The data of the columns they validate is kept until
+      then, so memory usage grows with the number of rows validated, and a
+      ``UserWarning`` is issued when they're found in the first batch.
+
+    In lazy mode the errors of all batches are combined, keeping a bounded
+    sample of the failure cases of each error.
+    """
+
+    def __init__(
+        self,
+        schema: DataFrameSchema,
+        lazy: bool = False,
+        max_failure_cases: Optional[int] = 100,
+        random_state: Optional[int] = None,
+        keep_aggregate_data: bool = True,
+    ) -> None:
+        """Initialize an incremental validator.
+
+        :param schema: dataframe schema to validate batches with.
+        :param lazy: if True, collect the errors of all batches and raise a
+            ``SchemaErrors`` when calling :meth:`finish`. Otherwise, raise
+            ``SchemaError`` as soon as one occurs.
+        :param max_failure_cases: maximum number of failure cases kept for
+            each error in lazy mode. If None, keep all failure cases.
+        :param random_state: random seed for sampling failure cases.
+        :param keep_aggregate_data: if True, keep the data of the columns
+            validated by aggregate checks to evaluate them in
+            :meth:`finish`. If False, the caller keeps the batches and passes
+            them to :meth:`validate_aggregates`.
+        """
+        self.schema = schema
+        self.lazy = lazy
+        self.max_failure_cases = max_failure_cases
+        self.keep_aggregate_data = keep_aggregate_data
+        # pylint: disable=no-member
+        self._random_state = np.random.RandomState(random_state)
+        self._batch_schema: Optional[DataFrameSchema] = None
+        # aggregate checks of columns, the dataframe and the index, as
+        # (column name, check index) pairs
+        self._column_aggregates: List[Tuple[Any, int]] = []
+        self._dataframe_aggregates: List[int] = []
+        self._index_aggregates: List[int] = []
+        self._aggregate_data: List[pd.DataFrame] = []
+        self._unique_hashes: Dict[Hashable, set] = {}
+        # hashes added to the unique hash sets since the last checkpoint
+        self._added_hashes: Dict[Hashable, set] = {}
+        self._errors: Dict[Tuple, _FailureCaseReservoir] = {}
+        # number of batches of aggregate data and errors at the checkpoint
+        self._checkpoint: Optional[
+            Tuple[int, Dict[Tuple, _FailureCaseReservoir]]
+        ] = None
+
+    @property
+    def schema_errors(self) -> List[Dict[str, Any]]:
+        """Errors collected so far in lazy mode."""
+        schema_errors = []
+        for (reason_code, *_), reservoir in self._errors.items():
+            error = reservoir.error
+            error.failure_cases = reservoir.failure_cases
+            schema_errors.append({"reason_code": reason_code, "error": error})
+        return schema_errors
+
+    def _collect_error(
+        self, reason_code: str, error: errors.SchemaError
+    ) -> None:
+        if not self.lazy:
+            raise error
+        error.data = None
+        key = _error_key(reason_code, error)
+        if key not in self._errors:
+            self._errors[key] = _FailureCaseReservoir(
+                error, self.max_failure_cases, self._random_state
+            )
+        self._errors[key].add(error.failure_cases)
+
+    def _init_batch_schema(self, batch: pd.DataFrame) -> None:
+        """Find aggregate checks using the first batch, and replace them in
+        the schema used to validate single batches."""
+        try:
+            batch = self.schema.coerce_dtype(batch)
+        except errors.SchemaErrors:
+            pass
+        batch_schema = deepcopy(self.schema)
+
+        for col_name, col in self.schema.columns.items():
+            names = _column_names(col_name, col, batch.columns)
+            if not names:
+                continue
+            checks, aggregates = _replace_aggregates(
+                col.checks, batch, names[0]
+            )
+            self._column_aggregates.extend(
+                (col_name, check_index) for check_index in aggregates
+            )
+            batch_schema.columns[col_name].checks = checks
+
+        (
+            batch_schema.checks,
+            self._dataframe_aggregates,
+        ) = _replace_aggregates(self.schema.checks, batch)
+
+        if isinstance(self.schema.index, Index):
+            (
+                batch_schema.index.checks,
+                self._index_aggregates,
+            ) = _replace_aggregates(
+                self.schema.index.checks,
+                pd.Series(batch.index, name=batch.index.name),
+            )
+
+        self._batch_schema = batch_schema
+        if self.keep_aggregate_data and self._has_aggregates:
+            self._warn_aggregate_data()
+
+    def _warn_aggregate_data(self) -> None:
+        """Warn that the data validated by aggregate checks is kept until
+        they're evaluated."""
+        columns = self.schema.columns
+        index_checks = getattr(self.schema.index, "checks", [])
+        checks = [
+            f"{col_name}: {_check_identifier(columns[col_name].checks[i])}"
+            for col_name, i in self._column_aggregates
+        ]
+        checks.extend(
+            str(_check_identifier(self.schema.checks[i]))
+            for i in self._dataframe_aggregates
+        )
+        checks.extend(
+            f"index: {_check_identifier(index_checks[i])}"
+            for i in self._index_aggregates
+        )
+        warnings.warn(
+            f"aggregate checks {checks} are evaluated on all the rows once "
+            "the last batch is validated, so the data of the columns they "
+            "validate is kept in memory until then. Use element-wise or "
+            "built-in checks to validate data that doesn't fit into memory.",
+            UserWarning,
+        )
+
+    def _aggregate_columns(self, batch: pd.DataFrame) -> Optional[List]:
+        """Columns of a batch needed to evaluate aggregate checks, or None if
+        all columns are needed."""
+        if self._dataframe_aggregates:
+            return None
+        columns: List = []
+        for col_name, check_index in self._column_aggregates:
+            col = self.schema.columns[col_name]
+            check = col.checks[check_index]
+            if callable(check.groupby):
+                return None
+            if check.groupby is not None:
+                columns.extend(
+                    [check.groupby]
+                    if isinstance(check.groupby, str)
+                    else check.groupby
+                )
+            if col.regex:
+                try:
+                    columns.extend(col.get_regex_columns(batch.columns))
+                except errors.SchemaError:
+                    pass
+            else:
+                columns.append(col_name)
+        return [c for c in dict.fromkeys(columns) if c in batch]
+
+    def _aggregate_input(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """Data of a batch needed to evaluate aggregate checks."""
+        columns = self._aggregate_columns(batch)
+        return batch if columns is None else batch[columns]
+
+    def _unique_constraints(self, batch: pd.DataFrame):
+        """Values of a batch that must be unique across batches.
+
+        :yields: tuples of a key identifying the constraint, the schema
+            reported in errors, the reason code and check of errors, the
+            values and the ``keep`` argument with which duplicates within
+            the batch are found by the batch validation.
+        """
+        for col_name, col in self.schema.columns.items():
+            if not col.unique:
+                continue
+            for name in _column_names(col_name, col, batch.columns):
+                values = batch[name]
+                if isinstance(values, pd.Series):
+                    yield (
+                        ("column", name),
+                        shallow_copy(col).set_name(name),
+                        "schema_component_check",
+                        "field_uniqueness",
+                        values,
+                        "first",
+                    )
+
+        if self.schema.unique:
+            for subset in _unique_subsets(self.schema.unique):
+                if all(c in batch for c in subset):
+                    yield (
+                        ("unique", tuple(subset)),
+                        self.schema,
+                        "duplicates",
+                        "multiple_fields_uniqueness",
+                        batch[subset],
+                        False,
+                    )
+
+        yield from self._index_unique_constraints(batch)
+
+    def _index_unique_constraints(self, batch: pd.DataFrame):
+        """Values of the index of a batch that must be unique across
+        batches, as yielded by :meth:`_unique_constraints`."""
+        index_schema = self.schema.index
+        if isinstance(index_schema, Index) and index_schema.unique:
+            yield (
+                ("index",),
+                index_schema,
+                "schema_component_check",
+                "field_uniqueness",
+                pd.Series(batch.index, index=batch.index),
+                "first",
+            )
+        elif isinstance(index_schema, MultiIndex) and isinstance(
+            batch.index, pd.MultiIndex
+        ):
+            levels = batch.index.to_frame(index=False)
+            levels.index = batch.index
+            for i, level_schema in enumerate(index_schema.indexes):
+                if level_schema.unique:
+                    yield (
+                        ("index", i),
+                        level_schema,
+                        "schema_component_check",
+                        "field_uniqueness",
+                        levels.iloc[:, i],
+                        "first",
+                    )
+            for subset in (
+                _unique_subsets(index_schema.unique)
+                if index_schema.unique
+                else []
+            ):
+                if all(c in levels for c in subset):
+                    yield (
+                        ("index", tuple(subset)),
+                        index_schema,
+                        "schema_component_check",
+                        "multiple_fields_uniqueness",
+                        levels[subset],
+                        False,
+                    )
+
+    def _check_unique(self, batch: pd.DataFrame) -> None:
+        for (
+            key,
+            schema,
+            reason_code,
+            check,
+            values,
+            keep,
+        ) in self._unique_constraints(batch):
+            hashes = pd.util.hash_pandas_object(values, index=False)
+            keys = hashes.tolist()
+            seen = self._unique_hashes.setdefault(key, set())
+            duplicated = np.fromiter(
+                map(seen.__contains__, keys), dtype=bool, count=len(keys)
+            )
+            if self._checkpoint is not None:
+                self._added_hashes.setdefault(key, set()).update(
+                    set(keys).difference(seen)
+                )
+            seen.update(keys)
+            # duplicates within the batch are reported by the validation of
+            # the batch
+            duplicated &= ~hashes.duplicated(keep=keep).to_numpy()
+            if duplicated.any():
+                failed = values[duplicated]
+                failure_cases = reshape_failure_cases(failed)
+                self._collect_error(
+                    reason_code,
+                    errors.SchemaError(
+                        schema,
+                        batch,
+                        f"{check} across batches failed, found values of "
+                        f"previous batches:\n{failure_cases}",
+                        failure_cases=failure_cases,
+                        check=check,
+                    ),
+                )
+
+    def validate(
+        self,
+        batch: pd.DataFrame,
+        inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> pd.DataFrame:
+        """Validate a batch of rows.
+
+        :param batch: dataframe to validate.
+        :param inplace: if True, applies coercion to the batch, otherwise
+            creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the batch instead of a deep copy.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently.
+        :returns: validated batch. In lazy mode, batches with errors are
+            returned too.
+        """
+        if self._batch_schema is None:
+            self._init_batch_schema(batch)
+        assert self._batch_schema is not None
+
+        try:
+            batch = self._batch_schema.validate(
+                batch,
+                lazy=self.lazy,
+                inplace=inplace,
+                copy=copy,
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+        except errors.SchemaErrors as err:
+            for schema_error_dict in err.schema_errors:
+                self._collect_error(
+                    schema_error_dict["reason_code"],
+                    schema_error_dict["error"],
+                )
+            batch = err.data
+        batch = batch.pandera.add_schema(self.schema)
+
+        self._check_unique(batch)
+        if self.keep_aggregate_data and self._has_aggregates:
+            self._aggregate_data.append(self._aggregate_input(batch))
+        return batch
+
+    @property
+    def _has_aggregates(self) -> bool:
+        return bool(
+            self._column_aggregates
+            or self._dataframe_aggregates
+            or self._index_aggregates
+        )
+
+    def checkpoint(self) -> None:
+        """Save the state of the validator, so that :meth:`rollback` can
+        undo the validation of the batches that follow."""
+        self._checkpoint = (
+            len(self._aggregate_data),
+            {
+                key: shallow_copy(reservoir)
+                for key, reservoir in self._errors.items()
+            },
+        )
+        self._added_hashes = {}
+
+    def rollback(self) -> None:
+        """Restore the state saved by the last :meth:`checkpoint`.
+
+        The values of the batches validated since the checkpoint are removed
+        from the hashes of unique values, their data is dropped and their
+        errors are discarded. The checkpoint is discarded too.
+
+        :raises ValueError: if there is no checkpoint.
+        """
+        if self._checkpoint is None:
+            raise ValueError("there is no checkpoint to roll back to")
+        n_batches, schema_errors = self._checkpoint
+        for key, added in self._added_hashes.items():
+            self._unique_hashes[key].difference_update(added)
+        del self._aggregate_data[n_batches:]
+        self._errors = schema_errors
+        self._added_hashes = {}
+        self._checkpoint = None
+
+    def validate_aggregates(
+        self, batches: Optional[List[pd.DataFrame]] = None
+    ) -> None:
+        """Evaluate aggregate checks on the rows of all batches.
+
+        :param batches: validated batches to evaluate aggregate checks on.
+            Defaults to the data kept from the batches validated so far,
+            which is then released.
+        :raises SchemaError: when aggregate checks fail and ``lazy=False``.
+        """
+        if not self._has_aggregates:
+            return
+        if batches is None:
+            batches, self._aggregate_data = self._aggregate_data, []
+        else:
+            batches = [self._aggregate_input(batch) for batch in batches]
+        if not batches:
+            return
+        data = pd.concat(batches)
+
+        for col_name, check_index in self._column_aggregates:
+            col = self.schema.columns[col_name]
+            for name in _column_names(col_name, col, data.columns):
+                try:
+                    _handle_check_results(
+                        shallow_copy(col).set_name(name),
+                        check_index,
+                        col.checks[check_index],
+                        data,
+                        name,
+                    )
+                except errors.SchemaError as err:
+                    self._collect_error("schema_component_check", err)
+
+        for check_index in self._dataframe_aggregates:
+            _, schema_errors = _run_dataframe_check(
+                self.schema, check_index, self.schema.checks[check_index], data
+            )
+            for reason_code, error in schema_errors:
+                self._collect_error(reason_code, error)
+
+        index = pd.Series(data.index, name=data.index.name)
+        for check_index in self._index_aggregates:
+            try:
+                _handle_check_results(
+                    self.schema.index,
+                    check_index,
+                    self.schema.index.checks[check_index],
+                    index,
+                )
+            except errors.SchemaError as err:
+                self._collect_error("schema_component_check", err)
+
+    def finish(self) -> None:
+        """Evaluate aggregate checks on all batches validated so far.
+
+        :raises SchemaError: when aggregate checks fail and ``lazy=False``.
+        :raises SchemaErrors: when any batch failed validation and
+            ``lazy=True``.
+        """
+        self.validate_aggregates()
+        if self._errors:
+            raise errors.SchemaErrors(self.schema_errors, None)
+
+
+@dataclass(frozen=True)
+class ColumnSketch:
+    """Summary statistics of a column that are updated incrementally.
+
+    ``min`` and ``max`` are None when the column has no values, or when its
+    values can't be ordered.
+    """
+
+    count: int = 0
+    null_count: int = 0
+    min: Any = None
+    max: Any = None
+
+    def update(self, values: pd.Series) -> "ColumnSketch":
+        """Statistics of the column after appending values to it."""
+        non_null = values.dropna()
+        count = self.count + len(non_null)
+        null_count = self.null_count + len(values) - len(non_null)
+        if non_null.empty:
+            return ColumnSketch(count, null_count, self.min, self.max)
+        if self.count and self.min is None:
+            # the previous values can't be ordered
+            return ColumnSketch(count, null_count)
+        try:
+            minimum, maximum = non_null.min(), non_null.max()
+            if self.count:
+                minimum = min(self.min, minimum)
+                maximum = max(self.max, maximum)
+        except TypeError:
+            return ColumnSketch(count, null_count)
+        return ColumnSketch(count, null_count, minimum, maximum)
+
+
+class ValidatedFrame:
+    """Dataframe that is kept valid as rows are appended to it.
+
+    Appended rows are validated without re-validating the rows that were
+    already validated, in time proportional to their number:
+
+    - data types, nullability, built-in checks, element-wise checks and
+      other checks whose output is aligned with the rows are evaluated on
+      the appended rows only.
+    - uniqueness of columns, of index levels and of combinations of columns
+      is checked against hash sets of the values of the previous rows, which
+      are kept between appends.
+
+    Aggregate checks, i.e. checks whose output isn't aligned with the rows of
+    the validated data like ``Check(lambda s: s.mean() > 0)``, groupby
+    checks and hypotheses, are arbitrary functions of whole columns. They
+    force a full recompute: after each append, they're evaluated again on
+    all the rows of the columns they validate, which are concatenated from
+    the rows of the frame.
+
+    The count, null count, minimum and maximum of each column are updated
+    incrementally and available as :attr:`statistics`. They describe the
+    frame and aren't used for validation.
+
+    When appended rows are invalid, the error is raised and the validated
+    frame is left unchanged.
+
+    >>> import pandas as pd
+    >>> import pandera as pa
+    >>> from pandera.incremental import ValidatedFrame
+    >>>
+    >>> schema = pa.DataFrameSchema(
+    ...     {"id": pa.Column(int, unique=True), "x": pa.Column(float)}
+    ... )
+    >>> frame = ValidatedFrame(schema, pd.DataFrame({"id": [1], "x": [0.5]}))
+    >>> frame = frame.append(pd.DataFrame({"id": [2, 3], "x": [1.5, 2.5]}))
+    >>> len(frame)
+    3
+    >>> frame.statistics.loc["x", "max"]
+    2.5
+    """
+
+    def __init__(
+        self,
+        schema: DataFrameSchema,
+        data: Optional[pd.DataFrame] = None,
+        lazy: bool = False,
+    ) -> None:
+        """Initialize a validated frame.
+
+        :param schema: dataframe schema that the rows of the frame satisfy.
+        :param data: initial rows of the frame, which are validated.
+        :param lazy: if True, raise a ``SchemaErrors`` with all the errors of
+            invalid appended rows. Otherwise, raise the first
+            ``SchemaError``.
+        """
+        self.schema = schema
+        self.lazy = lazy
+        self._validator = IncrementalValidator(
+            schema,
+            lazy=lazy,
+            max_failure_cases=None,
+            keep_aggregate_data=False,
+        )
+        self._chunks: List[pd.DataFrame] = []
+        self._n_rows = 0
+        self._sketches: Dict[Any, ColumnSketch] = {}
+        if data is not None:
+            self.append(data)
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Rows of the frame, with the schema attached.
+
+        Appended rows are only concatenated when accessing the data.
+        """
+        if not self._chunks:
+            return pd.DataFrame(
+                columns=list(self.schema.columns)
+            ).pandera.add_schema(self.schema)
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks)]
+        return self._chunks[0].pandera.add_schema(self.schema)
+
+    @property
+    def statistics(self) -> pd.DataFrame:
+        """Count, null count, minimum and maximum of each column."""
+        sketches = self._sketches.values()
+        return pd.DataFrame(
+            {
+                "count": [sketch.count for sketch in sketches],
+                "null_count": [sketch.null_count for sketch in sketches],
+                # keep the data types of the columns
+                "min": pd.Series(
+                    [sketch.min for sketch in sketches], dtype=object
+                ).values,
+                "max": pd.Series(
+                    [sketch.max for sketch in sketches], dtype=object
+                ).values,
+            },
+            index=list(self._sketches),
+        )
+
+    def append(
+        self, new_rows: pd.DataFrame, inplace: bool = False
+    ) -> "ValidatedFrame":
+        """Validate rows and append them to the frame.
+
+        :param new_rows: dataframe of rows to append.
+        :param inplace: if True, applies coercion to ``new_rows``, otherwise
+            creates a copy of the data.
+        :returns: the validated frame.
+        :raises SchemaError: when the rows are invalid and ``lazy=False``.
+        :raises SchemaErrors: when the rows are invalid and ``lazy=True``.
+        """
+        validator = self._validator
+        validator.checkpoint()
+        try:
+            new_rows = validator.validate(new_rows, inplace=inplace)
+            validator.validate_aggregates([*self._chunks, new_rows])
+        except errors.SchemaError:
+            validator.rollback()
+            raise
+        schema_errors = validator.schema_errors
+        if schema_errors:
+            validator.rollback()
+            raise errors.SchemaErrors(schema_errors, new_rows)
+
+        for column, values in new_rows.items():
+            self._sketches[column] = self._sketches.get(
+                column, ColumnSketch()
+            ).update(values)
+        self._chunks.append(new_rows)
+        self._n_rows += len(new_rows)
+        return self
@@ -4,6 +4,7 @@ import os
 import re
 import sys
 import typing
+from concurrent.futures import Executor
 from typing import (
     Any,
     Callable,
@@ -90,6 +91,12 @@ class BaseConfig:  # pylint:disable=R0903
     #: validate MultiIndex in order
     multiindex_ordered: bool = True
 
+    #: number of threads used to validate columns concurrently
+    n_jobs: int = 1
+
+    #: executor used to validate columns concurrently
+    executor: Optional[Executor] = None
+
 
 def _is_field(name: str) -> bool:
     """Ignore private and reserved keywords."""
@@ -210,6 +217,8 @@ class SchemaModel:
             name=cls.__config__.name,
             ordered=cls.__config__.ordered,
             unique=cls.__config__.unique,
+            n_jobs=cls.__config__.n_jobs,
+            executor=cls.__config__.executor,
         )
         if cls not in MODEL_CACHE:
             MODEL_CACHE[cls] = cls.__schema__  # type: ignore
@@ -233,10 +242,22 @@ class SchemaModel:
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> DataFrame[TSchemaModel]:
         """%(validate_doc)s"""
         return cls.to_schema().validate(
-            check_obj, head, tail, sample, random_state, lazy, inplace
+            check_obj,
+            head,
+            tail,
+            sample,
+            random_state,
+            lazy,
+            inplace,
+            copy,
+            n_jobs,
+            executor,
         )
 
     @classmethod
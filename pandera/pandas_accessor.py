@@ -38,6 +38,10 @@ class PanderaAccessor:
 class PanderaDataFrameAccessor(PanderaAccessor):
     """Pandera accessor for pandas DataFrame."""
 
+    def __init__(self, pandas_obj):
+        super().__init__(pandas_obj)
+        self._validated_frame = None
+
     @staticmethod
     def check_schema_type(schema):
         if not isinstance(schema, schemas.DataFrameSchema):
@@ -45,6 +49,41 @@ class PanderaDataFrameAccessor(PanderaAccessor):
                 f"schema arg must be a DataFrameSchema, found {type(schema)}"
             )
 
+    def append(
+        self, new_rows: pd.DataFrame, inplace: bool = False
+    ) -> pd.DataFrame:
+        """Validate rows with the schema of the dataframe and append them.
+
+        The state needed to validate appended rows, like hash sets of unique
+        values, is built on the first append and carried over to the
+        returned dataframe, so that appending to it only validates the new
+        rows. See :class:`~pandera.incremental.ValidatedFrame`.
+
+        :param new_rows: dataframe of rows to append.
+        :param inplace: if True, applies coercion to ``new_rows``, otherwise
+            creates a copy of the data.
+        :returns: dataframe with the appended rows.
+        :raises ValueError: if the dataframe has no schema.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .incremental import ValidatedFrame
+
+        if not isinstance(self._schema, schemas.DataFrameSchema):
+            raise ValueError(
+                "rows can only be appended to dataframes validated by a "
+                "DataFrameSchema"
+            )
+        validated_frame = self._validated_frame
+        if (
+            validated_frame is None
+            or validated_frame.schema is not self._schema
+            or validated_frame.data is not self._pandas_obj
+        ):
+            validated_frame = ValidatedFrame(self._schema, self._pandas_obj)
+        data = validated_frame.append(new_rows, inplace=inplace).data
+        data.pandera._validated_frame = validated_frame
+        return data
+
 
 @pd.api.extensions.register_series_accessor("pandera")
 class PanderaSeriesAccessor(PanderaAccessor):
@@ -0,0 +1,262 @@
+"""Profiling of validation.
+
+Checks, schema components and data type coercions measure their wall time,
+the number of rows they process and the memory they allocate while a
+:func:`profile` context is active, so that the slow checks of large schemas
+can be found:
+
+>>> import pandas as pd
+>>> import pandera as pa
+>>> from pandera.profiling import profile
+>>>
+>>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+>>> with profile() as validation_profile:
+...     validated = schema.validate(pd.DataFrame({"a": [1, 2, 3]}))
+>>> validation_profile.by_check()[["column", "check", "n_rows"]]
+  column                        check  n_rows
+0      a  greater_than_or_equal_to(0)       3
+
+Measurements are only made while a profile is active: otherwise validation
+runs without any instrumentation.
+"""
+
+import contextlib
+import threading
+import time
+import tracemalloc
+from functools import wraps
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .errors import _check_identifier
+
+PROFILE_COLUMNS = [
+    "schema_context",
+    "column",
+    "check",
+    "check_number",
+    "n_rows",
+    "duration",
+    "allocated_bytes",
+]
+
+# columns identifying what was measured
+_KEY_COLUMNS = ["schema_context", "column", "check", "check_number"]
+
+# profiles that are currently recording measurements
+_ACTIVE_PROFILES: List["ValidationProfile"] = []
+
+# spans of each thread that are measuring memory allocations, innermost last
+_local = threading.local()
+
+_NULL_SPAN = contextlib.nullcontext()
+
+# tracemalloc.reset_peak is only available from python 3.9. Before that,
+# spans measure the net memory allocated between their start and end.
+_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+
+
+class ValidationProfile:
+    """Wall time, rows and memory allocations measured during validation.
+
+    Each measurement is a record with the schema context and column of the
+    schema component, the check and its number in the list of checks of the
+    component, the number of rows processed, the wall time in seconds and
+    the peak number of bytes allocated. Records without a check measure the
+    whole validation of a schema component, including its checks. Built-in
+    checks that are evaluated together in a single pass over a column are
+    only measured as part of the column.
+
+    Before python 3.9, where :mod:`tracemalloc` can't reset its peak, the
+    number of bytes allocated is the net increase of the traced memory
+    instead, which misses temporary allocations that are freed before the
+    measurement ends.
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        """Initialize a validation profile.
+
+        :param trace_memory: measure memory allocations with
+            :mod:`tracemalloc`, which slows down validation.
+        """
+        self.trace_memory = trace_memory
+        self.duration: Optional[float] = None
+        self._records: List[Tuple[Any, ...]] = []
+
+    def to_frame(self) -> pd.DataFrame:
+        """Measurements as a dataframe with the columns of
+        :data:`PROFILE_COLUMNS`, in the order they were made."""
+        records = pd.DataFrame(self._records, columns=PROFILE_COLUMNS)
+        records["check_number"] = records["check_number"].astype("Int64")
+        records["n_rows"] = records["n_rows"].astype("int64")
+        records["duration"] = records["duration"].astype(float)
+        records["allocated_bytes"] = records["allocated_bytes"].astype("Int64")
+        return records
+
+    @staticmethod
+    def _aggregate(records: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate the measurements of the same check or component,
+        slowest first."""
+        return (
+            records.groupby(_KEY_COLUMNS, dropna=False, sort=False)
+            .agg(
+                n_calls=("duration", "size"),
+                n_rows=("n_rows", "sum"),
+                duration=("duration", "sum"),
+                allocated_bytes=("allocated_bytes", "max"),
+            )
+            .sort_values("duration", ascending=False, kind="stable")
+            .reset_index()
+        )
+
+    def by_check(self) -> pd.DataFrame:
+        """Total wall time, rows and peak memory allocation of each check
+        and data type coercion, slowest first."""
+        records = self.to_frame()
+        return self._aggregate(records[records["check"].notna()])
+
+    def by_column(self) -> pd.DataFrame:
+        """Total wall time, rows and peak memory allocation of the
+        validation of each schema component, slowest first."""
+        records = self.to_frame()
+        return self._aggregate(records[records["check"].isna()]).drop(
+            columns=["check", "check_number"]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} n_records={len(self._records)}, "
+            f"duration={self.duration}>"
+        )
+
+
+@contextlib.contextmanager
+def profile(trace_memory: bool = True) -> Iterator[ValidationProfile]:
+    """Profile the validations run in this context.
+
+    Validations run by other threads while the context is active, like the
+    concurrent validation of columns with ``n_jobs``, are profiled too.
+
+    :param trace_memory: measure memory allocations with
+        :mod:`tracemalloc`. Allocations are traced for the whole process, so
+        the allocations of concurrent validations overlap. Before python
+        3.9, only the net allocations of checks and schema components are
+        measured, without their peaks.
+    :yields: profile that records the measurements.
+    """
+    validation_profile = ValidationProfile(trace_memory)
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    _ACTIVE_PROFILES.append(validation_profile)
+    start = time.perf_counter()
+    try:
+        yield validation_profile
+    finally:
+        validation_profile.duration = time.perf_counter() - start
+        _ACTIVE_PROFILES.remove(validation_profile)
+        if start_tracing:
+            tracemalloc.stop()
+
+
+class _Span:
+    """Measurement of a check or schema component."""
+
+    __slots__ = ("profiles", "key", "n_rows", "start", "memory", "peak")
+
+    def __init__(self, profiles, key, n_rows) -> None:
+        self.profiles = profiles
+        self.key = key
+        self.n_rows = n_rows
+        self.start = 0.0
+        self.memory: Optional[int] = None
+        self.peak = 0
+
+    def __enter__(self) -> "_Span":
+        if tracemalloc.is_tracing() and any(
+            profile.trace_memory for profile in self.profiles
+        ):
+            spans = _local.__dict__.setdefault("spans", [])
+            self.memory, peak = tracemalloc.get_traced_memory()
+            if _RESET_PEAK:
+                # the peak is reset to measure this span, so the peak reached
+                # so far is kept for the enclosing span
+                if spans:
+                    spans[-1].peak = max(spans[-1].peak, peak)
+                getattr(tracemalloc, "reset_peak")()
+            self.peak = self.memory
+            spans.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        duration = time.perf_counter() - self.start
+        allocated_bytes = None
+        if self.memory is not None:
+            spans = _local.spans
+            spans.remove(self)
+            if not tracemalloc.is_tracing():
+                peak = self.peak
+            elif _RESET_PEAK:
+                peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            else:
+                peak = max(self.peak, tracemalloc.get_traced_memory()[0])
+            if spans and _RESET_PEAK:
+                spans[-1].peak = max(spans[-1].peak, peak)
+            allocated_bytes = peak - self.memory
+        record = (*self.key, self.n_rows, duration, allocated_bytes)
+        for validation_profile in self.profiles:
+            validation_profile._records.append(
+                record
+                if validation_profile.trace_memory
+                else record[:-1] + (None,)
+            )
+
+
+def measure(
+    schema,
+    check: Any = None,
+    check_index: Optional[int] = None,
+    n_rows: int = 0,
+    column: Any = None,
+):
+    """Measure a check, coercion or schema component if a profile is active.
+
+    :param schema: schema or schema component being validated.
+    :param check: check or name of the check being measured. None measures
+        the validation of the schema component.
+    :param check_index: index of the check in the checks of the schema.
+    :param n_rows: number of rows processed.
+    :param column: column being validated. Defaults to the name of schema
+        components.
+    :returns: context manager measuring the code it runs.
+    """
+    if not _ACTIVE_PROFILES:
+        return _NULL_SPAN
+    if column is None and not hasattr(schema, "columns"):
+        column = schema.name
+    return _Span(
+        list(_ACTIVE_PROFILES),
+        (
+            type(schema).__name__,
+            column,
+            _check_identifier(check),
+            check_index,
+        ),
+        n_rows,
+    )
+
+
+def measured(validate):
+    """Measure the validation of a schema component if a profile is
+    active."""
+
+    @wraps(validate)
+    def _wrapper(schema, check_obj, *args, **kwargs):
+        if not _ACTIVE_PROFILES:
+            return validate(schema, check_obj, *args, **kwargs)
+        with measure(schema, n_rows=len(check_obj)):
+            return validate(schema, check_obj, *args, **kwargs)
+
+    return _wrapper
@@ -0,0 +1,454 @@
+"""Summary reports of validation.
+
+A summary report tells, for each failing check, how many rows failed the
+check, the fraction of validated rows that failed and a few examples of
+failure values. It's computed from the outputs of the checks and the stored
+failure cases of lazy validation, without building the long-format
+dataframe of failure cases of :class:`~pandera.errors.SchemaErrors`.
+
+A :class:`ValidationReport` holds the same information in typed columns,
+which can be written to Parquet or Arrow IPC files, along with the time
+spent in each failing check if the validation was profiled.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from . import constants, errors
+from .errors import _check_identifier
+from .failure_cases import StoredFailureCases
+from .profiling import ValidationProfile
+
+SUMMARY_COLUMNS = [
+    "schema_context",
+    "column",
+    "check",
+    "check_number",
+    "reason_code",
+    "n_failures",
+    "failure_ratio",
+    "examples",
+]
+
+# columns of validation reports with their pandas data types
+REPORT_DTYPES = {
+    "schema_context": "string",
+    "column": "string",
+    "check": "string",
+    "check_number": "Int64",
+    "reason_code": "string",
+    "n_failures": "Int64",
+    "failure_ratio": "float64",
+    "examples": "object",
+    "duration": "float64",
+}
+
+_N_ROWS_METADATA_KEY = b"pandera.n_rows"
+
+
+class ValidationSummary:
+    """Summary of the failures of a validation."""
+
+    def __init__(
+        self,
+        data: Union[pd.Series, pd.DataFrame],
+        failures: pd.DataFrame,
+        n_rows: int,
+    ) -> None:
+        """Initialize a validation summary.
+
+        :param data: validated data, coerced by the schema.
+        :param failures: dataframe with one row per schema error, with the
+            number of rows that failed the check, the fraction of validated
+            rows that failed and a sample of failure values. Errors that
+            don't concern individual rows, like a wrong data type, have
+            missing failure counts.
+        :param n_rows: number of validated rows.
+        """
+        self.data = data
+        self.failures = failures
+        self.n_rows = n_rows
+
+    @property
+    def passed(self) -> bool:
+        """Whether the data passed validation."""
+        return self.failures.empty
+
+    @property
+    def n_failures(self) -> int:
+        """Total number of rows that failed the checks, counting rows once
+        per failing check."""
+        return int(self.failures["n_failures"].sum())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} n_rows={self.n_rows}, "
+            f"n_errors={len(self.failures)}, passed={self.passed}>"
+        )
+
+
+def _n_failures(error: errors.SchemaError) -> Optional[int]:
+    """Number of rows that failed a check, or None if the error doesn't
+    concern individual rows."""
+    check_output = error.check_output
+    if isinstance(check_output, pd.DataFrame):
+        check_output = check_output.all(axis="columns")
+    if isinstance(check_output, pd.Series) and check_output.dtype == bool:
+        return int(len(check_output) - check_output.sum())
+    # pylint: disable=protected-access
+    failure_cases = error._failure_cases
+    if isinstance(failure_cases, StoredFailureCases):
+        store, error_id = failure_cases.store, failure_cases.error_id
+        n_failures = store.n_failure_cases(error_id)
+        # the failure case of errors that don't concern rows, like a
+        # missing column, has no index label
+        if n_failures == 1 and pd.isna(
+            store.take(error_id, np.array([0]))["index"][0]
+        ):
+            return None
+        return n_failures
+    return None
+
+
+def _failure_ratio(n_failures: Optional[int], n_rows: int) -> float:
+    """Fraction of the validated rows that failed a check."""
+    if n_failures is None:
+        return np.nan
+    return n_failures / n_rows if n_rows else 0.0
+
+
+def _examples(
+    error: errors.SchemaError,
+    n_examples: int,
+    random_state: np.random.RandomState,  # pylint: disable=no-member
+) -> List[Any]:
+    """Uniform sample of the failure values of an error."""
+    # pylint: disable=protected-access
+    failure_cases = error._failure_cases
+    if isinstance(failure_cases, StoredFailureCases):
+        store, error_id = failure_cases.store, failure_cases.error_id
+        n_stored = len(store.positions(error_id))
+        cases = np.sort(
+            random_state.choice(
+                n_stored, min(n_examples, n_stored), replace=False
+            )
+        )
+        return store.take(error_id, cases)["failure_case"].tolist()
+    if callable(failure_cases):
+        failure_cases = error.failure_cases
+    if isinstance(failure_cases, pd.DataFrame):
+        failure_cases = failure_cases.get("failure_case", failure_cases)
+        return failure_cases.sample(
+            min(n_examples, len(failure_cases)), random_state=random_state
+        ).tolist()
+    return [failure_cases]
+
+
+def summarize_errors(
+    schema_errors: List[Dict[str, Any]],
+    n_rows: int,
+    n_examples: int = constants.N_REPORT_EXAMPLES,
+    random_state: Optional[int] = None,
+) -> pd.DataFrame:
+    """Summarize the errors collected by lazy validation.
+
+    :param schema_errors: errors collected by lazy validation, as in
+        :attr:`pandera.errors.SchemaErrors.schema_errors`.
+    :param n_rows: number of validated rows.
+    :param n_examples: maximum number of failure values sampled per error.
+        The values are sampled from the failure cases reported by the check,
+        whose number is limited by the ``n_failure_cases`` of the check.
+    :param random_state: random seed for sampling failure values.
+    :returns: dataframe with one row per error.
+    """
+    rng = np.random.RandomState(random_state)  # pylint: disable=no-member
+    rows = []
+    for error_dict in schema_errors:
+        error = error_dict["error"]
+        n_failures = _n_failures(error)
+        rows.append(
+            (
+                type(error.schema).__name__,
+                (
+                    None
+                    if hasattr(error.schema, "columns")
+                    else error.schema.name
+                ),
+                _check_identifier(error.check),
+                error.check_index,
+                error_dict["reason_code"],
+                n_failures,
+                _failure_ratio(n_failures, n_rows),
+                _examples(error, n_examples, rng),
+            )
+        )
+    failures = pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+    failures["check_number"] = failures["check_number"].astype("Int64")
+    failures["n_failures"] = failures["n_failures"].astype("Int64")
+    failures["failure_ratio"] = failures["failure_ratio"].astype(float)
+    return failures
+
+
+def summarize_validation(
+    validate: Callable[[], Union[pd.Series, pd.DataFrame]],
+    n_rows: int,
+    random_state: Optional[int] = None,
+) -> ValidationSummary:
+    """Run lazy validation and summarize its errors.
+
+    :param validate: function that lazily validates the data.
+    :param n_rows: number of validated rows.
+    :param random_state: random seed for sampling failure values.
+    :returns: summary of the failures of the validation.
+    """
+    try:
+        data = validate()
+    except errors.SchemaErrors as exc:
+        return ValidationSummary(
+            exc.data,
+            summarize_errors(
+                exc.schema_errors, n_rows, random_state=random_state
+            ),
+            n_rows,
+        )
+    return ValidationSummary(data, summarize_errors([], n_rows), n_rows)
+
+
+def _arrow_schema():
+    """Arrow schema of validation reports."""
+    # pylint: disable=import-outside-toplevel
+    import pyarrow
+
+    return pyarrow.schema(
+        [
+            ("schema_context", pyarrow.string()),
+            ("column", pyarrow.string()),
+            ("check", pyarrow.string()),
+            ("check_number", pyarrow.int64()),
+            ("reason_code", pyarrow.string()),
+            ("n_failures", pyarrow.int64()),
+            ("failure_ratio", pyarrow.float64()),
+            ("examples", pyarrow.list_(pyarrow.string())),
+            ("duration", pyarrow.float64()),
+        ]
+    )
+
+
+def _as_string(value: Any) -> Any:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+class ValidationReport:
+    """Failures of a validation in typed columns.
+
+    Unlike the failure cases of :class:`~pandera.errors.SchemaErrors`, whose
+    columns mix the types of the validated data, the columns of a report
+    have fixed data types: column names and failure values are formatted as
+    strings. Reports can be written to and read from Parquet and Arrow IPC
+    files.
+    """
+
+    def __init__(self, failures: pd.DataFrame, n_rows: int) -> None:
+        """Initialize a validation report.
+
+        :param failures: dataframe with one row per schema error, with the
+            columns of :data:`REPORT_DTYPES`. ``examples`` holds lists of
+            failure values formatted as strings, and ``duration`` holds the
+            time in seconds spent in the check, if it was measured.
+        :param n_rows: number of validated rows.
+        """
+        failures = failures.reindex(columns=list(REPORT_DTYPES))
+        self.failures = failures.astype(REPORT_DTYPES)
+        self.n_rows = n_rows
+
+    @classmethod
+    def from_summary(
+        cls,
+        summary: ValidationSummary,
+        profile: Optional[ValidationProfile] = None,
+    ) -> "ValidationReport":
+        """Create a report from a summary of validation.
+
+        :param summary: summary returned by
+            :meth:`~pandera.schemas.DataFrameSchema.validate_summary`.
+        :param profile: profile of the validation, used to report the time
+            spent in each failing check.
+        """
+        failures = summary.failures.copy()
+        failures["column"] = failures["column"].map(_as_string)
+        failures["examples"] = [
+            [_as_string(value) for value in examples]
+            for examples in failures["examples"]
+        ]
+        if profile is not None:
+            failures["duration"] = _check_durations(failures, profile)
+        return cls(failures, summary.n_rows)
+
+    @classmethod
+    def from_schema_errors(
+        cls,
+        schema_errors: errors.SchemaErrors,
+        n_examples: int = constants.N_REPORT_EXAMPLES,
+        random_state: Optional[int] = None,
+        profile: Optional[ValidationProfile] = None,
+    ) -> "ValidationReport":
+        """Create a report from the errors of lazy validation.
+
+        :param schema_errors: errors raised by lazy validation.
+        :param n_examples: maximum number of failure values sampled per
+            error.
+        :param random_state: random seed for sampling failure values.
+        :param profile: profile of the validation, used to report the time
+            spent in each failing check.
+        """
+        n_rows = 0 if schema_errors.data is None else len(schema_errors.data)
+        return cls.from_summary(
+            ValidationSummary(
+                schema_errors.data,
+                summarize_errors(
+                    schema_errors.schema_errors,
+                    n_rows,
+                    n_examples=n_examples,
+                    random_state=random_state,
+                ),
+                n_rows,
+            ),
+            profile,
+        )
+
+    @property
+    def passed(self) -> bool:
+        """Whether the data passed validation."""
+        return self.failures.empty
+
+    def to_arrow(self):
+        """Convert the report into a :class:`pyarrow.Table`.
+
+        The number of validated rows is kept in the metadata of the table.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+
+        return pyarrow.Table.from_pandas(
+            self.failures, schema=_arrow_schema(), preserve_index=False
+        ).replace_schema_metadata(
+            {_N_ROWS_METADATA_KEY: str(self.n_rows).encode()}
+        )
+
+    @classmethod
+    def from_arrow(cls, table) -> "ValidationReport":
+        """Create a report from a :class:`pyarrow.Table`.
+
+        :param table: table returned by :meth:`to_arrow`.
+        """
+        metadata = table.schema.metadata or {}
+        failures = table.to_pandas(types_mapper=_pandas_type)
+        failures["examples"] = [
+            examples if examples is None else list(examples)
+            for examples in failures["examples"]
+        ]
+        return cls(failures, int(metadata.get(_N_ROWS_METADATA_KEY, 0)))
+
+    def to_parquet(self, path: Union[str, Path], **kwargs) -> None:
+        """Write the report to a Parquet file.
+
+        :param path: path of the file.
+        :param kwargs: keyword arguments passed to
+            :func:`pyarrow.parquet.write_table`.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow(), str(path), **kwargs)
+
+    @classmethod
+    def read_parquet(cls, path: Union[str, Path]) -> "ValidationReport":
+        """Read a report from a Parquet file.
+
+        :param path: path of the file.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet
+
+        return cls.from_arrow(pyarrow.parquet.read_table(str(path)))
+
+    def to_ipc(self, path: Union[str, Path]) -> None:
+        """Write the report to an Arrow IPC file.
+
+        :param path: path of the file.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+
+        table = self.to_arrow()
+        with pyarrow.OSFile(str(path), "wb") as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @classmethod
+    def read_ipc(cls, path: Union[str, Path]) -> "ValidationReport":
+        """Read a report from an Arrow IPC file.
+
+        The file is memory-mapped, so the data isn't copied when it's read.
+
+        :param path: path of the file.
+        """
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+
+        with pyarrow.memory_map(str(path), "r") as source:
+            return cls.from_arrow(pyarrow.ipc.open_file(source).read_all())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} n_rows={self.n_rows}, "
+            f"n_errors={len(self.failures)}, passed={self.passed}>"
+        )
+
+
+def _check_durations(
+    failures: pd.DataFrame, profile: ValidationProfile
+) -> List[Optional[float]]:
+    """Total time spent in the check of each failure, if it was measured."""
+    durations = {
+        _duration_key(*key): duration
+        for *key, duration in profile.by_check()[
+            ["schema_context", "column", "check", "check_number", "duration"]
+        ].itertuples(index=False)
+    }
+    return [
+        durations.get(_duration_key(*key))
+        for key in failures[
+            ["schema_context", "column", "check", "check_number"]
+        ].itertuples(index=False)
+    ]
+
+
+def _duration_key(schema_context, column, check, check_number):
+    """Key matching the failures of a report with the checks of a profile,
+    in which missing values are NaN or NA."""
+
+    def _missing(value) -> bool:
+        # pylint: disable=comparison-with-itself
+        return value is None or value is pd.NA or value != value
+
+    return (
+        schema_context,
+        None if _missing(column) else _as_string(column),
+        None if _missing(check) else check,
+        None if _missing(check_number) else int(check_number),
+    )
+
+
+def _pandas_type(arrow_type):
+    """Pandas data types of the string and integer columns of reports."""
+    # pylint: disable=import-outside-toplevel
+    import pyarrow
+
+    return {
+        pyarrow.string(): pd.StringDtype(),
+        pyarrow.int64(): pd.Int64Dtype(),
+    }.get(arrow_type)
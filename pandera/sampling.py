@@ -0,0 +1,441 @@
+"""Validate a random sample of the rows of a dataframe.
+
+Validating a sample of rows can't guarantee that all rows are valid, but it
+can estimate the fraction of rows that fail each check. The estimates come
+with confidence intervals, and the sample can grow until the intervals are
+narrow enough.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import errors
+from .errors import _check_identifier
+from .schema_components import MultiIndex
+from .schemas import DataFrameSchema
+
+FAILURE_RATE_COLUMNS = [
+    "schema_context",
+    "column",
+    "check",
+    "check_number",
+    "n_failed",
+    "failure_rate",
+    "lower",
+    "upper",
+]
+
+
+def _normal_quantile(probability: float) -> float:
+    """Quantile of the standard normal distribution, found by bisecting its
+    cumulative distribution function."""
+    low, high = -10.0, 10.0
+    for _ in range(64):
+        middle = (low + high) / 2
+        if (1 + math.erf(middle / math.sqrt(2))) / 2 < probability:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def _confidence_interval(
+    n_failed: int, sample_size: int, population_size: int, z_score: float
+) -> Tuple[float, float]:
+    """Wilson score interval of a failure rate.
+
+    Samples are drawn without replacement, so the interval is corrected for
+    the size of the population: it shrinks to the observed failure rate when
+    the sample is the whole population.
+    """
+    if sample_size == 0:
+        return 0.0, 1.0
+    rate = n_failed / sample_size
+    if sample_size >= population_size:
+        return rate, rate
+    # effective sample size with the finite population correction
+    effective_size = (
+        sample_size * (population_size - 1) / (population_size - sample_size)
+    )
+    variance = rate * (1 - rate) / effective_size
+    denominator = 1 + z_score ** 2 / effective_size
+    center = (rate + z_score ** 2 / (2 * effective_size)) / denominator
+    half_width = (
+        z_score
+        * np.sqrt(variance + z_score ** 2 / (4 * effective_size ** 2))
+        / denominator
+    )
+    return max(center - half_width, 0.0), min(center + half_width, 1.0)
+
+
+def _failure_rate_row(
+    component: Tuple,
+    n_failed: Optional[int],
+    sample_size: int,
+    population_size: int,
+    z_score: float,
+) -> Tuple:
+    """Row of the failure rates of a schema component's check."""
+    if n_failed is None:
+        return (*component, None, np.nan, np.nan, np.nan)
+    return (
+        *component,
+        n_failed,
+        n_failed / sample_size if sample_size else 0.0,
+        *_confidence_interval(n_failed, sample_size, population_size, z_score),
+    )
+
+
+def _n_failed_rows(error: errors.SchemaError, n_rows: int) -> Optional[int]:
+    """Number of rows that failed a check, or None if the error doesn't
+    concern individual rows."""
+    check_output = error.check_output
+    if (
+        isinstance(check_output, pd.Series)
+        and check_output.dtype == bool
+        and len(check_output) == n_rows
+    ):
+        return int(n_rows - check_output.sum())
+    failure_cases = error.failure_cases
+    if (
+        isinstance(failure_cases, pd.DataFrame)
+        and "index" in failure_cases
+        and failure_cases["index"].notna().any()
+    ):
+        return failure_cases["index"].nunique()
+    return None
+
+
+def _allocate(counts: np.ndarray, size: int) -> np.ndarray:
+    """Allocate a sample size to strata proportionally to their sizes, with
+    the largest remainder method."""
+    quotas = counts * size / counts.sum()
+    allocation = np.floor(quotas).astype(np.int64)
+    remainder = size - allocation.sum()
+    allocation[np.argsort(allocation - quotas, kind="stable")[:remainder]] += 1
+    return allocation
+
+
+class SamplingReport:
+    """Failure rates of the checks of a schema, estimated from a sample."""
+
+    def __init__(
+        self,
+        failure_rates: pd.DataFrame,
+        population_size: int,
+        positions: np.ndarray,
+        confidence: float,
+        schema_errors: Optional[errors.SchemaErrors] = None,
+    ) -> None:
+        """Initialize a sampling report.
+
+        :param failure_rates: dataframe with one row per check, with the
+            number of sampled rows that failed the check, the estimated
+            failure rate and the lower and upper bounds of its confidence
+            interval. Errors that don't concern individual rows, like a
+            wrong data type, have missing failure rates.
+        :param population_size: number of rows the sample was drawn from.
+        :param positions: positional indices of the sampled rows.
+        :param confidence: confidence level of the intervals.
+        :param schema_errors: errors found in the sample, if any.
+        """
+        self.failure_rates = failure_rates
+        self.population_size = population_size
+        self.positions = positions
+        self.confidence = confidence
+        self.schema_errors = schema_errors
+
+    @property
+    def sample_size(self) -> int:
+        """Number of sampled rows."""
+        return len(self.positions)
+
+    @property
+    def passed(self) -> bool:
+        """Whether the sample passed validation."""
+        return self.schema_errors is None
+
+    @property
+    def max_error(self) -> float:
+        """Largest half-width of the confidence intervals."""
+        half_widths = (
+            self.failure_rates["upper"] - self.failure_rates["lower"]
+        ) / 2
+        return float(half_widths.max()) if half_widths.notna().any() else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} sample_size={self.sample_size}, "
+            f"population_size={self.population_size}, "
+            f"passed={self.passed}>"
+        )
+
+
+class SamplingValidator:
+    """Validate a random sample of the rows of a dataframe.
+
+    Rows are sampled by position, so dataframes with duplicated rows or index
+    labels are sampled correctly. The sampled rows are validated with the
+    schema, and the fraction of rows that fail each check in the population
+    is estimated with a confidence interval.
+
+    If ``max_error`` is given, the sample size is doubled until the
+    confidence intervals of all checks are within ``max_error`` of their
+    estimates, or until ``max_sample_size`` is reached.
+    """
+
+    def __init__(
+        self,
+        schema: DataFrameSchema,
+        sample_size: int = 1000,
+        max_error: Optional[float] = None,
+        max_sample_size: Optional[int] = None,
+        confidence: float = 0.95,
+        strata: Optional[Union[str, List[str]]] = None,
+        random_state: Optional[int] = None,
+    ) -> None:
+        """Initialize a sampling validator.
+
+        :param schema: dataframe schema to validate samples with.
+        :param sample_size: initial number of rows to sample.
+        :param max_error: target half-width of the confidence intervals of
+            the failure rates. If None, a single sample is validated.
+        :param max_sample_size: maximum number of rows to sample when
+            growing the sample. If None, the sample can grow to the whole
+            dataframe.
+        :param confidence: confidence level of the intervals.
+        :param strata: column or columns to stratify the sample by. Each
+            stratum is sampled proportionally to its size, so that small
+            strata are represented in the sample.
+        :param random_state: random seed for sampling rows.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError(
+                f"confidence must be between 0 and 1, found {confidence}"
+            )
+        self.schema = schema
+        self.sample_size = sample_size
+        self.max_error = max_error
+        self.max_sample_size = max_sample_size
+        self.confidence = confidence
+        self.strata = [strata] if isinstance(strata, str) else strata
+        # pylint: disable=no-member
+        self._random_state = np.random.RandomState(random_state)
+        self._z = _normal_quantile((1 + confidence) / 2)
+
+    def _sampler(self, check_obj: pd.DataFrame):
+        """Get a function that returns the positions of a sample of rows.
+
+        Samples of increasing sizes are nested, so that growing the sample
+        only adds rows to it.
+        """
+        ordering = self._random_state.permutation(len(check_obj))
+        if self.strata is None:
+            return lambda size: np.sort(ordering[:size])
+
+        strata_codes = check_obj.groupby(
+            self.strata, sort=False, dropna=False
+        ).ngroup()
+        codes = strata_codes.to_numpy()[ordering]
+        # positions in random order, grouped by stratum
+        ordering = ordering[np.argsort(codes, kind="stable")]
+        counts = np.bincount(codes)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+        def sample(size: int) -> np.ndarray:
+            allocation = _allocate(counts, size)
+            return np.sort(
+                np.concatenate(
+                    [
+                        ordering[start : start + n]
+                        for start, n in zip(starts, allocation)
+                    ]
+                )
+            )
+
+        return sample
+
+    def _components(self, check_obj: pd.DataFrame) -> List[Tuple]:
+        """Keys of the checks of the schema, as in the failure cases of
+        ``SchemaErrors``."""
+        keys: List[Tuple] = []
+        for column_name, column in self.schema.columns.items():
+            names: Iterable[Any] = [column_name]
+            if column.regex:
+                try:
+                    names = column.get_regex_columns(check_obj.columns)
+                except (errors.SchemaError, IndexError):
+                    names = []
+            for name in names:
+                keys.extend(
+                    (type(column).__name__, name, _check_identifier(check), i)
+                    for i, check in enumerate(column.checks)
+                )
+        index = self.schema.index
+        if index is None:
+            indexes = []
+        elif isinstance(index, MultiIndex):
+            indexes = index.indexes
+        else:
+            indexes = [index]
+        for index_component in indexes:
+            keys.extend(
+                (
+                    type(index_component).__name__,
+                    index_component.name,
+                    _check_identifier(check),
+                    i,
+                )
+                for i, check in enumerate(index_component.checks)
+            )
+        keys.extend(
+            (type(self.schema).__name__, None, _check_identifier(check), i)
+            for i, check in enumerate(self.schema.checks)
+        )
+        return keys
+
+    def _validate_sample(
+        self,
+        sample: pd.DataFrame,
+        positions: np.ndarray,
+        population_size: int,
+    ) -> SamplingReport:
+        schema_errors = None
+        try:
+            self.schema.validate(sample, lazy=True, inplace=True)
+        except errors.SchemaErrors as exc:
+            schema_errors = exc
+
+        n_failed: Dict[Tuple, Optional[int]] = dict.fromkeys(
+            self._components(sample), 0
+        )
+        for error_dict in (
+            [] if schema_errors is None else schema_errors.schema_errors
+        ):
+            error = error_dict["error"]
+            key = (
+                type(error.schema).__name__,
+                (
+                    None
+                    if isinstance(error.schema, DataFrameSchema)
+                    else error.schema.name
+                ),
+                _check_identifier(error.check),
+                error.check_index,
+            )
+            n_failed_rows = _n_failed_rows(error, len(sample))
+            n_failed_key = n_failed.get(key, 0)
+            if n_failed_rows is None or n_failed_key is None:
+                n_failed[key] = None
+            else:
+                n_failed[key] = n_failed_key + n_failed_rows
+
+        rows = [
+            _failure_rate_row(
+                component,
+                n_component_failed,
+                len(sample),
+                population_size,
+                self._z,
+            )
+            for component, n_component_failed in n_failed.items()
+        ]
+        failure_rates = pd.DataFrame(rows, columns=FAILURE_RATE_COLUMNS)
+        failure_rates["n_failed"] = failure_rates["n_failed"].astype("Int64")
+        return SamplingReport(
+            failure_rates,
+            population_size,
+            positions,
+            self.confidence,
+            schema_errors,
+        )
+
+    def validate(self, check_obj: pd.DataFrame) -> SamplingReport:
+        """Validate a random sample of the rows of a dataframe.
+
+        :param check_obj: dataframe to sample rows from.
+        :returns: report of the estimated failure rates of the checks.
+        """
+        population_size = len(check_obj)
+        max_sample_size = (
+            population_size
+            if self.max_sample_size is None
+            else min(self.max_sample_size, population_size)
+        )
+        sample = self._sampler(check_obj)
+        sample_size = min(self.sample_size, max_sample_size)
+        while True:
+            positions = sample(sample_size)
+            report = self._validate_sample(
+                check_obj.iloc[positions], positions, population_size
+            )
+            if (
+                self.max_error is None
+                or report.max_error <= self.max_error
+                or sample_size >= max_sample_size
+            ):
+                return report
+            sample_size = min(2 * max(sample_size, 1), max_sample_size)
+
+    def validate_stream(
+        self, dataframes: Iterable[pd.DataFrame]
+    ) -> SamplingReport:
+        """Validate a random sample of the rows of a stream of dataframes.
+
+        The rows are sampled uniformly in a single pass with reservoir
+        sampling, so the size of the stream doesn't need to be known in
+        advance and memory usage is bounded by ``sample_size``. The sample
+        can't grow after the stream is consumed, so ``max_error`` and
+        ``strata`` aren't used.
+
+        :param dataframes: iterable of dataframes with the same columns.
+        :returns: report of the estimated failure rates of the checks.
+        """
+        sample: Optional[pd.DataFrame] = None
+        positions = np.array([], dtype=np.int64)
+        n_rows = 0
+        for dataframe in dataframes:
+            batch_positions = np.arange(n_rows, n_rows + len(dataframe))
+            n_rows += len(dataframe)
+            # row t of the stream fills slot t of the reservoir, or
+            # replaces a random slot with probability sample_size / (t + 1)
+            slots = np.where(
+                batch_positions < self.sample_size,
+                batch_positions,
+                self._random_state.randint(0, batch_positions + 1),
+            )
+            taken = np.flatnonzero(slots < self.sample_size)
+            # later rows replace earlier rows assigned to the same slot
+            taken_slots, last = np.unique(
+                slots[taken][::-1], return_index=True
+            )
+            taken = taken[::-1][last]
+
+            kept = np.ones(len(positions), dtype=bool)
+            kept[taken_slots[taken_slots < len(positions)]] = False
+            new_rows = dataframe.iloc[taken]
+            sample = (
+                new_rows
+                if sample is None
+                else pd.concat([sample.iloc[np.flatnonzero(kept)], new_rows])
+            )
+            positions = np.concatenate(
+                [positions[kept], batch_positions[taken]]
+            )
+            # keep the slots of the reservoir aligned with its rows
+            slot_order = np.argsort(
+                np.concatenate([np.flatnonzero(kept), taken_slots]),
+                kind="stable",
+            )
+            sample = sample.iloc[slot_order]
+            positions = positions[slot_order]
+
+        if sample is None:
+            raise ValueError("cannot validate a sample of an empty stream")
+        order = np.argsort(positions, kind="stable")
+        return self._validate_sample(
+            sample.iloc[order], positions[order], n_rows
+        )
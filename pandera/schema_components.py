@@ -1,13 +1,15 @@
 """Components used in pandera schemas."""
 
 import warnings
-from copy import copy, deepcopy
+from concurrent.futures import Executor
+from copy import copy as shallow_copy
+from copy import deepcopy
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
-from . import errors
+from . import errors, profiling
 from . import strategies as st
 from .deprecations import deprecate_pandas_dtype
 from .error_handlers import SchemaErrorHandler
@@ -16,6 +18,7 @@ from .schemas import (
     DataFrameSchema,
     PandasDtypeInputTypes,
     SeriesSchemaBase,
+    _requires_coercion,
 )
 
 
@@ -162,6 +165,7 @@ class Column(SeriesSchemaBase):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> pd.DataFrame:
         """Validate a Column in a DataFrame object.
 
@@ -178,10 +182,15 @@ class Column(SeriesSchemaBase):
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy. Columns that are changed by
+            coercion are replaced in the shallow copy, so the object of
+            validation is never modified and unchanged columns share memory
+            with it.
         :returns: validated DataFrame.
         """
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = check_obj.copy(deep=copy)
 
         if self._name is None:
             raise errors.SchemaError(
@@ -193,14 +202,15 @@ class Column(SeriesSchemaBase):
             )
 
         def validate_column(check_obj, column_name):
-            super(Column, copy(self).set_name(column_name)).validate(
+            super(Column, shallow_copy(self).set_name(column_name)).validate(
                 check_obj,
                 head,
                 tail,
                 sample,
                 random_state,
                 lazy,
-                inplace=inplace,
+                # the dataframe has already been copied
+                inplace=True,
             )
 
         column_keys_to_check = (
@@ -210,10 +220,20 @@ class Column(SeriesSchemaBase):
         )
 
         for column_name in column_keys_to_check:
-            if self.coerce:
-                check_obj.loc[:, column_name] = self.coerce_dtype(
-                    check_obj.loc[:, column_name]
-                )
+            if self.coerce and _requires_coercion(
+                self.dtype, check_obj[column_name]
+            ):
+                # replace the column instead of overwriting its values so that
+                # data shared with other dataframes is never modified.
+                with profiling.measure(
+                    self,
+                    f"coerce_dtype('{self.dtype}')",
+                    n_rows=len(check_obj),
+                    column=column_name,
+                ):
+                    check_obj[column_name] = self.coerce_dtype(
+                        check_obj[column_name]
+                    )
             if isinstance(check_obj[column_name], pd.DataFrame):
                 for i in range(check_obj[column_name].shape[1]):
                     validate_column(
@@ -349,6 +369,7 @@ class Index(SeriesSchemaBase):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> Union[pd.DataFrame, pd.Series]:
         """Validate DataFrameSchema or SeriesSchema Index.
 
@@ -365,6 +386,8 @@ class Index(SeriesSchemaBase):
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy.
         :returns: validated DataFrame or Series.
         """
         if isinstance(check_obj.index, pd.MultiIndex):
@@ -393,6 +416,7 @@ class Index(SeriesSchemaBase):
                 random_state,
                 lazy,
                 inplace,
+                copy,
             ),
             pd.Series,
         )
@@ -552,10 +576,13 @@ class MultiIndex(DataFrameSchema):
         """Set coerce attribute."""
         self._coerce = value
 
-    def coerce_dtype(self, obj: pd.MultiIndex) -> pd.MultiIndex:
+    def coerce_dtype(  # pylint:disable=unused-argument
+        self, obj: pd.MultiIndex, inplace: bool = False
+    ) -> pd.MultiIndex:
         """Coerce type of a pd.Series by type specified in dtype.
 
         :param obj: multi-index to coerce.
+        :param inplace: ignored, since indexes are immutable.
         :returns: ``MultiIndex`` with coerced data type
         """
         error_handler = SchemaErrorHandler(lazy=True)
@@ -602,6 +629,9 @@ class MultiIndex(DataFrameSchema):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> Union[pd.DataFrame, pd.Series]:
         """Validate DataFrame or Series MultiIndex.
 
@@ -618,6 +648,12 @@ class MultiIndex(DataFrameSchema):
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy.
+        :param n_jobs: number of threads used to validate index levels
+            concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            index levels concurrently.
         :returns: validated DataFrame or Series.
         """
         # pylint: disable=too-many-locals
@@ -684,6 +720,9 @@ class MultiIndex(DataFrameSchema):
                 random_state,
                 lazy,
                 inplace,
+                copy,
+                n_jobs,
+                executor,
             )
         except errors.SchemaErrors as err:
             # This is a hack to re-raise the SchemaErrors exception and change
@@ -695,7 +734,7 @@ class MultiIndex(DataFrameSchema):
                 error = errors.SchemaError(
                     self,
                     check_obj,
-                    error.args[0],
+                    error.message,
                     error.failure_cases.assign(column=error.schema.name),
                     error.check,
                     error.check_index,
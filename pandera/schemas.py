@@ -1,20 +1,38 @@
 """Core pandera schema class definitions."""
 # pylint: disable=too-many-lines
 
-import copy
 import itertools
 import os
+import re
 import traceback
 import warnings
-from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack
+from copy import copy as shallow_copy
+from copy import deepcopy
+from functools import partial, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
 
-from . import errors
+from . import callbacks, check_utils, errors, profiling
 from . import strategies as st
+from . import vectorized_checks
 from .checks import Check
 from .deprecations import deprecate_pandas_dtype
 from .dtypes import DataType
@@ -26,9 +44,12 @@ from .error_formatters import (
     scalar_failure_case,
 )
 from .error_handlers import SchemaErrorHandler
+from .failure_cases import CheckFailureCases, failure_positions
 from .hypotheses import Hypothesis
+from .reports import ValidationSummary, summarize_errors, summarize_validation
 
 N_INDENT_SPACES = 4
+VALIDATION_PLAN_CACHE_SIZE = 32
 
 CheckList = Optional[
     Union[Union[Check, Hypothesis], List[Union[Check, Hypothesis]]]
@@ -63,9 +84,195 @@ def _inferred_schema_guard(method):
     return _wrapper
 
 
+# numbers of the versions of the state of schemas and schema components
+_STATE_VERSION_NUMBERS = itertools.count()
+
+
+class _StateVersion:
+    """Version of the state of a schema or schema component.
+
+    A new version is assigned whenever an attribute of the schema is set.
+    Version numbers are never reused, even by copies of the schema, so that
+    validation plans built for a previous state are never returned. Like the
+    validation plan cache, versions don't affect the equality of schemas.
+    """
+
+    def __init__(self) -> None:
+        self.number = next(_STATE_VERSION_NUMBERS)
+
+    def __reduce__(self):
+        return type(self), ()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StateVersion)
+
+
+def _set_versioned_attribute(obj: Any, name: str, value: Any) -> None:
+    """Set an attribute of a schema and assign a new state version."""
+    object.__setattr__(obj, name, value)
+    object.__setattr__(obj, "_state_version", _StateVersion())
+
+
+class _ValidationPlan:  # pylint: disable=too-few-public-methods
+    """Setup work of dataframe validation that only depends on the schema and
+    on the columns of the dataframe.
+    """
+
+    def __init__(self, schema: "DataFrameSchema", columns: pd.Index) -> None:
+        # regex column name -> matched columns, or None if nothing matched
+        self.regex_matches: Dict[Any, Optional[pd.Index]] = {}
+        self.components: List[Any] = []
+        column_names = self._resolve_components(schema, columns)
+
+        # ordered "set" of columns
+        self.column_names = list(dict.fromkeys(column_names))
+        self.expanded_column_names = frozenset(column_names)
+
+        # drop adjacent duplicated column names
+        self.columns = (
+            [k for k, _ in itertools.groupby(columns)]
+            if columns.has_duplicates
+            else columns
+        )
+
+        # the data types of the columns with nothing else to validate are
+        # checked together, in a single pass over the data types of the
+        # dataframe, unless column names are duplicated. These columns are
+        # then not validated separately.
+        self.dtype_components: List[Any] = []
+        if not columns.has_duplicates:
+            self._split_dtype_components(schema)
+
+    def _resolve_components(
+        self, schema: "DataFrameSchema", columns: pd.Index
+    ) -> List[Any]:
+        """Resolve the schema components that validate the columns of the
+        dataframe, and return the names of the columns they match."""
+        column_names: List[Any] = []
+        for col_name, col in schema.columns.items():
+            matched_columns = None
+            if col.regex:
+                try:
+                    matched_columns = col.get_regex_columns(columns)
+                except errors.SchemaError:
+                    matched_columns = None
+                self.regex_matches[col_name] = matched_columns
+                if matched_columns is not None:
+                    column_names.extend(matched_columns)
+            elif col_name in columns:
+                column_names.append(col_name)
+            else:
+                continue
+
+            if not col.required and col_name not in columns:
+                continue
+            if schema.dtype is not None:
+                # override column dtype with dataframe dtype
+                col = shallow_copy(col)
+                col.dtype = schema.dtype
+            if col.regex and matched_columns is not None:
+                # resolve the regex pattern once instead of on every
+                # validation of the column.
+                for matched_colname in matched_columns:
+                    matched_col = shallow_copy(col)
+                    matched_col._regex = False
+                    matched_col.set_name(matched_colname)
+                    self.components.append(matched_col)
+            else:
+                self.components.append(col)
+        return column_names
+
+    def _split_dtype_components(self, schema: "DataFrameSchema") -> None:
+        """Mark the components whose data type is all there is to validate,
+        so that their data types are checked together by the dataframe
+        schema. The components keep their position, so that their errors are
+        reported in the order of the columns."""
+        components = []
+        for component in self.components:
+            # regex columns without matches are validated separately, which
+            # reports that they didn't match
+            if (
+                component.dtype is not None
+                and not component.regex
+                and _checks_dtype_only(schema, component)
+            ):
+                component = shallow_copy(component)
+                component._dtype_checked_by_dataframe = True
+                self.dtype_components.append(component)
+            components.append(component)
+        self.components = components
+
+
+class _ValidationPlanCache:
+    """Least-recently-used cache of validation plans.
+
+    The cache is transparent to the schema that holds it: copies of the cache
+    are empty and all caches compare equal.
+    """
+
+    def __init__(self, maxsize: int = VALIDATION_PLAN_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._plans: "OrderedDict[Any, _ValidationPlan]" = OrderedDict()
+
+    def get(
+        self, schema: "DataFrameSchema", check_obj: pd.DataFrame
+    ) -> _ValidationPlan:
+        """Get the validation plan of a schema for a dataframe.
+
+        Plans are keyed by the columns and data types of the dataframe, and
+        by the state versions of the schema and its columns, so that
+        modifying the schema never returns a stale plan. Lists of checks can
+        be modified in place, without setting an attribute: plans only
+        depend on them through whether columns have checks.
+        """
+        key = (
+            tuple(check_obj.columns),
+            tuple(check_obj.dtypes),
+            schema._state_version.number,
+            tuple(
+                (col_name, col._state_version.number, bool(col.checks))
+                for col_name, col in schema.columns.items()
+            ),
+        )
+        try:
+            plan = self._plans.pop(key)
+        except KeyError:
+            plan = _ValidationPlan(schema, check_obj.columns)
+        except TypeError:
+            # unhashable column names or data types
+            return _ValidationPlan(schema, check_obj.columns)
+        self._plans[key] = plan
+        if len(self._plans) > self.maxsize:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        """Remove all validation plans from the cache."""
+        self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def __copy__(self) -> "_ValidationPlanCache":
+        return type(self)(self.maxsize)
+
+    def __deepcopy__(self, memo) -> "_ValidationPlanCache":
+        return type(self)(self.maxsize)
+
+    def __reduce__(self):
+        return type(self), (self.maxsize,)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ValidationPlanCache)
+
+
 class DataFrameSchema:  # pylint: disable=too-many-public-methods
     """A light-weight pandas DataFrame validator."""
 
+    # version of the state of the schema, assigned whenever an attribute is
+    # set
+    _state_version: _StateVersion
+
     @deprecate_pandas_dtype
     def __init__(
         self,
@@ -80,6 +287,8 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         ordered: bool = False,
         pandas_dtype: PandasDtypeInputTypes = None,
         unique: Optional[Union[str, List[str]]] = None,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
     ) -> None:
         """Initialize DataFrameSchema validator.
 
@@ -116,6 +325,12 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             .. warning:: This option will be deprecated in 0.8.0
 
         :param unique: a list of columns that should be jointly unique.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently. A negative value uses
+            ``os.cpu_count() + 1 + n_jobs`` threads.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently. Takes
+            precedence over ``n_jobs``.
 
         :raises SchemaInitError: if impossible to build schema from parameters
         :raises SchemaInitError: if ``dtype`` and ``pandas_dtype`` are both
@@ -187,6 +402,8 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         self._coerce = coerce
         self._ordered = ordered
         self._unique = unique
+        self.n_jobs = n_jobs
+        self.executor = executor
         self._validate_schema()
         self._set_column_names()
 
@@ -194,6 +411,11 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         # set to True in the case that a schema is created by infer_schema.
         self._IS_INFERRED = False
 
+        self._validation_plans = _ValidationPlanCache()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _set_versioned_attribute(self, name, value)
+
     @property
     def coerce(self) -> bool:
         """Whether to coerce series to specified type."""
@@ -248,6 +470,31 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                         "specified in the DataFrameSchema."
                     )
 
+        if not self.columns:
+            return
+        regex_column_names = [
+            column_name
+            for column_name, column in self.columns.items()
+            if column.regex and isinstance(column_name, str)
+        ]
+        for check in self.checks:
+            if check.dataframe_expression is None:
+                continue
+            nonexistent_columns = [
+                c
+                for c in sorted(check.dataframe_expression.columns)
+                if c not in self.columns
+                and not any(
+                    re.match(pattern, c) for pattern in regex_column_names
+                )
+            ]
+            if nonexistent_columns:
+                raise errors.SchemaInitError(
+                    f"columns {nonexistent_columns} in expression "
+                    f"'{check.dataframe_expression.expr}' of Check {check} "
+                    "not specified in the DataFrameSchema."
+                )
+
     def _set_column_names(self) -> None:
         def _set_column_handler(column, column_name):
             if column.name is not None and column.name != column_name:
@@ -337,54 +584,103 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 ),
                 failure_cases=exc.failure_cases,
                 check=f"coerce_dtype('{self.dtype}')",
+                check_output=exc.check_output,
             ) from exc
 
-    def coerce_dtype(self, obj: pd.DataFrame) -> pd.DataFrame:
+    def _columns_to_coerce(
+        self, obj: pd.DataFrame
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Yield the column schemas and names of the columns to coerce."""
+        plan = self._validation_plans.get(self, obj)
+        for colname, col_schema in self.columns.items():
+            if col_schema.regex:
+                matched_columns = plan.regex_matches[colname]
+                if matched_columns is None:
+                    matched_columns = pd.Index([])
+
+                for matched_colname in matched_columns:
+                    if col_schema.coerce or self.coerce:
+                        yield col_schema, matched_colname
+            elif (
+                (col_schema.coerce or self.coerce)
+                and self.dtype is None
+                and colname in obj
+            ):
+                yield col_schema, colname
+
+    def coerce_dtype(
+        self, obj: pd.DataFrame, inplace: bool = False
+    ) -> pd.DataFrame:
         """Coerce dataframe to the type specified in dtype.
 
         :param obj: dataframe to coerce.
+        :param inplace: if True, assign the coerced columns and index to
+            ``obj`` one at a time. Otherwise, the coerced columns replace the
+            columns of ``obj`` in a new dataframe built at once, which is much
+            faster for wide dataframes, and ``obj`` isn't modified.
         :returns: dataframe with coerced dtypes
         """
         error_handler = SchemaErrorHandler(lazy=True)
+        # coerced columns by position in the dataframe
+        coerced_columns: Dict[int, pd.Series] = {}
 
-        def _try_coercion(coerce_fn, obj):
+        def _try_coercion(schema, coerce_fn, obj, column=None):
             try:
-                return coerce_fn(obj)
+                with profiling.measure(
+                    schema,
+                    f"coerce_dtype('{schema.dtype}')",
+                    n_rows=len(obj),
+                    column=column,
+                ):
+                    return coerce_fn(obj)
             except errors.SchemaError as exc:
                 error_handler.collect_error("dtype_coercion_error", exc)
                 return obj
 
-        for colname, col_schema in self.columns.items():
-            if col_schema.regex:
-                try:
-                    matched_columns = col_schema.get_regex_columns(obj.columns)
-                except errors.SchemaError:
-                    matched_columns = pd.Index([])
+        def _coerce_column(col_schema, colname):
+            column = obj[colname]
+            if not _requires_coercion(col_schema.dtype, column):
+                return
+            coerced = _try_coercion(
+                col_schema, col_schema.coerce_dtype, column, colname
+            )
+            if coerced is column:
+                return
+            if inplace:
+                # replace the column instead of overwriting its values so
+                # that data shared with other dataframes is never modified.
+                obj[colname] = coerced
+            elif isinstance(coerced, pd.DataFrame):
+                # duplicate column names
+                positions = np.arange(obj.shape[1])[
+                    obj.columns.get_loc(colname)
+                ]
+                for position, (_, values) in zip(positions, coerced.items()):
+                    coerced_columns[position] = values
+            else:
+                coerced_columns[obj.columns.get_loc(colname)] = coerced
 
-                for matched_colname in matched_columns:
-                    if col_schema.coerce or self.coerce:
-                        obj[matched_colname] = _try_coercion(
-                            col_schema.coerce_dtype, obj[matched_colname]
-                        )
-            elif (
-                (col_schema.coerce or self.coerce)
-                and self.dtype is None
-                and colname in obj
-            ):
-                obj.loc[:, colname] = _try_coercion(
-                    col_schema.coerce_dtype, obj[colname]
-                )
+        for col_schema, colname in self._columns_to_coerce(obj):
+            _coerce_column(col_schema, colname)
+
+        to_coerce = obj
+        if coerced_columns:
+            obj = _replace_columns(obj, coerced_columns)
 
         if self.dtype is not None:
-            obj = _try_coercion(self._coerce_dtype, obj)
+            obj = _try_coercion(self, self._coerce_dtype, obj)
         if self.index is not None and (self.index.coerce or self.coerce):
-            index_schema = copy.deepcopy(self.index)
+            index_schema = deepcopy(self.index)
             if self.coerce:
                 # coercing at the dataframe-level should apply index coercion
                 # for both single- and multi-indexes.
                 index_schema._coerce = True
-            coerced_index = _try_coercion(index_schema.coerce_dtype, obj.index)
+            coerced_index = _try_coercion(
+                index_schema, index_schema.coerce_dtype, obj.index
+            )
             if coerced_index is not None:
+                if obj is to_coerce and not inplace:
+                    obj = obj.copy(deep=False)
                 obj.index = coerced_index
 
         if error_handler.collected_errors:
@@ -401,6 +697,9 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> pd.DataFrame:
         # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         """Check if all columns in a dataframe have a column in the Schema.
@@ -415,9 +714,23 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         :param random_state: random seed for the ``sample`` argument.
         :param lazy: if True, lazily evaluates dataframe against all validation
             checks and raises a ``SchemaErrors``. Otherwise, raise
-            ``SchemaError`` as soon as one occurs.
+            ``SchemaError`` as soon as one occurs. Built-in, expression and
+            element-wise checks then stop evaluating rows at the first block
+            of rows with failure cases, or at the block where
+            ``n_failure_cases`` failure cases are found if it's set.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy. Columns that are changed by
+            coercion are replaced in a new dataframe, so the object of
+            validation is never modified and unchanged columns share memory
+            with it.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently. Defaults to the ``n_jobs``
+            attribute of the schema.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently. Defaults to
+            the ``executor`` attribute of the schema.
         :returns: validated ``DataFrame``
 
         :raises SchemaError: when ``DataFrame`` violates built-in or custom
@@ -457,7 +770,6 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         4         0.80      dog
         5         0.76      dog
         """
-
         if self._is_inferred:
             warnings.warn(
                 f"This {type(self)} is an inferred schema that hasn't been "
@@ -468,97 +780,80 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             )
 
         error_handler = SchemaErrorHandler(lazy)
+        events = callbacks.phase_events(self, error_handler)
 
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = check_obj.copy(deep=copy)
 
         check_obj = check_obj.pandera.add_schema(self)
 
+        plan = self._validation_plans.get(self, check_obj)
+
         # dataframe strictness check makes sure all columns in the dataframe
         # are specified in the dataframe schema
         if self.strict or self.ordered:
-            column_names = []
-            for col_name, col_schema in self.columns.items():
-                if col_schema.regex:
-                    try:
-                        column_names.extend(
-                            col_schema.get_regex_columns(check_obj.columns)
+            with events.phase("strictness", check_obj):
+                sorted_column_names = iter(plan.column_names)
+                expanded_column_names = plan.expanded_column_names
+                for column in plan.columns:
+                    is_schema_col = column in expanded_column_names
+                    if (self.strict is True) and not is_schema_col:
+                        msg = (
+                            f"column '{column}' not in DataFrameSchema"
+                            f" {self.columns}"
                         )
-                    except errors.SchemaError:
-                        pass
-                elif col_name in check_obj.columns:
-                    column_names.append(col_name)
-            # ordered "set" of columns
-            sorted_column_names = iter(dict.fromkeys(column_names))
-            expanded_column_names = frozenset(column_names)
-
-            # drop adjacent duplicated column names
-            if check_obj.columns.has_duplicates:
-                columns = [k for k, _ in itertools.groupby(check_obj.columns)]
-            else:
-                columns = check_obj.columns
-
-            for column in columns:
-                is_schema_col = column in expanded_column_names
-                if (self.strict is True) and not is_schema_col:
+                        error_handler.collect_error(
+                            "column_not_in_schema",
+                            errors.SchemaError(
+                                self,
+                                check_obj,
+                                msg,
+                                failure_cases=scalar_failure_case(column),
+                                check="column_in_schema",
+                            ),
+                        )
+                    if self.strict == "filter" and not is_schema_col:
+                        check_obj.drop(labels=[column], inplace=True, axis=1)
+                    if self.ordered and is_schema_col:
+                        try:
+                            next_ordered_col = next(sorted_column_names)
+                        except StopIteration:
+                            pass
+                        if next_ordered_col != column:
+                            error_handler.collect_error(
+                                "column_not_ordered",
+                                errors.SchemaError(
+                                    self,
+                                    check_obj,
+                                    message=f"column '{column}' out-of-order",
+                                    failure_cases=scalar_failure_case(column),
+                                    check="column_ordered",
+                                ),
+                            )
+
+        # check for columns that are not in the dataframe. The validation plan
+        # doesn't validate them.
+        with events.phase("required_columns", check_obj):
+            for colname, col_schema in self.columns.items():
+                if (
+                    not col_schema.regex
+                    and colname not in check_obj
+                    and col_schema.required
+                ):
                     msg = (
-                        f"column '{column}' not in DataFrameSchema"
-                        f" {self.columns}"
+                        f"column '{colname}' not in dataframe\n"
+                        f"{check_obj.head()}"
                     )
                     error_handler.collect_error(
-                        "column_not_in_schema",
+                        "column_not_in_dataframe",
                         errors.SchemaError(
                             self,
                             check_obj,
                             msg,
-                            failure_cases=scalar_failure_case(column),
-                            check="column_in_schema",
+                            failure_cases=scalar_failure_case(colname),
+                            check="column_in_dataframe",
                         ),
                     )
-                if self.strict == "filter" and not is_schema_col:
-                    check_obj.drop(labels=[column], inplace=True, axis=1)
-                if self.ordered and is_schema_col:
-                    try:
-                        next_ordered_col = next(sorted_column_names)
-                    except StopIteration:
-                        pass
-                    if next_ordered_col != column:
-                        error_handler.collect_error(
-                            "column_not_ordered",
-                            errors.SchemaError(
-                                self,
-                                check_obj,
-                                message=f"column '{column}' out-of-order",
-                                failure_cases=scalar_failure_case(column),
-                                check="column_ordered",
-                            ),
-                        )
-
-        # check for columns that are not in the dataframe and collect columns
-        # that are not in the dataframe that should be excluded for lazy
-        # validation
-        lazy_exclude_columns = []
-        for colname, col_schema in self.columns.items():
-            if (
-                not col_schema.regex
-                and colname not in check_obj
-                and col_schema.required
-            ):
-                if lazy:
-                    lazy_exclude_columns.append(colname)
-                msg = (
-                    f"column '{colname}' not in dataframe\n{check_obj.head()}"
-                )
-                error_handler.collect_error(
-                    "column_not_in_dataframe",
-                    errors.SchemaError(
-                        self,
-                        check_obj,
-                        msg,
-                        failure_cases=scalar_failure_case(colname),
-                        check="column_in_dataframe",
-                    ),
-                )
 
         # coerce data types
         if (
@@ -566,29 +861,24 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             or (self.index is not None and self.index.coerce)
             or any(col.coerce for col in self.columns.values())
         ):
-            try:
-                check_obj = self.coerce_dtype(check_obj)
-            except errors.SchemaErrors as err:
-                for schema_error_dict in err.schema_errors:
-                    if not lazy:
-                        # raise the first error immediately if not doing lazy
-                        # validation
-                        raise schema_error_dict["error"]
-                    error_handler.collect_error(
-                        "schema_component_check", schema_error_dict["error"]
-                    )
+            with events.phase("coercion", check_obj):
+                try:
+                    check_obj = self.coerce_dtype(check_obj, inplace=inplace)
+                except errors.SchemaErrors as err:
+                    check_obj = err.data
+                    for schema_error_dict in err.schema_errors:
+                        if not lazy:
+                            # raise the first error immediately if not doing
+                            # lazy validation
+                            raise schema_error_dict["error"]
+                        error_handler.collect_error(
+                            "schema_component_check",
+                            schema_error_dict["error"],
+                        )
+                check_obj = check_obj.pandera.add_schema(self)
 
         # collect schema components for validation
-        schema_components = []
-        for col_name, col in self.columns.items():
-            if (
-                col.required or col_name in check_obj
-            ) and col_name not in lazy_exclude_columns:
-                if self.dtype is not None:
-                    # override column dtype with dataframe dtype
-                    col = copy.deepcopy(col)
-                    col.dtype = self.dtype
-                schema_components.append(col)
+        schema_components = list(plan.components)
 
         if self.index is not None:
             schema_components.append(self.index)
@@ -597,35 +887,61 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             check_obj, head, tail, sample, random_state
         )
 
-        check_results = []
-        # schema-component-level checks
-        for schema_component in schema_components:
-            try:
-                result = schema_component(
+        # schema-component-level checks and dataframe-level checks. Schema
+        # components that coerce data modify the dataframe, so they can't run
+        # concurrently with other checks.
+        dtype_results = _check_dtypes(plan.dtype_components, df_to_validate)
+        tasks = [
+            (
+                partial(
+                    _validate_schema_component,
+                    schema_component,
                     df_to_validate,
-                    lazy=lazy,
-                    # don't make a copy of the data
-                    inplace=True,
-                )
-                check_results.append(isinstance(result, pd.DataFrame))
-            except errors.SchemaError as err:
-                error_handler.collect_error("schema_component_check", err)
-            except errors.SchemaErrors as err:
-                for schema_error_dict in err.schema_errors:
-                    error_handler.collect_error(
-                        "schema_component_check", schema_error_dict["error"]
-                    )
+                    lazy,
+                    dtype_results,
+                ),
+                not schema_component.coerce,
+            )
+            for schema_component in schema_components
+        ] + [
+            (
+                partial(
+                    _run_dataframe_check,
+                    self,
+                    check_index,
+                    check,
+                    df_to_validate,
+                    fail_fast=not lazy,
+                ),
+                True,
+            )
+            for check_index, check in enumerate(self.checks)
+        ]
 
-        # dataframe-level checks
-        for check_index, check in enumerate(self.checks):
-            try:
-                check_results.append(
-                    _handle_check_results(
-                        self, check_index, check, df_to_validate
-                    )
+        check_results = []
+
+        def _collect_results(results):
+            for check_result, schema_errors in results:
+                if check_result is not None:
+                    check_results.append(check_result)
+                for reason_code, schema_error in schema_errors:
+                    error_handler.collect_error(reason_code, schema_error)
+
+        # results are returned in the order of the tasks. Concurrent tasks
+        # all run during the phase of the schema components.
+        with events.phase("schema_components", df_to_validate):
+            results = iter(
+                _run_validation_tasks(
+                    tasks,
+                    self.n_jobs if n_jobs is None else n_jobs,
+                    self.executor if executor is None else executor,
+                    fail_fast=not lazy,
                 )
-            except errors.SchemaError as err:
-                error_handler.collect_error("dataframe_check", err)
+            )
+            _collect_results(itertools.islice(results, len(schema_components)))
+        if self.checks:
+            with events.phase("dataframe_checks", df_to_validate):
+                _collect_results(results)
 
         if self.unique:
             temp_unique: List[List] = (
@@ -633,22 +949,27 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                 if all(isinstance(x, str) for x in self.unique)
                 else self.unique
             )
-            for lst in temp_unique:
-                duplicates = df_to_validate.duplicated(subset=lst, keep=False)
-                if any(duplicates):
-                    failure_cases = reshape_failure_cases(
-                        df_to_validate.loc[duplicates, lst]
-                    )
-                    error_handler.collect_error(
-                        "duplicates",
-                        errors.SchemaError(
-                            self,
-                            check_obj,
-                            f"columns '{*lst,}' not unique:\n{failure_cases}",
-                            failure_cases=failure_cases,
-                            check="multiple_fields_uniqueness",
-                        ),
+            with events.phase("uniqueness", df_to_validate):
+                for lst in temp_unique:
+                    duplicates = df_to_validate.duplicated(
+                        subset=lst, keep=False
                     )
+                    if any(duplicates):
+                        failure_cases = reshape_failure_cases(
+                            df_to_validate.loc[duplicates, lst]
+                        )
+                        error_handler.collect_error(
+                            "duplicates",
+                            errors.SchemaError(
+                                self,
+                                check_obj,
+                                f"columns '{*lst,}' not unique:\n"
+                                f"{failure_cases}",
+                                failure_cases=failure_cases,
+                                check="multiple_fields_uniqueness",
+                                check_output=~duplicates,
+                            ),
+                        )
 
         if lazy and error_handler.collected_errors:
             raise errors.SchemaErrors(
@@ -658,6 +979,79 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         assert all(check_results)
         return check_obj
 
+    def validate_summary(
+        self,
+        check_obj: pd.DataFrame,
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+        sample: Optional[int] = None,
+        random_state: Optional[int] = None,
+        inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> ValidationSummary:
+        """Lazily validate a dataframe and summarize its failures.
+
+        Instead of raising ``SchemaErrors``, returns the number of failures,
+        the failure ratio and a few failure values of each failing check.
+        The dataframe of failure cases and the message of ``SchemaErrors``
+        are never built.
+
+        :param check_obj: the dataframe to validate.
+        :param head: validate the first n rows. Rows overlapping with `tail` or
+            `sample` are de-duplicated.
+        :param tail: validate the last n rows. Rows overlapping with `head` or
+            `sample` are de-duplicated.
+        :param sample: validate a random sample of n rows. Rows overlapping
+            with `head` or `tail` are de-duplicated.
+        :param random_state: random seed for the ``sample`` argument and for
+            sampling the failure values.
+        :param inplace: if True, applies coercion to the object of validation,
+            otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently.
+        :returns: :class:`~pandera.reports.ValidationSummary` of the
+            failures, with the validated dataframe.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+        >>> summary = schema.validate_summary(pd.DataFrame({"a": [1, -1]}))
+        >>> summary
+        <ValidationSummary n_rows=2, n_errors=1, passed=False>
+        >>> summary.failures[["check", "n_failures", "failure_ratio"]]
+                                 check  n_failures  failure_ratio
+        0  greater_than_or_equal_to(0)           1            0.5
+        """
+        return _validate_summary(
+            partial(
+                self.validate,
+                check_obj,
+                head=head,
+                tail=tail,
+                sample=sample,
+                random_state=random_state,
+                lazy=True,
+                inplace=inplace,
+                copy=copy,
+                n_jobs=n_jobs,
+                executor=executor,
+            ),
+            check_obj,
+            head,
+            tail,
+            sample,
+            random_state,
+        )
+
     def __call__(
         self,
         dataframe: pd.DataFrame,
@@ -667,6 +1061,9 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ):
         """Alias for :func:`DataFrameSchema.validate` method.
 
@@ -685,10 +1082,314 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy. Columns that are changed by
+            coercion are replaced in the shallow copy, so the object of
+            validation is never modified and unchanged columns share memory
+            with it.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently. Defaults to the ``n_jobs``
+            attribute of the schema.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently. Defaults to
+            the ``executor`` attribute of the schema.
         """
         return self.validate(
-            dataframe, head, tail, sample, random_state, lazy, inplace
+            dataframe,
+            head,
+            tail,
+            sample,
+            random_state,
+            lazy,
+            inplace,
+            copy,
+            n_jobs,
+            executor,
+        )
+
+    def validate_stream(
+        self,
+        dataframes: Iterable[pd.DataFrame],
+        lazy: bool = False,
+        inplace: bool = False,
+        copy: bool = True,
+        max_failure_cases: Optional[int] = 100,
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Validate a stream of dataframes, e.g. the chunks of a file read
+        with ``pd.read_csv(..., chunksize=n)``.
+
+        The dataframes are validated one at a time and yielded as soon as
+        they're validated, so the stream doesn't have to fit into memory.
+        Column uniqueness, index uniqueness and the ``unique`` option of the
+        schema are enforced across all dataframes of the stream, using hashes
+        of the values of previous dataframes. Aggregate checks, whose output
+        isn't aligned with the rows of the validated data (e.g.
+        ``Check(lambda s: s.mean() > 0)``), are evaluated on the whole
+        stream once the last dataframe has been yielded.
+
+        .. note::
+
+            Aggregate checks are arbitrary functions of whole columns, so the
+            data of the columns they validate is kept in memory until the
+            end of the stream: memory usage then grows with the length of
+            the stream, like the hashes of unique values. A ``UserWarning``
+            is issued when the first dataframe shows that the schema has
+            aggregate checks. Validate streams that don't fit into memory
+            with element-wise and built-in checks only.
+
+            Aggregate checks run, and in lazy mode the collected errors are
+            raised, only when the generator is exhausted. Breaking out of
+            the loop over the validated dataframes skips them.
+
+        :param dataframes: iterable of dataframes to validate.
+        :param lazy: if True, collect the errors of all dataframes and raise
+            a single ``SchemaErrors`` at the end of the stream. Dataframes
+            with errors are yielded too. Otherwise, raise ``SchemaError`` as
+            soon as one occurs.
+        :param inplace: if True, applies coercion to the dataframes,
+            otherwise creates copies of the data.
+        :param copy: if False and ``inplace=False``, validate shallow copies
+            of the dataframes instead of deep copies.
+        :param max_failure_cases: maximum number of failure cases reported
+            for each error in lazy mode. Failure cases are sampled uniformly
+            from all dataframes. If None, report all failure cases.
+        :param random_state: random seed for sampling failure cases.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently.
+        :yields: validated dataframes.
+
+        :raises SchemaError: when a dataframe violates built-in or custom
+            checks and ``lazy=False``.
+        :raises SchemaErrors: at the end of the stream, when any dataframe
+            violates built-in or custom checks and ``lazy=True``.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema({"id": pa.Column(int, unique=True)})
+        >>> chunks = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3]})]
+        >>> for chunk in schema.validate_stream(chunks):
+        ...     print(chunk["id"].tolist())
+        [1, 2]
+        [3]
+
+        Uniqueness is validated across dataframes:
+
+        >>> chunks = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [2]})]
+        >>> list(schema.validate_stream(chunks))
+        Traceback (most recent call last):
+        ...
+        pandera.errors.SchemaError: field_uniqueness across batches failed...
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .incremental import IncrementalValidator
+
+        validator = IncrementalValidator(
+            self,
+            lazy=lazy,
+            max_failure_cases=max_failure_cases,
+            random_state=random_state,
+        )
+        for dataframe in dataframes:
+            yield validator.validate(
+                dataframe,
+                inplace=inplace,
+                copy=copy,
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+        validator.finish()
+
+    def _validate_rows(
+        self,
+        check_obj: pd.DataFrame,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Tuple[
+        np.ndarray,
+        pd.DataFrame,
+        np.ndarray,
+        List[Dict[str, Any]],
+        List[Dict[str, Any]],
+    ]:
+        """Lazily validate a dataframe and find the rows that fail coercion
+        or checks.
+
+        Rows with values that can't be coerced are found first, and the
+        other rows are coerced and validated.
+
+        :returns: boolean array that is True for the failing rows, the
+            validated dataframe of the rows that could be coerced, the
+            positions of these rows in ``check_obj``, the errors that concern
+            individual rows and the other errors.
+        """
+        row_errors: List[Dict[str, Any]] = []
+        other_errors: List[Dict[str, Any]] = []
+
+        def _collect(
+            schema_errors: List[Dict[str, Any]], index: pd.Index
+        ) -> np.ndarray:
+            failed = np.zeros(len(index), dtype=bool)
+            for error_dict in schema_errors:
+                positions = failure_positions(error_dict["error"], index)
+                if positions is None:
+                    other_errors.append(error_dict)
+                else:
+                    row_errors.append(error_dict)
+                    failed[positions] = True
+            return failed
+
+        try:
+            # validation modifies the coerced data in place, so a shallow
+            # copy is coerced to leave check_obj unchanged.
+            coerced = self.coerce_dtype(check_obj.copy(deep=False))
+            failed = np.zeros(len(check_obj), dtype=bool)
+        except errors.SchemaErrors as exc:
+            failed = _collect(exc.schema_errors, check_obj.index)
+            # the rows that can be coerced are coerced at once by validation
+            coerced = check_obj.take(np.flatnonzero(~failed))
+        positions = np.flatnonzero(~failed)
+
+        try:
+            coerced = self.validate(
+                coerced,
+                lazy=True,
+                inplace=True,
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+        except errors.SchemaErrors as exc:
+            coerced = exc.data
+            invalid = _collect(exc.schema_errors, coerced.index)
+            failed[positions[invalid]] = True
+        return failed, coerced, positions, row_errors, other_errors
+
+    def row_mask(
+        self,
+        check_obj: pd.DataFrame,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> np.ndarray:
+        """Find the rows of a dataframe that pass validation.
+
+        The dataframe is validated lazily, and the outputs of the checks
+        that fail are combined into a single mask of the rows. Rows with
+        values that can't be coerced to the data types of the schema fail,
+        and the other rows are coerced before running the checks. Checks
+        are matched with rows by position when their output is aligned with
+        the rows, so dataframes with duplicated index labels are supported.
+
+        :param check_obj: the dataframe to validate.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently.
+        :returns: boolean array that is True for the rows that pass all the
+            checks of the schema. If the dataframe has errors that don't
+            concern individual rows, like a missing column, a wrong data type
+            or a failing aggregate check, no row passes.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema({"a": pa.Column(int, pa.Check.ge(0))})
+        >>> df = pd.DataFrame({"a": [1, -1, 2]})
+        >>> schema.row_mask(df)
+        array([ True, False,  True])
+        >>> df[schema.row_mask(df)]
+           a
+        0  1
+        2  2
+        """
+        failed, _, _, _, other_errors = self._validate_rows(
+            check_obj, n_jobs, executor
         )
+        if other_errors:
+            return np.zeros(len(check_obj), dtype=bool)
+        return ~failed
+
+    def quarantine(
+        self,
+        check_obj: pd.DataFrame,
+        random_state: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, ValidationSummary]:
+        """Split a dataframe into valid rows and quarantined rows.
+
+        Rows with values that can't be coerced to the data types of the
+        schema are quarantined, and the other rows are coerced at once.
+        The coerced rows are validated lazily, and the rows that fail
+        element-wise checks, like ``Check.ge(0)``, nullability or
+        uniqueness, are quarantined too. Errors are found by position when
+        the output of a check is aligned with the rows, otherwise all the
+        rows with the index label of a failure case are quarantined.
+
+        :param check_obj: the dataframe to split.
+        :param random_state: random seed for sampling the failure values of
+            the report.
+        :param n_jobs: number of threads used to validate columns and run
+            dataframe-level checks concurrently.
+        :param executor: a ``concurrent.futures.Executor`` used to validate
+            columns and run dataframe-level checks concurrently.
+        :returns: the valid rows, coerced and validated, the quarantined
+            rows as they are in ``check_obj`` and a
+            :class:`~pandera.reports.ValidationSummary` of the errors of the
+            quarantined rows.
+
+        :raises SchemaErrors: when the dataframe has errors that don't
+            concern individual rows, like a missing column, a wrong data type
+            or a failing aggregate check.
+
+        :example:
+
+        >>> import pandas as pd
+        >>> import pandera as pa
+        >>>
+        >>> schema = pa.DataFrameSchema(
+        ...     {"a": pa.Column(int, pa.Check.ge(0), coerce=True)}
+        ... )
+        >>> df = pd.DataFrame({"a": ["1", "x", "-1", "2"]})
+        >>> valid, quarantined, report = schema.quarantine(df)
+        >>> valid
+           a
+        0  1
+        3  2
+        >>> quarantined
+            a
+        1   x
+        2  -1
+        """
+        (
+            failed,
+            coerced,
+            positions,
+            row_errors,
+            other_errors,
+        ) = self._validate_rows(check_obj, n_jobs, executor)
+        if other_errors:
+            raise errors.SchemaErrors(other_errors, coerced)
+
+        valid = coerced.take(
+            np.flatnonzero(~failed[positions])
+        ).pandera.add_schema(self)
+        report = ValidationSummary(
+            valid,
+            summarize_errors(
+                row_errors, len(check_obj), random_state=random_state
+            ),
+            len(check_obj),
+        )
+        return valid, check_obj.take(np.flatnonzero(failed)), report
 
     def __repr__(self) -> str:
         """Represent string for logging."""
@@ -753,6 +1454,14 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             ")>"
         )
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DataFrameSchema":
+        # copies of the schema share its executor
+        memo.setdefault(id(self.executor), self.executor)
+        schema_copy = type(self).__new__(type(self))
+        memo[id(self)] = schema_copy
+        schema_copy.__dict__.update(deepcopy(self.__dict__, memo))
+        return schema_copy
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
@@ -849,7 +1558,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         .. seealso:: :func:`remove_columns`
 
         """
-        schema_copy = copy.deepcopy(self)
+        schema_copy = deepcopy(self)
         schema_copy.columns = {
             **schema_copy.columns,
             **DataFrameSchema(extra_schema_cols).columns,
@@ -899,7 +1608,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         .. seealso:: :func:`add_columns`
 
         """
-        schema_copy = copy.deepcopy(self)
+        schema_copy = deepcopy(self)
 
         # ensure all specified keys are present in the columns
         not_in_cols: List[str] = [
@@ -966,8 +1675,8 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
             raise ValueError("cannot update 'name' of the column.")
         if column_name not in self.columns:
             raise ValueError(f"column '{column_name}' not in {self}")
-        schema_copy = copy.deepcopy(self)
-        column_copy = copy.deepcopy(self.columns[column_name])
+        schema_copy = deepcopy(self)
+        column_copy = deepcopy(self.columns[column_name])
         new_column = column_copy.__class__(
             **{**column_copy.properties, **kwargs}
         )
@@ -1022,7 +1731,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         """
 
-        new_schema = copy.deepcopy(self)
+        new_schema = deepcopy(self)
 
         # ensure all specified keys are present in the columns
         not_in_cols: List[str] = [
@@ -1044,7 +1753,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
                     )
             original_properties = new_schema.columns[col].properties
             if update_dict.get(col):
-                new_properties = copy.deepcopy(original_properties)
+                new_properties = deepcopy(original_properties)
                 new_properties.update(update_dict[col])
                 new_columns[col] = new_schema.columns[col].__class__(
                     **new_properties
@@ -1102,7 +1811,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         .. seealso:: :func:`update_column`
 
         """
-        new_schema = copy.deepcopy(self)
+        new_schema = deepcopy(self)
 
         # ensure all specified keys are present in the columns
         not_in_cols: List[str] = [
@@ -1179,7 +1888,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 
         """
 
-        new_schema = copy.deepcopy(self)
+        new_schema = deepcopy(self)
 
         # ensure all specified keys are present in the columns
         not_in_cols: List[str] = [
@@ -1315,7 +2024,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         # pylint: disable=import-outside-toplevel,cyclic-import
         from pandera.schema_components import Index, MultiIndex
 
-        new_schema = copy.deepcopy(self)
+        new_schema = deepcopy(self)
 
         keys_temp: List = (
             list(set(keys)) if not isinstance(keys, list) else keys
@@ -1440,7 +2149,7 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
         # pylint: disable=import-outside-toplevel,cyclic-import
         from pandera.schema_components import Column, Index, MultiIndex
 
-        new_schema = copy.deepcopy(self)
+        new_schema = deepcopy(self)
 
         if new_schema.index is None:
             raise errors.SchemaInitError(
@@ -1518,6 +2227,14 @@ class DataFrameSchema:  # pylint: disable=too-many-public-methods
 class SeriesSchemaBase:
     """Base series validator object."""
 
+    # whether the column is only validated by the dataframe schema, which
+    # checks its data type along with the data types of the other columns
+    _dtype_checked_by_dataframe = False
+
+    # version of the state of the schema, assigned whenever an attribute is
+    # set
+    _state_version: _StateVersion
+
     @deprecate_pandas_dtype
     def __init__(
         self,
@@ -1597,6 +2314,9 @@ class SeriesSchemaBase:
         # set to True in the case that a schema is created by infer_schema.
         self._IS_INFERRED = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        _set_versioned_attribute(self, name, value)
+
     # the _is_inferred getter and setter methods are not public
     @property
     def _is_inferred(self):
@@ -1622,7 +2342,7 @@ class SeriesSchemaBase:
         :param checks: checks to set on the new schema
         :returns: a new SeriesSchema with a new set of checks
         """
-        schema_copy = copy.deepcopy(self)
+        schema_copy = deepcopy(self)
         schema_copy.checks = checks
         return schema_copy
 
@@ -1701,6 +2421,7 @@ class SeriesSchemaBase:
                 msg,
                 failure_cases=exc.failure_cases,
                 check=f"coerce_dtype('{self.dtype}')",
+                check_output=exc.check_output,
             ) from exc
 
     @property
@@ -1711,6 +2432,7 @@ class SeriesSchemaBase:
             "of SeriesSchemaBase"
         )
 
+    @profiling.measured
     def validate(
         self,
         check_obj: Union[pd.DataFrame, pd.Series],
@@ -1720,6 +2442,7 @@ class SeriesSchemaBase:
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> Union[pd.DataFrame, pd.Series]:
         # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         """Validate a series or specific column in dataframe.
@@ -1734,9 +2457,17 @@ class SeriesSchemaBase:
         :param random_state: random seed for the ``sample`` argument.
         :param lazy: if True, lazily evaluates dataframe against all validation
             checks and raises a ``SchemaErrors``. Otherwise, raise
-            ``SchemaError`` as soon as one occurs.
+            ``SchemaError`` as soon as one occurs. Built-in, expression and
+            element-wise checks then stop evaluating rows at the first block
+            of rows with failure cases, or at the block where
+            ``n_failure_cases`` failure cases are found if it's set.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy. Columns that are changed by
+            coercion are replaced in the shallow copy, so the object of
+            validation is never modified and unchanged columns share memory
+            with it.
         :returns: validated DataFrame or Series.
 
         """
@@ -1752,7 +2483,7 @@ class SeriesSchemaBase:
         error_handler = SchemaErrorHandler(lazy)
 
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = check_obj.copy(deep=copy)
 
         series = (
             check_obj
@@ -1786,8 +2517,10 @@ class SeriesSchemaBase:
 
         if not self._nullable:
             nulls = series.isna()
-            if sum(nulls) > 0:
-                failed = series[nulls]
+            if nulls.any():
+                failed = check_utils.first_failure_cases(
+                    series, nulls.to_numpy()
+                )
                 msg = (
                     f"non-nullable series '{series.name}' contains null "
                     f"values:\n{failed}"
@@ -1798,21 +2531,27 @@ class SeriesSchemaBase:
                         self,
                         check_obj,
                         msg,
-                        failure_cases=reshape_failure_cases(
-                            series[nulls], ignore_na=False
+                        failure_cases=CheckFailureCases(
+                            failed,
+                            ignore_na=False,
+                            check_output=~nulls,
+                            checked_object=series,
                         ),
                         check="not_nullable",
+                        check_output=~nulls,
                     ),
                 )
 
         # Check if the series contains duplicate values
         if self._unique:
             duplicates = series.duplicated()
-            if any(duplicates):
-                failed = series[duplicates]
+            if duplicates.any():
+                failed = check_utils.first_failure_cases(
+                    series, duplicates.to_numpy()
+                )
                 msg = (
                     f"series '{series.name}' contains duplicate values:\n"
-                    f"{series[duplicates]}"
+                    f"{failed}"
                 )
                 error_handler.collect_error(
                     "series_contains_duplicates",
@@ -1820,42 +2559,48 @@ class SeriesSchemaBase:
                         self,
                         check_obj,
                         msg,
-                        failure_cases=reshape_failure_cases(
-                            series[duplicates]
+                        failure_cases=CheckFailureCases(
+                            failed,
+                            ignore_na=False,
+                            check_output=~duplicates,
+                            checked_object=series,
                         ),
                         check="field_uniqueness",
+                        check_output=~duplicates,
                     ),
                 )
 
         if self._dtype is not None and (
             not self._dtype.check(pandas_engine.Engine.dtype(series.dtype))
         ):
-            msg = (
-                f"expected series '{series.name}' to have type {self._dtype}, "
-                + f"got {series.dtype}"
-            )
             error_handler.collect_error(
                 "wrong_dtype",
-                errors.SchemaError(
-                    self,
-                    check_obj,
-                    msg,
-                    failure_cases=scalar_failure_case(str(series.dtype)),
-                    check=f"dtype('{self.dtype}')",
-                ),
+                _wrong_dtype_error(self, check_obj, series.name, series.dtype),
             )
 
         check_results = []
+        column: Optional[str]
         if isinstance(check_obj, pd.Series):
-            check_obj, check_args = series, [None]
+            check_obj, column = series, None
         else:
-            check_args = [self.name]  # type: ignore
+            column = self.name
 
+        passing_checks = _fused_passing_checks(
+            self.checks, series, fail_fast=not lazy
+        )
         for check_index, check in enumerate(self.checks):
+            if check_index in passing_checks:
+                check_results.append(True)
+                continue
             try:
                 check_results.append(
                     _handle_check_results(
-                        self, check_index, check, check_obj, *check_args
+                        self,
+                        check_index,
+                        check,
+                        check_obj,
+                        column,
+                        fail_fast=not lazy,
                     )
                 )
             except errors.SchemaError as err:
@@ -1899,10 +2644,11 @@ class SeriesSchemaBase:
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> Union[pd.DataFrame, pd.Series]:
         """Alias for ``validate`` method."""
         return self.validate(
-            check_obj, head, tail, sample, random_state, lazy, inplace
+            check_obj, head, tail, sample, random_state, lazy, inplace, copy
         )
 
     def __eq__(self, other):
@@ -2021,6 +2767,7 @@ class SeriesSchema(SeriesSchemaBase):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> pd.Series:
         """Validate a Series object.
 
@@ -2038,6 +2785,11 @@ class SeriesSchema(SeriesSchemaBase):
             ``SchemaError`` as soon as one occurs.
         :param inplace: if True, applies coercion to the object of validation,
             otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy. Columns that are changed by
+            coercion are replaced in the shallow copy, so the object of
+            validation is never modified and unchanged columns share memory
+            with it.
         :returns: validated Series.
 
         :raises SchemaError: when ``DataFrame`` violates built-in or custom
@@ -2068,16 +2820,20 @@ class SeriesSchema(SeriesSchemaBase):
             raise TypeError(f"expected {pd.Series}, got {type(check_obj)}")
 
         if not inplace:
-            check_obj = check_obj.copy()
+            check_obj = check_obj.copy(deep=copy)
 
         check_obj = check_obj.pandera.add_schema(self)
         error_handler = SchemaErrorHandler(lazy=lazy)
 
-        if self.coerce:
+        if self.coerce and _requires_coercion(self.dtype, check_obj):
             try:
-                check_obj = self.coerce_dtype(check_obj).pandera.add_schema(
-                    self
-                )
+                with profiling.measure(
+                    self,
+                    f"coerce_dtype('{self.dtype}')",
+                    n_rows=len(check_obj),
+                ):
+                    check_obj = self.coerce_dtype(check_obj)
+                check_obj = check_obj.pandera.add_schema(self)
             except errors.SchemaError as exc:
                 error_handler.collect_error("dtype_coercion_error", exc)
 
@@ -2085,11 +2841,18 @@ class SeriesSchema(SeriesSchemaBase):
         if self.index:
             # coerce data type using index schema copy to prevent mutation
             # of original index schema attribute.
-            _index = copy.deepcopy(self.index)
+            _index = deepcopy(self.index)
             _index.coerce = _index.coerce or self.coerce
             try:
                 check_obj = _index(
-                    check_obj, head, tail, sample, random_state, lazy, inplace
+                    check_obj,
+                    head,
+                    tail,
+                    sample,
+                    random_state,
+                    lazy,
+                    # the series has already been copied
+                    inplace=True,
                 )
             except errors.SchemaError as exc:
                 error_handler.collect_error("dtype_coercion_error", exc)
@@ -2101,7 +2864,14 @@ class SeriesSchema(SeriesSchemaBase):
         # validate series
         try:
             super().validate(
-                check_obj, head, tail, sample, random_state, lazy, inplace
+                check_obj,
+                head,
+                tail,
+                sample,
+                random_state,
+                lazy,
+                # the series has already been copied
+                inplace=True,
             )
         except errors.SchemaErrors as err:
             for schema_error_dict in err.schema_errors:
@@ -2116,6 +2886,56 @@ class SeriesSchema(SeriesSchemaBase):
 
         return check_obj
 
+    def validate_summary(
+        self,
+        check_obj: pd.Series,
+        head: Optional[int] = None,
+        tail: Optional[int] = None,
+        sample: Optional[int] = None,
+        random_state: Optional[int] = None,
+        inplace: bool = False,
+        copy: bool = True,
+    ) -> ValidationSummary:
+        """Lazily validate a series and summarize its failures.
+
+        Instead of raising ``SchemaErrors``, returns the number of failures,
+        the failure ratio and a few failure values of each failing check.
+
+        :param check_obj: the series to validate.
+        :param head: validate the first n rows. Rows overlapping with `tail` or
+            `sample` are de-duplicated.
+        :param tail: validate the last n rows. Rows overlapping with `head` or
+            `sample` are de-duplicated.
+        :param sample: validate a random sample of n rows. Rows overlapping
+            with `head` or `tail` are de-duplicated.
+        :param random_state: random seed for the ``sample`` argument and for
+            sampling the failure values.
+        :param inplace: if True, applies coercion to the object of validation,
+            otherwise creates a copy of the data.
+        :param copy: if False and ``inplace=False``, validate a shallow copy
+            of the data instead of a deep copy.
+        :returns: :class:`~pandera.reports.ValidationSummary` of the
+            failures, with the validated series.
+        """
+        return _validate_summary(
+            partial(
+                self.validate,
+                check_obj,
+                head=head,
+                tail=tail,
+                sample=sample,
+                random_state=random_state,
+                lazy=True,
+                inplace=inplace,
+                copy=copy,
+            ),
+            check_obj,
+            head,
+            tail,
+            sample,
+            random_state,
+        )
+
     def __call__(
         self,
         check_obj: pd.Series,
@@ -2125,16 +2945,239 @@ class SeriesSchema(SeriesSchemaBase):
         random_state: Optional[int] = None,
         lazy: bool = False,
         inplace: bool = False,
+        copy: bool = True,
     ) -> pd.Series:
         """Alias for :func:`SeriesSchema.validate` method."""
         return self.validate(
-            check_obj, head, tail, sample, random_state, lazy, inplace
+            check_obj, head, tail, sample, random_state, lazy, inplace, copy
         )
 
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
 
 
+def _requires_coercion(
+    dtype: Optional[DataType],
+    obj: Union[pd.DataFrame, pd.Series, pd.Index],
+) -> bool:
+    """Whether coercing a pandas object to a data type can change its data.
+
+    Data types that coerce with a plain ``astype`` leave objects that already
+    have the target native dtype untouched, so coercing them can be skipped
+    altogether.
+    """
+    if dtype is None:
+        return False
+    native_dtype = getattr(dtype, "type", None)
+    if native_dtype is None or type(dtype).coerce not in (
+        pandas_engine.DataType.coerce,
+        pandas_engine.numpy_engine.DataType.coerce,
+    ):
+        return True
+    obj_dtypes = (
+        obj.dtypes.tolist() if isinstance(obj, pd.DataFrame) else [obj.dtype]
+    )
+    return any(
+        obj_dtype == np.dtype(object) or obj_dtype != native_dtype
+        for obj_dtype in obj_dtypes
+    )
+
+
+def _replace_columns(
+    obj: pd.DataFrame, columns: Dict[int, pd.Series]
+) -> pd.DataFrame:
+    """Replace the columns of a dataframe at the given positions.
+
+    The new dataframe is built at once from the arrays of the columns,
+    without copying them: assigning the columns one at a time splits a block
+    of the dataframe for each of them, which is quadratic in the number of
+    columns.
+    """
+    replaced = pd.DataFrame(
+        {
+            position: columns.get(position, column).array
+            for position, (_, column) in enumerate(obj.items())
+        },
+        index=obj.index,
+        copy=False,
+    )
+    replaced.columns = obj.columns
+    return replaced.__finalize__(obj)
+
+
+def _checks_dtype_only(
+    schema: DataFrameSchema, schema_component: SeriesSchemaBase
+) -> bool:
+    """Whether the data type is all there is to validate in a column."""
+    return (
+        not schema_component.checks
+        and schema_component.nullable
+        and not schema_component.unique
+        and not schema_component.coerce
+        and not schema.coerce
+        and not schema_component._is_inferred
+    )
+
+
+def _wrong_dtype_error(
+    schema_component: SeriesSchemaBase,
+    check_obj: Union[pd.DataFrame, pd.Series],
+    name: Any,
+    dtype: Any,
+) -> errors.SchemaError:
+    """Error of a series with the wrong data type."""
+    return errors.SchemaError(
+        schema_component,
+        check_obj,
+        f"expected series '{name}' to have type {schema_component.dtype}, "
+        f"got {dtype}",
+        failure_cases=scalar_failure_case(str(dtype)),
+        check=f"dtype('{schema_component.dtype}')",
+    )
+
+
+def _check_dtypes(
+    schema_components: List[SeriesSchemaBase],
+    check_obj: pd.DataFrame,
+) -> Dict[Any, Tuple[Optional[bool], List[Tuple[str, errors.SchemaError]]]]:
+    """Check the data types of columns with the data types of a dataframe.
+
+    :param schema_components: schema components of columns with unique
+        names in the dataframe.
+    :returns: by column name, whether the data type is correct, or None if
+        it's wrong, and the reason code and error of a wrong data type.
+    """
+    dtypes = dict(zip(check_obj.columns, check_obj.dtypes))
+    results: Dict[
+        Any, Tuple[Optional[bool], List[Tuple[str, errors.SchemaError]]]
+    ] = {}
+    for schema_component in schema_components:
+        dtype = dtypes[schema_component.name]
+        if schema_component.dtype.check(pandas_engine.Engine.dtype(dtype)):
+            results[schema_component.name] = (True, [])
+            continue
+        error = _wrong_dtype_error(
+            schema_component, check_obj, schema_component.name, dtype
+        )
+        results[schema_component.name] = (
+            None,
+            [("schema_component_check", error)],
+        )
+    return results
+
+
+def _validate_schema_component(
+    schema_component: Union[SeriesSchemaBase, DataFrameSchema],
+    check_obj: pd.DataFrame,
+    lazy: bool,
+    dtype_results: Dict[
+        Any, Tuple[Optional[bool], List[Tuple[str, errors.SchemaError]]]
+    ],
+) -> Tuple[Optional[bool], List[Tuple[str, errors.SchemaError]]]:
+    """Validate a dataframe with a schema component.
+
+    :param dtype_results: results of the data types checked together by the
+        dataframe schema, by column name. Components with nothing else to
+        validate return their result.
+    :returns: the check result, or None if validation failed, and the
+        reason codes and errors of the failures.
+    """
+    if getattr(schema_component, "_dtype_checked_by_dataframe", False):
+        return dtype_results[schema_component.name]
+    try:
+        result = schema_component(
+            check_obj,
+            lazy=lazy,
+            # don't make a copy of the data
+            inplace=True,
+        )
+    except errors.SchemaError as err:
+        return None, [("schema_component_check", err)]
+    except errors.SchemaErrors as err:
+        return None, [
+            ("schema_component_check", schema_error_dict["error"])
+            for schema_error_dict in err.schema_errors
+        ]
+    return isinstance(result, pd.DataFrame), []
+
+
+def _run_dataframe_check(
+    schema: DataFrameSchema,
+    check_index: int,
+    check: Union[Check, Hypothesis],
+    check_obj: pd.DataFrame,
+    fail_fast: bool = False,
+) -> Tuple[Optional[bool], List[Tuple[str, errors.SchemaError]]]:
+    """Run a dataframe-level check.
+
+    :param fail_fast: stop evaluating the check at the first block of rows
+        with failure cases, or at the block where its ``n_failure_cases``
+        failure cases are found if it's set.
+    :returns: the check result, or None if the check failed, and the reason
+        codes and errors of the failures.
+    """
+    try:
+        return (
+            _handle_check_results(
+                schema, check_index, check, check_obj, fail_fast=fail_fast
+            ),
+            [],
+        )
+    except errors.SchemaError as err:
+        return None, [("dataframe_check", err)]
+
+
+def _run_validation_tasks(
+    tasks: Sequence[Tuple[Callable[[], Any], bool]],
+    n_jobs: int,
+    executor: Optional[Executor],
+    fail_fast: bool,
+) -> Iterable[Any]:
+    """Run validation tasks, returning their results in the order of tasks.
+
+    :param tasks: pairs of a task function and whether the task can run
+        concurrently with other tasks. Tasks that can't run concurrently are
+        run first, one after another.
+    :param n_jobs: number of threads to run tasks with if ``executor`` is
+        None. A negative value uses ``os.cpu_count() + 1 + n_jobs`` threads.
+    :param executor: executor to run concurrent tasks with.
+    :param fail_fast: stop as soon as a task returns errors.
+    """
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    if executor is None and n_jobs == 1:
+        # tasks are evaluated lazily so that raising the first error stops
+        # validation
+        return (task() for task, _ in tasks)
+
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=n_jobs)
+            )
+        results = {
+            i: task()
+            for i, (task, concurrent) in enumerate(tasks)
+            if not concurrent
+        }
+        futures = {
+            i: executor.submit(task)
+            for i, (task, concurrent) in enumerate(tasks)
+            if concurrent
+        }
+        ordered_results = []
+        try:
+            for i in range(len(tasks)):
+                result = results[i] if i in results else futures[i].result()
+                ordered_results.append(result)
+                if fail_fast and result[1]:
+                    break
+        finally:
+            for future in futures.values():
+                future.cancel()
+    return ordered_results
+
+
 def _pandas_obj_to_validate(
     dataframe_or_series: Union[pd.DataFrame, pd.Series],
     head: Optional[int],
@@ -2142,20 +3185,45 @@ def _pandas_obj_to_validate(
     sample: Optional[int],
     random_state: Optional[int],
 ) -> Union[pd.DataFrame, pd.Series]:
-    pandas_obj_subsample = []
+    """Select the rows to validate by position.
+
+    Rows selected by more than one of ``head``, ``tail`` and ``sample`` are
+    only validated once, while duplicated rows at different positions are
+    all validated.
+    """
+    if head is None and tail is None and sample is None:
+        return dataframe_or_series
+    n_rows = len(dataframe_or_series)
+    positions = []
     if head is not None:
-        pandas_obj_subsample.append(dataframe_or_series.head(head))
+        # same as the positions of dataframe_or_series.head(head)
+        positions.append(np.arange(n_rows)[:head])
     if tail is not None:
-        pandas_obj_subsample.append(dataframe_or_series.tail(tail))
+        # same as the positions of dataframe_or_series.tail(tail)
+        positions.append(np.arange(n_rows)[-tail:] if tail else np.arange(0))
     if sample is not None:
-        pandas_obj_subsample.append(
-            dataframe_or_series.sample(sample, random_state=random_state)
+        positions.append(
+            pd.RangeIndex(n_rows)
+            .to_series()
+            .sample(sample, random_state=random_state)
+            .to_numpy()
         )
-    return (
-        dataframe_or_series
-        if not pandas_obj_subsample
-        else pd.concat(pandas_obj_subsample).drop_duplicates()
+    return dataframe_or_series.iloc[pd.unique(np.concatenate(positions))]
+
+
+def _validate_summary(
+    validate: Callable,
+    check_obj: Union[pd.DataFrame, pd.Series],
+    head: Optional[int],
+    tail: Optional[int],
+    sample: Optional[int],
+    random_state: Optional[int],
+) -> ValidationSummary:
+    """Lazily validate a pandas object and summarize its failures."""
+    n_rows = len(
+        _pandas_obj_to_validate(check_obj, head, tail, sample, random_state)
     )
+    return summarize_validation(validate, n_rows, random_state)
 
 
 def _handle_check_results(
@@ -2163,18 +3231,24 @@ def _handle_check_results(
     check_index: int,
     check: Union[Check, Hypothesis],
     check_obj: Union[pd.DataFrame, pd.Series],
-    *check_args,
+    column: Optional[str] = None,
+    fail_fast: bool = False,
 ) -> bool:
     """Handle check results, raising SchemaError on check failure.
 
     :param check_index: index of check in the schema component check list.
     :param check: Check object used to validate pandas object.
-    :param check_args: arguments to pass into check object.
+    :param column: for dataframe checks, apply the check to this column.
+    :param fail_fast: stop evaluating the check at the first block of rows
+        with failure cases, or at the block where its ``n_failure_cases``
+        failure cases are found if it's set.
     :returns: True if check results pass or check.raise_warning=True, otherwise
         False.
     """
-    check_result = check(check_obj, *check_args)
+    with profiling.measure(schema, check, check_index, len(check_obj)):
+        check_result = check(check_obj, column, fail_fast=fail_fast)
     if not check_result.check_passed:
+        error_msg: Union[str, Callable[[], str]]
         if check_result.failure_cases is None:
             # encode scalar False values explicitly
             failure_cases = scalar_failure_case(check_result.check_passed)
@@ -2182,18 +3256,25 @@ def _handle_check_results(
                 schema, check, check_index
             )
         else:
-            failure_cases = reshape_failure_cases(
-                check_result.failure_cases, check.ignore_na
-            )
-            error_msg = format_vectorized_error_message(
-                schema, check, check_index, failure_cases
+            # the failure cases of the check are only reshaped into a long
+            # format dataframe, and formatted into the error message, when
+            # they're accessed.
+            failure_cases = CheckFailureCases(
+                check_result.failure_cases,
+                check.ignore_na,
+                check_result.check_output,
+                check_result.checked_object,
+                check.n_failure_cases,
             )
 
-        # raise a warning without exiting if the check is specified to do so
-        if check.raise_warning:
-            warnings.warn(error_msg, UserWarning)
-            return True
-        raise errors.SchemaError(
+            def _error_msg() -> str:
+                return format_vectorized_error_message(
+                    schema, check, check_index, error.failure_cases
+                )
+
+            error_msg = _error_msg
+
+        error = errors.SchemaError(
             schema,
             check_obj,
             error_msg,
@@ -2202,4 +3283,69 @@ def _handle_check_results(
             check_index=check_index,
             check_output=check_result.check_output,
         )
+        # raise a warning without exiting if the check is specified to do so
+        if check.raise_warning:
+            warnings.warn(error.message, UserWarning)
+            return True
+        raise error
     return check_result.check_passed
+
+
+def _fused_passing_checks(
+    checks: List[Union[Check, Hypothesis]],
+    series: pd.Series,
+    fail_fast: bool = False,
+) -> Set[int]:
+    """Find the built-in checks that pass on a series in a single pass.
+
+    The vectorized expressions of built-in checks are fused into one combined
+    mask per block of rows. Only the rows that fail the combined mask are
+    then evaluated per check, to find out which checks they actually fail.
+
+    :param checks: checks of a schema component.
+    :param series: series to validate.
+    :param fail_fast: stop at the first block of rows where a check fails.
+    :returns: indexes of the checks that are known to pass.
+    """
+    expressions = {
+        check_index: check.vectorized_expression
+        for check_index, check in enumerate(checks)
+        if check.vectorized_expression is not None
+    }
+    values = series.values
+    # a single check is evaluated as efficiently by the check itself
+    if len(expressions) < 2 or not isinstance(values, np.ndarray):
+        return set()
+
+    passing_checks = set(expressions)
+    block_size = vectorized_checks.FUSED_BLOCK_SIZE
+    for start in range(0, len(values), block_size):
+        block = values[start : start + block_size]
+        passed = vectorized_checks.evaluate_fused(
+            [expressions[check_index] for check_index in passing_checks],
+            block,
+        )
+        if passed is None:
+            return set()
+        if passed.all():
+            continue
+
+        failed_values = block[np.logical_not(passed)]
+        failed_isna = pd.isna(failed_values)
+        for check_index in list(passing_checks):
+            check_passed = expressions[check_index].evaluate(failed_values)
+            if check_passed is None:
+                passing_checks.remove(check_index)
+                continue
+            if checks[check_index].ignore_na:
+                check_passed |= failed_isna
+            if not check_passed.all():
+                passing_checks.remove(check_index)
+        if not passing_checks or (
+            # the failing checks stop validation, so the remaining blocks
+            # don't need to be evaluated
+            fail_fast
+            and len(passing_checks) < len(expressions)
+        ):
+            return set()
+    return passing_checks
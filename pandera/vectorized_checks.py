@@ -0,0 +1,340 @@
+"""Vectorized representation of built-in checks.
+
+Built-in checks are described by a small expression tree that evaluates
+directly on the numpy array underlying a pandas Series. Evaluating an
+expression returns None when the data isn't supported, in which case the
+check function of the check is used instead.
+"""
+
+import numbers
+import operator
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from . import check_utils
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .expressions import DataFrameExpression
+
+# numpy dtype kinds of integer, unsigned integer and float arrays
+NUMERIC_KINDS = "iuf"
+
+# number of elements evaluated at a time by fused expressions, small enough
+# for the temporary arrays of a block to stay in the CPU cache
+FUSED_BLOCK_SIZE = 1 << 16
+
+# function that evaluates a check on a range of rows
+RowEvaluator = Callable[[slice], Optional[np.ndarray]]
+
+_COMPARISON_OPERATORS: Dict[str, Callable] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+
+
+def _is_real_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+class CheckExpression:  # pylint:disable=too-few-public-methods
+    """Expression that evaluates a built-in check on a numpy array."""
+
+    def evaluate(self, values: np.ndarray) -> Optional[np.ndarray]:
+        """Evaluate the expression on an array.
+
+        :param values: one-dimensional array to evaluate the expression on.
+        :returns: boolean array that is True for the elements that pass the
+            check, or None if the expression can't be evaluated on the
+            array.
+        """
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Compare(CheckExpression):
+    """Compare elements with a real number."""
+
+    comparison: str
+    value: Any
+
+    def evaluate(self, values: np.ndarray) -> Optional[np.ndarray]:
+        if values.dtype.kind not in NUMERIC_KINDS or not _is_real_number(
+            self.value
+        ):
+            return None
+        result = _COMPARISON_OPERATORS[self.comparison](values, self.value)
+        if not isinstance(result, np.ndarray) or result.dtype != bool:
+            return None
+        return result
+
+
+@dataclass(frozen=True)
+class IsIn(CheckExpression):
+    """Whether elements are in a set of real numbers."""
+
+    values: FrozenSet
+    negate: bool = False
+
+    def evaluate(self, values: np.ndarray) -> Optional[np.ndarray]:
+        if values.dtype.kind not in NUMERIC_KINDS or not all(
+            # nan values don't compare equal in numpy
+            _is_real_number(x) and not pd.isna(x)
+            for x in self.values
+        ):
+            return None
+        return np.isin(values, list(self.values), invert=self.negate)
+
+
+@dataclass(frozen=True)
+class And(CheckExpression):
+    """Logical conjunction of expressions."""
+
+    operands: Tuple[CheckExpression, ...]
+
+    def evaluate(self, values: np.ndarray) -> Optional[np.ndarray]:
+        result = None
+        for operand in self.operands:
+            operand_result = operand.evaluate(values)
+            if operand_result is None:
+                return None
+            if result is None:
+                result = operand_result
+            else:
+                np.logical_and(result, operand_result, out=result)
+        return result
+
+
+@dataclass(frozen=True)
+class StrLength(CheckExpression):
+    """Evaluate an expression on the lengths of strings."""
+
+    operand: CheckExpression
+
+    def evaluate(self, values: np.ndarray) -> Optional[np.ndarray]:
+        if values.dtype != np.dtype(object):
+            return None
+        try:
+            lengths = np.fromiter(
+                map(len, values), dtype=np.int64, count=len(values)
+            )
+        except TypeError:
+            # null values or objects without length
+            return None
+        return self.operand.evaluate(lengths)
+
+
+def in_range(
+    min_value: Any,
+    max_value: Any,
+    include_min: bool = True,
+    include_max: bool = True,
+) -> CheckExpression:
+    """Expression of the :meth:`~pandera.checks.Check.in_range` check."""
+    return And(
+        (
+            Compare("ge" if include_min else "gt", min_value),
+            Compare("le" if include_max else "lt", max_value),
+        )
+    )
+
+
+def str_length(
+    min_value: Optional[int] = None, max_value: Optional[int] = None
+) -> CheckExpression:
+    """Expression of the :meth:`~pandera.checks.Check.str_length` check."""
+    return StrLength(
+        And(
+            tuple(
+                Compare(comparison, value)
+                for comparison, value in (("ge", min_value), ("le", max_value))
+                if value is not None
+            )
+        )
+    )
+
+
+def evaluate_fused(
+    expressions: Sequence[CheckExpression],
+    values: np.ndarray,
+    block_size: int = FUSED_BLOCK_SIZE,
+) -> Optional[np.ndarray]:
+    """Evaluate the conjunction of expressions in a single pass over an array.
+
+    The array is processed in blocks, evaluating all expressions on a block
+    before moving on to the next one, so that each element is only loaded
+    from memory once instead of once per expression.
+
+    :param expressions: expressions to evaluate.
+    :param values: one-dimensional array to evaluate the expressions on.
+    :param block_size: number of elements per block.
+    :returns: boolean array that is True for the elements that pass all
+        expressions, or None if any expression can't be evaluated on the
+        array.
+    """
+    passed = np.ones(len(values), dtype=bool)
+    for start in range(0, len(values), block_size):
+        block = values[start : start + block_size]
+        block_passed = passed[start : start + block_size]
+        for expression in expressions:
+            result = expression.evaluate(block)
+            if result is None:
+                return None
+            np.logical_and(block_passed, result, out=block_passed)
+    return passed
+
+
+def row_evaluator(
+    check_obj: Any,
+    expression: Optional[CheckExpression] = None,
+    dataframe_expression: Optional["DataFrameExpression"] = None,
+    element_wise_fn: Optional[Callable] = None,
+) -> Optional[RowEvaluator]:
+    """Get a function that evaluates a check on a range of rows.
+
+    Only checks whose result for a row doesn't depend on other rows can be
+    evaluated on a range of rows.
+
+    :param check_obj: object validated by the check.
+    :param expression: vectorized expression of a built-in check.
+    :param dataframe_expression: expression of a dataframe check.
+    :param element_wise_fn: function of an element-wise check.
+    :returns: function that returns a boolean array for a range of rows, or
+        None if the check can't be evaluated on the data. None is returned
+        instead if the check can't be evaluated on a range of rows.
+    """
+    if (
+        expression is not None
+        and isinstance(check_obj, pd.Series)
+        and isinstance(check_obj.values, np.ndarray)
+    ):
+        values = check_obj.values
+        evaluate = expression.evaluate
+        return lambda rows: evaluate(values[rows])
+
+    if dataframe_expression is not None and isinstance(
+        check_obj, pd.DataFrame
+    ):
+        evaluate_dataframe = dataframe_expression.evaluate
+        return lambda rows: evaluate_dataframe(check_obj.iloc[rows])
+
+    if element_wise_fn is not None:
+        if isinstance(check_obj, pd.Series):
+            return lambda rows: (
+                check_obj.iloc[rows].map(element_wise_fn).to_numpy(dtype=bool)
+            )
+        if isinstance(check_obj, pd.DataFrame):
+            return lambda rows: (
+                check_obj.iloc[rows]
+                .apply(element_wise_fn, axis=1)
+                .to_numpy(dtype=bool)
+            )
+    return None
+
+
+def evaluate_until_failure(
+    check_obj: Union[pd.Series, pd.DataFrame],
+    evaluate_rows: RowEvaluator,
+    ignore_na: bool = True,
+    n_failure_cases: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> Optional[Tuple[pd.Series, Union[pd.Series, pd.DataFrame]]]:
+    """Evaluate a check one block of rows at a time, stopping at the first
+    block with failure cases, or at the block where ``n_failure_cases``
+    failure cases are found if it's set.
+
+    :param check_obj: object validated by the check.
+    :param evaluate_rows: function that evaluates the check on a range of
+        rows.
+    :param ignore_na: whether null values pass the check.
+    :param n_failure_cases: number of failure cases to stop at.
+    :param columns: columns of a dataframe to look for null values and
+        failure cases in. By default, all columns are used.
+    :returns: the check output of the evaluated rows and the failure cases,
+        or None if the check can't be evaluated on the data.
+    """
+    n_rows = len(check_obj)
+    passed = np.ones(n_rows, dtype=bool)
+    failure_cases: List[Union[pd.Series, pd.DataFrame]] = []
+    n_found = 0
+    stop = 0
+    for start in range(0, n_rows, FUSED_BLOCK_SIZE):
+        stop = min(start + FUSED_BLOCK_SIZE, n_rows)
+        block_passed = evaluate_rows(slice(start, stop))
+        if block_passed is None:
+            return None
+        passed[start:stop] = block_passed
+        if block_passed.all():
+            continue
+        block_obj = check_obj.iloc[start:stop]
+        _, block_failure_cases = check_utils.prepare_vectorized_check_output(
+            block_obj if not columns else block_obj[columns],
+            # null values are marked as passed in place
+            passed[start:stop],
+            ignore_na=ignore_na,
+            n_failure_cases=(
+                None if n_failure_cases is None else n_failure_cases - n_found
+            ),
+        )
+        failure_cases.append(block_failure_cases)
+        n_found += len(block_failure_cases)
+        if not passed[start:stop].all() and (
+            n_failure_cases is None or n_found >= n_failure_cases
+        ):
+            break
+
+    return (
+        pd.Series(passed[:stop], index=check_obj.index[:stop], copy=False),
+        pd.concat(failure_cases) if failure_cases else check_obj.iloc[:0],
+    )
+
+
+def vectorized_check_output(
+    check_obj: Union[pd.Series, pd.DataFrame],
+    passed: np.ndarray,
+    ignore_na: bool = True,
+    n_failure_cases: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> Tuple[pd.Series, Union[pd.Series, pd.DataFrame]]:
+    """Check output and failure cases of a vectorized check.
+
+    :param check_obj: object validated by the check.
+    :param passed: boolean array that is True for the rows that passed.
+    :param ignore_na: whether null values pass the check.
+    :param n_failure_cases: number of failure cases to report.
+    :param columns: columns of a dataframe to look for null values and
+        failure cases in. By default, all columns are used.
+    :returns: the check output and the failure cases.
+    """
+    if passed.all():
+        # nothing failed, so there's no need to look for null values and
+        # failure cases
+        return (
+            pd.Series(passed, index=check_obj.index, copy=False),
+            check_obj.iloc[:0],
+        )
+    return check_utils.prepare_vectorized_check_output(
+        check_obj if not columns else check_obj[columns],
+        passed,
+        ignore_na=ignore_na,
+        n_failure_cases=n_failure_cases,
+    )
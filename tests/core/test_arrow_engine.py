@@ -0,0 +1,141 @@
+"""Test arrow engine."""
+
+import pandas as pd
+import pyarrow
+import pytest
+
+import pandera as pa
+from pandera import dtypes
+from pandera.engines import arrow_engine, pandas_engine
+from pandera.errors import ParserError, SchemaError
+
+pytestmark = pytest.mark.skipif(
+    not pandas_engine.PANDAS_1_5_0_PLUS,
+    reason="Arrow-backed pandas columns require pandas >= 1.5.0",
+)
+
+
+@pytest.mark.parametrize(
+    "arrow_type, expected",
+    [
+        (pyarrow.bool_(), arrow_engine.Bool()),
+        (pyarrow.int8(), arrow_engine.Int8()),
+        (pyarrow.uint32(), arrow_engine.UInt32()),
+        (pyarrow.float32(), arrow_engine.Float32()),
+        (pyarrow.string(), arrow_engine.String()),
+        (pyarrow.large_string(), arrow_engine.LargeString()),
+        (pyarrow.decimal128(10, 2), arrow_engine.Decimal(10, 2)),
+        (
+            pyarrow.timestamp("us", tz="UTC"),
+            arrow_engine.Timestamp("us", "UTC"),
+        ),
+        (
+            pyarrow.dictionary(pyarrow.int8(), pyarrow.string()),
+            arrow_engine.Dictionary(pyarrow.int8(), pyarrow.string()),
+        ),
+        (pyarrow.list_(pyarrow.int32()), arrow_engine.List(pyarrow.int32())),
+        (
+            pyarrow.struct([("x", pyarrow.int32())]),
+            arrow_engine.Struct([("x", pyarrow.int32())]),
+        ),
+    ],
+)
+def test_arrow_data_type(arrow_type, expected):
+    """Test that Arrow data types map to pandera data types."""
+    for data_type in [
+        arrow_type,
+        pd.ArrowDtype(arrow_type),
+        expected,
+    ]:
+        assert arrow_engine.Engine.dtype(data_type) == expected
+        assert pandas_engine.Engine.dtype(data_type) == expected
+    assert expected.type == arrow_type
+    assert str(expected) == str(pd.ArrowDtype(arrow_type))
+
+
+def test_arrow_data_type_aliases():
+    """Test that string aliases of Arrow-backed pandas columns resolve to
+    Arrow data types, while plain aliases keep resolving to pandas types."""
+    assert pandas_engine.Engine.dtype("int64[pyarrow]") == arrow_engine.Int64()
+    assert arrow_engine.Engine.dtype("int64") == arrow_engine.Int64()
+    assert isinstance(pandas_engine.Engine.dtype("int64"), dtypes.Int64)
+    assert isinstance(
+        pandas_engine.Engine.dtype("string[pyarrow]"), pandas_engine.STRING
+    )
+    with pytest.raises(TypeError):
+        arrow_engine.Engine.dtype("foo")
+
+
+def test_arrow_data_type_generic():
+    """Test that Arrow data types without a dedicated pandera data type are
+    boxed as they are."""
+    data_type = arrow_engine.Engine.dtype(pyarrow.time64("us"))
+    assert data_type == arrow_engine.DataType(pyarrow.time64("us"))
+    assert data_type.check(pd.ArrowDtype(pyarrow.time64("us")))
+    assert not data_type.check(pd.ArrowDtype(pyarrow.time64("ns")))
+
+
+@pytest.mark.parametrize(
+    "data, arrow_type",
+    [
+        (pd.Series([1, 2, None]), pyarrow.int32()),
+        (pd.Series([1.5, 2.0]), pyarrow.float32()),
+        (pd.Series(["a", "b", "a"]), pyarrow.large_string()),
+        (
+            pd.Series(["a", "b", "a"]),
+            pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+        ),
+        (pd.Series(["a", "b"], dtype="string[pyarrow]"), pyarrow.string()),
+        (pd.Index([1, 2], name="idx"), pyarrow.int16()),
+    ],
+)
+def test_arrow_data_type_coerce(data, arrow_type):
+    """Test that data is coerced to Arrow-backed pandas objects."""
+    coerced = arrow_engine.Engine.dtype(arrow_type).coerce(data)
+    assert coerced.dtype == pd.ArrowDtype(arrow_type)
+    assert isinstance(coerced, pd.Index) == isinstance(data, pd.Index)
+    assert coerced.name == data.name
+    assert coerced.isna().tolist() == data.isna().tolist()
+
+
+def test_arrow_data_type_coerce_matching():
+    """Test that data of the same Arrow type is returned as is."""
+    data = pd.Series([1, 2], dtype="int32[pyarrow]")
+    assert arrow_engine.Int32().coerce(data) is data
+
+
+def test_arrow_data_type_coerce_failure():
+    """Test that coercion failures report the failure cases."""
+    data = pd.Series(["1", "x", "3", "y"])
+    with pytest.raises(ParserError) as exc:
+        arrow_engine.Int64().coerce(data)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases["index"].tolist() == [1, 3]
+    assert failure_cases["failure_case"].tolist() == ["x", "y"]
+
+
+def test_arrow_dataframe_schema():
+    """Test validating Arrow-backed dataframes."""
+    schema = pa.DataFrameSchema(
+        {
+            "a": pa.Column(pyarrow.int32(), coerce=True),
+            "b": pa.Column(pyarrow.float32(), nullable=True),
+            "c": pa.Column("large_string[pyarrow]"),
+        },
+    )
+    df = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": pd.Series([1.0, None], dtype="float[pyarrow]"),
+            "c": pd.Series(["x", "y"], dtype="large_string[pyarrow]"),
+        }
+    )
+    validated = schema.validate(df)
+    assert validated.dtypes.tolist() == [
+        pd.ArrowDtype(pyarrow.int32()),
+        pd.ArrowDtype(pyarrow.float32()),
+        pd.ArrowDtype(pyarrow.large_string()),
+    ]
+
+    with pytest.raises(SchemaError, match="int32\\[pyarrow\\]"):
+        schema.update_column("a", coerce=False).validate(df)
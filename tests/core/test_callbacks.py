@@ -0,0 +1,88 @@
+"""Tests for the callbacks fired around the phases of validation."""
+# pylint: disable=redefined-outer-name
+
+from typing import List
+
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, callbacks, errors
+from pandera.error_handlers import SchemaErrorHandler
+
+
+@pytest.fixture
+def schema() -> DataFrameSchema:
+    """Schema with all the phases of dataframe validation."""
+    return DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0), coerce=True),
+            "b": Column(str, Check.isin(["x", "y"])),
+        },
+        checks=Check(lambda df: df["a"] < 10),
+        strict=True,
+        unique=["a", "b"],
+    )
+
+
+def test_callbacks(schema) -> None:
+    """Test that an event is fired for each phase of validation."""
+    events: List[callbacks.ValidationEvent] = []
+    df = pd.DataFrame({"a": ["1", "-1", "20", "20"], "b": list("xyzz")})
+    with callbacks.registered(events.append):
+        with pytest.raises(errors.SchemaErrors) as exc:
+            schema.validate(df, lazy=True)
+
+    assert [event.phase for event in events] == list(callbacks.PHASES)
+    assert all(event.schema is schema for event in events)
+    assert all(event.n_rows == 4 for event in events)
+    assert all(event.duration >= 0 for event in events)
+    assert {event.phase: event.n_errors for event in events} == {
+        "strictness": 0,
+        "required_columns": 0,
+        "coercion": 0,
+        "schema_components": 2,
+        "dataframe_checks": 1,
+        "uniqueness": 1,
+    }
+    assert sum(event.n_errors for event in events) == len(
+        exc.value.schema_errors
+    )
+    checks = events[callbacks.PHASES.index("schema_components")]
+    assert checks.n_bytes == checks.data.memory_usage(index=True).sum()
+    assert [error.check_index for error in checks.schema_errors] == [0, 0]
+
+
+def test_callbacks_not_lazy(schema) -> None:
+    """Test that the phase raising the first error fires an event."""
+    events: List[callbacks.ValidationEvent] = []
+    df = pd.DataFrame({"a": [1, -1], "b": list("xy")})
+    with callbacks.registered(events.append):
+        with pytest.raises(errors.SchemaError) as exc:
+            schema.validate(df)
+    assert [event.phase for event in events] == list(callbacks.PHASES[:4])
+    assert events[-1].schema_errors == [exc.value]
+
+
+def test_register_callback(schema) -> None:
+    """Test registering and unregistering callbacks."""
+    events = []
+
+    @callbacks.register
+    def _callback(event):
+        events.append(event)
+
+    try:
+        schema.validate(pd.DataFrame({"a": [1], "b": ["x"]}))
+    finally:
+        callbacks.unregister(_callback)
+    n_events = len(events)
+    assert n_events == len(callbacks.PHASES)
+
+    schema.validate(pd.DataFrame({"a": [1], "b": ["x"]}))
+    assert len(events) == n_events
+    assert isinstance(
+        callbacks.phase_events(schema, SchemaErrorHandler(lazy=False)),
+        callbacks._NoPhaseEvents,
+    )
+    with pytest.raises(ValueError):
+        callbacks.unregister(_callback)
@@ -1,7 +1,9 @@
 """Tests the way Columns are Checked"""
 
 import copy
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -17,6 +19,7 @@ from pandera import (
     String,
     error_formatters,
     errors,
+    expressions,
 )
 
 
@@ -428,3 +431,113 @@ def test_dataframe_schema_check() -> None:
 
     schema_check_return_df = DataFrameSchema(checks=Check(lambda df: df < 10))
     assert isinstance(schema_check_return_df.validate(data), pd.DataFrame)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "a > b * 2 & c.notna()",
+        "a > b * 2 | ~(a == 3)",
+        "1 < a <= 3 & b.isnull()",
+        "(a - b) % 2 == 0",
+        # integers divided by zero
+        "a % f >= 0",
+        "a // f > 1",
+        "d > 1",
+        "e == 'x'",
+    ],
+)
+@pytest.mark.parametrize("block_size", [2, 1000])
+def test_check_expr_evaluation(expr, block_size) -> None:
+    """Test that expressions are evaluated like pandas.DataFrame.eval."""
+    df = pd.DataFrame(
+        {
+            "a": [3, 2, 3, 1],
+            "b": [0.5, 1.0, np.nan, 0.0],
+            "c": [True, False, True, True],
+            "d": pd.array([1, None, 3, 2], dtype="Int64"),
+            "e": ["x", None, "y", "x"],
+            "f": [0, 2, 0, 1],
+        }
+    )
+    expected = df.eval(expr, engine="python").fillna(False).tolist()
+    passed = Check.expr(expr).dataframe_expression.evaluate(
+        df, block_size=block_size
+    )
+    assert passed.tolist() == expected
+
+
+@pytest.mark.skipif(
+    not expressions.HAS_NUMEXPR, reason="numexpr is not installed"
+)
+def test_check_expr_numexpr() -> None:
+    """Test that expressions on numeric data are evaluated with numexpr."""
+    df = pd.DataFrame(
+        {
+            "a": [3, 2, 3, 1],
+            "b": [0.5, 1.0, np.nan, 0.0],
+            "c": [True, False, True, True],
+        }
+    )
+    expression = Check.expr("a > b * 2 & c | ~(a == 3)").dataframe_expression
+    with mock.patch.object(
+        expressions.numexpr, "evaluate", wraps=expressions.numexpr.evaluate
+    ) as evaluate:
+        passed = expression.evaluate(df)
+    evaluate.assert_called_once()
+    assert (
+        passed.tolist() == df.eval(expression.expr, engine="python").tolist()
+    )
+
+    # expressions that numexpr doesn't support are evaluated with numpy
+    expression = Check.expr("(a // 2) > b").dataframe_expression
+    with mock.patch.object(expressions.numexpr, "evaluate") as evaluate:
+        passed = expression.evaluate(df)
+    evaluate.assert_not_called()
+    assert (
+        passed.tolist() == df.eval(expression.expr, engine="python").tolist()
+    )
+
+
+def test_check_expr() -> None:
+    """Test expression checks in dataframe schemas."""
+    schema = DataFrameSchema(
+        {"a": Column(int), "b": Column(float, nullable=True)},
+        checks=Check.expr("a > b * 2", n_failure_cases=2),
+    )
+    schema.validate(pd.DataFrame({"a": [3, 5], "b": [1.0, 2.0]}))
+
+    df = pd.DataFrame(
+        {"a": [1, 1, 1, 3], "b": [1.0, 2.0, 3.0, np.nan], "c": [1, 2, 3, 4]}
+    )
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    failure_cases = exc.value.failure_cases
+    # only the first two failing rows of the referenced columns are reported
+    assert sorted(failure_cases["index"].unique()) == [0, 1]
+    assert sorted(failure_cases.column.unique()) == ["a", "b"]
+
+    # null values only pass the check if they're ignored
+    schema.checks = [Check.expr("a > b * 2", ignore_na=True)]
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    assert sorted(exc.value.failure_cases["index"].unique()) == [0, 1, 2]
+
+
+def test_check_expr_errors() -> None:
+    """Test that invalid expressions are rejected early."""
+    for expr in ["a >", "a.sum() > 0", "df['a'] > 0", "f(a)"]:
+        with pytest.raises(ValueError, match="expression"):
+            Check.expr(expr)
+    with pytest.raises(ValueError):
+        Check.expr("a > 0", element_wise=True)
+    with pytest.raises(errors.SchemaInitError, match=r"\['c'\]"):
+        DataFrameSchema(
+            {"a": Column(int), "b": Column(int)},
+            checks=Check.expr("a > b & c > 0"),
+        )
+    # columns can be matched by regex columns
+    DataFrameSchema(
+        {"a": Column(int), "c_.+": Column(int, regex=True)},
+        checks=Check.expr("a > c_1"),
+    )
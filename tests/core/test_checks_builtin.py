@@ -1,6 +1,10 @@
 """Tests for builtin checks in pandera.checks.Check
 """
+# pylint: disable=too-many-lines
 
+import copy
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -8,6 +12,7 @@ from pandera.checks import Check
 from pandera.errors import SchemaError
 from pandera.schema_components import Column
 from pandera.schemas import DataFrameSchema, SeriesSchema
+from pandera.vectorized_checks import evaluate_fused
 
 
 def check_values(values, check, expected_failure_cases) -> None:
@@ -975,3 +980,75 @@ class TestStrLength:
         check_none_failures(
             series_values, Check.str_length(min_len, max_len, ignore_na=False)
         )
+
+
+@pytest.mark.parametrize(
+    "check",
+    [
+        Check.equal_to(1),
+        Check.not_equal_to(1.5),
+        Check.greater_than(0),
+        Check.greater_than_or_equal_to(1),
+        Check.less_than(3),
+        Check.less_than_or_equal_to(2.5),
+        Check.in_range(1, 3),
+        Check.in_range(1, 3, include_min=False, include_max=False),
+        Check.isin([1, 2.5]),
+        Check.notin([1, 2.5]),
+        Check.str_length(2, 3),
+        Check.str_length(None, 2, ignore_na=False),
+        Check.greater_than(0, n_failure_cases=1),
+    ],
+)
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series([1, 2, 3, 4]),
+        pd.Series([-1.0, 1.0, None, 2.5, 3.0], index=list("abcde")),
+        pd.Series([1, None, 3], dtype="Int64"),
+        pd.Series(["a", "abc", "abcd"]),
+        pd.Series(["a", None, "abcd"]),
+        pd.Series([], dtype=float),
+    ],
+)
+def test_vectorized_check_expression(check, values) -> None:
+    """Test that the vectorized expressions of built-in checks give the same
+    results as their check functions."""
+    check_fn_only = copy.copy(check)
+    check_fn_only._expression = None
+    try:
+        expected = check_fn_only(values)
+    except (AttributeError, TypeError):
+        # check function doesn't support the data type
+        return
+    result = check(values)
+    pd.testing.assert_series_equal(
+        result.check_output, expected.check_output, check_names=False
+    )
+    assert result.check_passed == expected.check_passed
+    if expected.failure_cases is None:
+        # failure cases of empty series aren't reported by check functions
+        assert result.failure_cases.empty
+    else:
+        pd.testing.assert_series_equal(
+            result.failure_cases, expected.failure_cases
+        )
+
+
+def test_evaluate_fused() -> None:
+    """Test that fused expressions are evaluated block by block."""
+    checks = [Check.ge(0), Check.notin([3]), Check.in_range(0, 5)]
+    values = np.array([-1, 0, 1, 2, 3, 4, 5, 6, 7])
+    expected = np.logical_and.reduce(
+        [check.vectorized_expression.evaluate(values) for check in checks]
+    )
+    passed = evaluate_fused(
+        [check.vectorized_expression for check in checks], values, block_size=2
+    )
+    np.testing.assert_array_equal(passed, expected)
+    assert (
+        evaluate_fused(
+            [Check.str_length(1).vectorized_expression], values.astype(object)
+        )
+        is None
+    )
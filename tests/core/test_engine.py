@@ -1,4 +1,5 @@
 """Tests Engine subclassing and registring DataTypes."""
+
 # pylint:disable=redefined-outer-name,unused-argument
 # pylint:disable=missing-function-docstring,missing-class-docstring
 import re
@@ -7,7 +8,8 @@ from typing import Any, Generator, List, Union
 import pytest
 
 from pandera.dtypes import DataType
-from pandera.engines.engine import Engine
+from pandera.engines import engine as engine_module
+from pandera.engines.engine import Engine, cached_dtype
 
 
 class BaseDataType(DataType):
@@ -193,3 +195,73 @@ def test_return_base_dtype(engine: Engine):
         TypeError, match="DataType 'ParametrizedDtypec' cannot be instantiated"
     ):
         engine.dtype(ParametrizedDtypec)
+
+
+@pytest.fixture
+def cached_engine() -> Generator[Engine, None, None]:
+    class FakeEngine(  # pylint:disable=too-few-public-methods
+        metaclass=Engine, base_pandera_dtypes=BaseDataType
+    ):
+        _uncached_dtypes = (float,)
+        n_resolved = 0
+
+        @classmethod
+        @cached_dtype
+        def dtype(cls, data_type: Any) -> DataType:
+            cls.n_resolved += 1
+            return Engine.dtype(cls, data_type)
+
+    yield FakeEngine
+
+    del FakeEngine
+
+
+def test_cached_dtype(cached_engine):
+    """Test that resolved data types are cached."""
+    cached_engine.register_dtype(SimpleDtype, equivalents=["int", 1, 1.0])
+    pandera_dtype = cached_engine.dtype("int")
+    assert cached_engine.dtype("int") is pandera_dtype
+    assert cached_engine.n_resolved == 1
+
+    # data types of the engine aren't resolved
+    assert cached_engine.dtype(pandera_dtype) is pandera_dtype
+    assert cached_engine.n_resolved == 1
+
+    # equal values of different types are cached separately
+    assert cached_engine.dtype(True) == SimpleDtype()
+    assert cached_engine.n_resolved == 2
+
+    # uncached, unhashable and invalid data types
+    for data_type in [1.0, 1.0, ["int"], ["int"], "foo", "foo"]:
+        try:
+            cached_engine.dtype(data_type)
+        except TypeError:
+            pass
+    assert cached_engine.n_resolved == 8
+
+    # registering data types clears the cache
+    @cached_engine.register_dtype(equivalents=["float"])
+    class _Dtype(BaseDataType):
+        pass
+
+    cached_engine.dtype("int")
+    assert cached_engine.n_resolved == 9
+    cached_engine.clear_dtype_cache()
+    cached_engine.dtype("int")
+    assert cached_engine.n_resolved == 10
+
+
+def test_cached_dtype_size(cached_engine, monkeypatch):
+    """Test that the oldest data types are evicted from the cache."""
+    monkeypatch.setattr(engine_module, "DTYPE_CACHE_SIZE", 2)
+
+    @cached_engine.register_dtype
+    class _Dtype(BaseDataType):
+        @classmethod
+        def from_parametrized_dtype(cls, x: str):
+            return cls()
+
+    for data_type in ["a", "b", "c", "b", "a"]:
+        cached_engine.dtype(data_type)
+    assert cached_engine.n_resolved == 4
+    assert len(Engine._registry[cached_engine].cache) == 2
@@ -13,6 +13,25 @@ from pandera.engines import utils
         [pd.Series(list("ab1cd3")), int, [False, False, True] * 2],
         [pd.Series(list("12345")), int, [True] * 5],
         [pd.Series([1, 2, "foo", "bar"]), float, [True, True, False, False]],
+        [
+            pd.Series([1.5, np.nan, np.inf, 3.0]),
+            int,
+            [True, False, False, True],
+        ],
+        [
+            pd.Series([1.5, np.nan, 300.0, "4", "x"]),
+            "Int8",
+            [False, True, False, True, False],
+        ],
+        [
+            pd.Series(["2020-01-01", None, "foo", "2020-13-01"]),
+            "datetime64[ns]",
+            [True, True, False, False],
+        ],
+        [pd.Series(["1 day", "foo"]), "timedelta64[ns]", [True, False]],
+        # data types without vectorized conversions are bisected
+        [pd.Series([1, "a", 2]), bool, [True, True, True]],
+        [pd.Series([1 + 1j, "a", 2]), float, [False, False, True]],
     ],
 )
 def test_numpy_pandas_coercible(
@@ -25,6 +44,16 @@ def test_numpy_pandas_coercible(
     )
 
 
+def test_numpy_pandas_coercible_duplicated_index() -> None:
+    """Test that values with duplicated index labels are checked by
+    position."""
+    series = pd.Series(["1", "x", "2", "y"], index=[0, 0, 1, 1])
+    for values in [series, series.astype("string")]:
+        coercible = utils.numpy_pandas_coercible(values, int)
+        assert coercible.tolist() == [True, False, True, False]
+        assert coercible.index.equals(series.index)
+
+
 @pytest.mark.parametrize(
     "data_container",
     [
@@ -46,6 +75,25 @@ def test_numpy_pandas_coerce_failure_cases(data_container):
     assert failure_cases.empty
 
 
+def test_numpy_pandas_coerce_failures() -> None:
+    """Test that coercion failures are located by position."""
+    index = pd.Index(["1", "x", "2"], name="a")
+    failure_cases, check_output = utils.numpy_pandas_coerce_failures(
+        index, int
+    )
+    assert failure_cases.to_dict("list") == {
+        "index": ["x"],
+        "failure_case": ["x"],
+    }
+    assert check_output.tolist() == [True, False, True]
+    assert check_output.index.equals(pd.RangeIndex(3))
+
+    series = pd.Series(["1", "x"], index=[3, 3])
+    _, check_output = utils.numpy_pandas_coerce_failures(series, int)
+    assert check_output.tolist() == [True, False]
+    assert check_output.index.equals(series.index)
+
+
 @pytest.mark.parametrize(
     "invalid_data_container, exception_type",
     [
@@ -0,0 +1,153 @@
+"""Tests for the columnar storage of failure cases."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import (
+    Check,
+    Column,
+    DataFrameSchema,
+    check_utils,
+    constants,
+    errors,
+)
+from pandera.error_formatters import reshape_failure_cases
+from pandera.failure_cases import (
+    CheckFailureCases,
+    FailureCaseStore,
+    StoredFailureCases,
+)
+
+
+@pytest.mark.parametrize(
+    "failure_cases",
+    [
+        pd.Series([-1, -2], index=[3, 5]),
+        pd.Series([1.5, np.nan, 1.5], index=["a", "b", "c"]),
+        pd.Series(
+            pd.to_datetime(["2020-01-01", None]).tz_localize("UTC"),
+            index=[0, 0],
+        ),
+        pd.Series([1, True, "a", None]),
+        pd.Series(
+            [1, 2],
+            index=pd.MultiIndex.from_arrays([[1, 2], ["a", "b"]]),
+        ),
+        pd.DataFrame({"a": [1, 2], "b": [3.0, np.nan]}, index=[4, 6]),
+    ],
+)
+@pytest.mark.parametrize("ignore_na", [True, False])
+def test_failure_case_store(failure_cases, ignore_na) -> None:
+    """Test that stored failure cases are the same as reshaped ones."""
+    error = errors.SchemaError(
+        Column(name="a"),
+        None,
+        "message",
+        failure_cases=CheckFailureCases(failure_cases, ignore_na),
+    )
+    store = FailureCaseStore()
+    store.add(error)
+    assert isinstance(error._failure_cases, StoredFailureCases)
+    assert error.failure_cases is not None
+    pd.testing.assert_frame_equal(
+        error.failure_cases.reset_index(drop=True),
+        reshape_failure_cases(failure_cases, ignore_na).reset_index(drop=True),
+    )
+
+    # failure cases are copied from other stores without decoding them
+    other_store = FailureCaseStore()
+    other_store.add(error)
+    assert error._failure_cases.store is other_store
+    assert error.failure_cases is not None
+    pd.testing.assert_frame_equal(
+        error.failure_cases.reset_index(drop=True),
+        reshape_failure_cases(failure_cases, ignore_na).reset_index(drop=True),
+    )
+
+
+def test_failure_case_positions() -> None:
+    """Test that failure cases of checks are stored with their positions."""
+    schema = DataFrameSchema(
+        {"a": Column(float, Check.ge(0, n_failure_cases=None), nullable=True)}
+    )
+    df = pd.DataFrame({"a": [1.0, -1.0, np.nan, -2.0]}, index=[0, 0, 1, 1])
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    stored = exc.value.schema_errors[0]["error"]._failure_cases
+    np.testing.assert_array_equal(
+        stored.store.positions(stored.error_id), [1, 3]
+    )
+    assert exc.value.failure_cases["index"].tolist() == [0, 1]
+
+
+def test_failure_case_memory_limit(monkeypatch) -> None:
+    """Test that failure cases beyond the memory limit are dropped."""
+    schema = DataFrameSchema(
+        {
+            col: Column(int, Check.ge(0, n_failure_cases=None))
+            for col in ["a", "b", "c"]
+        }
+    )
+    df = pd.DataFrame({col: -np.arange(1, 10_001) for col in "abc"})
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    assert len(exc.value.failure_cases) == 30_000
+    assert exc.value.n_dropped_failure_cases == 0
+    assert "dropped" not in str(exc.value)
+
+    monkeypatch.setattr(constants, "MAX_FAILURE_CASE_BYTES", 200_000)
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    failure_cases = exc.value.failure_cases
+    stores = {
+        id(error_dict["error"]._failure_cases.store): (
+            error_dict["error"]._failure_cases.store
+        )
+        for error_dict in exc.value.schema_errors
+    }
+    assert len(stores) == 1
+    assert next(iter(stores.values())).nbytes <= 200_000
+    assert 0 < len(failure_cases) < 30_000
+    assert exc.value.n_dropped_failure_cases == 30_000 - len(failure_cases)
+    # the first failure cases of each check are kept
+    for _, column_failure_cases in failure_cases.groupby("column"):
+        assert sorted(column_failure_cases.failure_case, reverse=True) == list(
+            range(-1, -len(column_failure_cases) - 1, -1)
+        )
+    assert (
+        f"{exc.value.n_dropped_failure_cases} failure cases were dropped"
+        in str(exc.value)
+    )
+
+
+def test_failure_cases_built_within_memory_limit(monkeypatch) -> None:
+    """Test that checks don't build failure cases beyond the memory limit."""
+    monkeypatch.setattr(
+        constants,
+        "MAX_FAILURE_CASE_BYTES",
+        100 * check_utils.FAILURE_CASE_BYTES,
+    )
+    series = pd.Series(-np.arange(1, 1001))
+    for check in [
+        Check.ge(0, n_failure_cases=None),
+        Check(lambda s: s >= 0, n_failure_cases=None),
+    ]:
+        assert len(check(series).failure_cases) == 100
+    assert len(Check.ge(0, n_failure_cases=10)(series).failure_cases) == 10
+
+    schema = DataFrameSchema({"a": Column(float, nullable=False)})
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(pd.DataFrame({"a": np.full(1000, np.nan)}), lazy=True)
+    n_dropped = exc.value.n_dropped_failure_cases
+    assert len(exc.value.failure_cases) + n_dropped == 1000
+
+
+def test_reshape_multiindex_failure_cases() -> None:
+    """Test that MultiIndex labels are formatted as tuples."""
+    index = pd.MultiIndex.from_arrays([[1, 2], ["x", "y"]])
+    reshaped = reshape_failure_cases(pd.Series([10, 20], index=index))
+    assert reshaped["index"].tolist() == ["(1, 'x')", "(2, 'y')"]
+    reshaped = reshape_failure_cases(pd.DataFrame({"a": [10, 20]}, index))
+    assert reshaped["index"].tolist() == ["(1, 'x')", "(2, 'y')"]
@@ -0,0 +1,362 @@
+"""Tests for incremental and streaming validation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, Index, MultiIndex, errors
+from pandera.incremental import (
+    ColumnSketch,
+    IncrementalValidator,
+    ValidatedFrame,
+)
+
+
+def _chunks(df: pd.DataFrame, chunksize: int):
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start : start + chunksize]
+
+
+def test_validate_stream() -> None:
+    """Test that validated chunks are yielded lazily."""
+    schema = DataFrameSchema(
+        {"a": Column(int, Check.ge(0)), "b": Column(float, coerce=True)}
+    )
+    df = pd.DataFrame({"a": range(10), "b": range(10)})
+
+    stream = schema.validate_stream(_chunks(df, 3))
+    first_chunk = next(stream)
+    assert first_chunk["b"].dtype == np.dtype(float)
+    assert first_chunk.pandera.schema is schema
+    validated_df = pd.concat([first_chunk, *stream])
+    pd.testing.assert_frame_equal(validated_df, df.astype({"b": float}))
+
+    invalid_df = df.assign(a=lambda df: df["a"] - 5)
+    stream = schema.validate_stream(_chunks(invalid_df, 3))
+    with pytest.raises(errors.SchemaError, match="greater_than_or_equal"):
+        list(stream)
+
+
+@pytest.mark.parametrize(
+    "schema, df, failure_cases",
+    [
+        [
+            DataFrameSchema({"a": Column(int, unique=True)}),
+            pd.DataFrame({"a": [1, 2, 3, 4, 2, 5, 1, 6, 7]}),
+            [2, 1],
+        ],
+        [
+            DataFrameSchema({"a_.+": Column(int, unique=True, regex=True)}),
+            pd.DataFrame({"a_1": [1, 2, 3, 4, 2, 5, 1, 6, 7]}),
+            [2, 1],
+        ],
+        [
+            DataFrameSchema({"id": Column(int)}, unique="id"),
+            pd.DataFrame({"id": [1, 2, 3, 4, 2, 5, 1, 6, 7]}),
+            [2, 1],
+        ],
+        [
+            DataFrameSchema(
+                {"a": Column(int), "b": Column(int)}, unique=["a", "b"]
+            ),
+            pd.DataFrame({"a": [1, 1, 2, 1, 3, 4], "b": [1, 2, 1, 2, 1, 1]}),
+            [1, 2],
+        ],
+        [
+            DataFrameSchema(index=Index(int, unique=True)),
+            pd.DataFrame(index=[0, 1, 2, 3, 1, 4, 0]),
+            [1, 0],
+        ],
+        [
+            DataFrameSchema(
+                index=MultiIndex(
+                    [Index(int, name="i0", unique=True), Index(int, name="i1")]
+                ),
+            ),
+            pd.DataFrame(
+                index=pd.MultiIndex.from_arrays(
+                    [[0, 1, 2, 3, 1], [0, 0, 0, 0, 0]], names=["i0", "i1"]
+                )
+            ),
+            [1],
+        ],
+    ],
+)
+def test_validate_stream_unique(schema, df, failure_cases) -> None:
+    """Test that uniqueness is validated across chunks."""
+    # chunks of three rows have no duplicates within chunks
+    for chunk in _chunks(df, 3):
+        schema.validate(chunk)
+    with pytest.raises(errors.SchemaError, match="across batches"):
+        list(schema.validate_stream(_chunks(df, 3)))
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(schema.validate_stream(_chunks(df, 3), lazy=True))
+    assert sorted(exc.value.failure_cases.failure_case) == sorted(
+        failure_cases
+    )
+
+
+def test_validate_stream_unique_within_chunks() -> None:
+    """Test that duplicates within a chunk aren't reported twice."""
+    schema = DataFrameSchema({"a": Column(int, unique=True)})
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3, 1, 1]})]
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(schema.validate_stream(chunks, lazy=True))
+    failure_cases = exc.value.failure_cases
+    assert failure_cases.failure_case.tolist() == [1, 1]
+    assert exc.value.error_counts == {"schema_component_check": 1}
+
+
+def test_validate_stream_aggregate_checks() -> None:
+    """Test that aggregate checks are evaluated on the whole stream."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, [Check.ge(0), Check(lambda s: s.mean() > 4)]),
+            "b": Column(str),
+            "group": Column(str),
+        },
+        checks=[
+            Check(lambda df: df["a"].sum() > 40),
+            Check(lambda df: df["b"] != "x"),
+        ],
+        index=Index(int, Check(lambda s: s.is_monotonic_increasing)),
+    )
+    df = pd.DataFrame(
+        {"a": range(10), "b": ["y"] * 10, "group": ["g1", "g2"] * 5}
+    )
+    # the mean of the first chunk is 1 and the sum of the data is 45
+    with pytest.warns(UserWarning, match="kept in memory") as record:
+        validated_df = pd.concat(schema.validate_stream(_chunks(df, 3)))
+    pd.testing.assert_frame_equal(validated_df, df)
+    assert len(record) == 1
+    assert "['a: <lambda>', '<lambda>', 'index: <lambda>']" in str(
+        record[0].message
+    )
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(schema.validate_stream(_chunks(df.iloc[::-1], 3), lazy=True))
+    failure_cases = exc.value.failure_cases
+    assert failure_cases.check.tolist() == ["<lambda>"]
+    assert failure_cases.check_number.tolist() == [0]
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(schema.validate_stream(_chunks(df.head(5), 3), lazy=True))
+    failure_cases = exc.value.failure_cases.sort_values("check_number")
+    assert failure_cases.column.tolist() == [None, "a"]
+    assert failure_cases.check_number.tolist() == [0, 1]
+
+    grouped_schema = DataFrameSchema(
+        {
+            "a": Column(
+                int,
+                Check(
+                    lambda g: g["g2"].sum() > g["g1"].sum(), groupby="group"
+                ),
+            ),
+            "group": Column(str),
+        }
+    )
+    # within each chunk of a single row, one of the groups is missing
+    validated_df = pd.concat(
+        grouped_schema.validate_stream(_chunks(df[["a", "group"]], 1))
+    )
+    pd.testing.assert_frame_equal(validated_df, df[["a", "group"]])
+    with pytest.raises(errors.SchemaError):
+        list(
+            grouped_schema.validate_stream(
+                _chunks(df.assign(group=["g2", "g1"] * 5), 1)
+            )
+        )
+
+
+def test_validate_stream_partially_consumed() -> None:
+    """Test that the end of the stream is only validated once all
+    dataframes have been consumed."""
+    schema = DataFrameSchema(
+        {"a": Column(int, [Check.ge(0), Check(lambda s: s.mean() > 10)])}
+    )
+    df = pd.DataFrame({"a": [-1, 1, 2, 3]})
+    stream = schema.validate_stream(_chunks(df, 2), lazy=True)
+    # the errors of the first chunk and the aggregate check aren't raised
+    assert next(stream)["a"].tolist() == [-1, 1]
+    stream.close()
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(schema.validate_stream(_chunks(df, 2), lazy=True))
+    assert exc.value.failure_cases.check.tolist() == [
+        "greater_than_or_equal_to(0)",
+        "<lambda>",
+    ]
+
+
+def test_validate_stream_combined_errors() -> None:
+    """Test that the errors of all chunks are combined in lazy mode, keeping
+    a bounded sample of failure cases."""
+    schema = DataFrameSchema({"a": Column(int, Check.ge(0)), "b": Column(int)})
+    df = pd.DataFrame({"a": range(-100, 100), "b": 1})
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(
+            schema.validate_stream(
+                _chunks(df, 7), lazy=True, max_failure_cases=20
+            )
+        )
+    assert exc.value.error_counts == {"schema_component_check": 1}
+    failure_cases = exc.value.failure_cases
+    assert len(failure_cases) == 20
+    assert failure_cases.failure_case.isin(range(-100, 0)).all()
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        list(
+            schema.validate_stream(
+                _chunks(df, 7), lazy=True, max_failure_cases=None
+            )
+        )
+    assert sorted(exc.value.failure_cases.failure_case) == list(range(-100, 0))
+
+
+def test_failure_case_sample_is_uniform() -> None:
+    """Test that failure cases are sampled uniformly from all chunks."""
+    schema = DataFrameSchema({"a": Column(int, Check.ge(0))})
+    df = pd.DataFrame({"a": [-1] * 2000})
+    counts = np.zeros(10)
+    for seed in range(10):
+        validator = IncrementalValidator(
+            schema, lazy=True, max_failure_cases=50, random_state=seed
+        )
+        for chunk in _chunks(df, 200):
+            validator.validate(chunk)
+        with pytest.raises(errors.SchemaErrors) as exc:
+            validator.finish()
+        index = exc.value.failure_cases["index"].astype(int)
+        counts += np.bincount(index // 200, minlength=10)
+    # each chunk is expected to have 50 of the 500 sampled failure cases
+    assert counts.sum() == 500
+    assert (counts > 25).all()
+
+
+def test_incremental_validator_rollback() -> None:
+    """Test that rolling back forgets the batches validated since the last
+    checkpoint."""
+    schema = DataFrameSchema(
+        {
+            "id": Column(
+                int, [Check.ge(0), Check(lambda s: s.sum() < 10)], unique=True
+            )
+        }
+    )
+    validator = IncrementalValidator(schema, lazy=True)
+    with pytest.raises(ValueError):
+        validator.rollback()
+    validator.validate(pd.DataFrame({"id": [1, 2]}))
+    validator.checkpoint()
+    validator.validate(pd.DataFrame({"id": [3, -4]}))
+    validator.validate(pd.DataFrame({"id": [2]}))
+    assert len(validator.schema_errors) == 2
+    validator.rollback()
+    assert validator.schema_errors == []
+
+    # the values of the rolled back batches aren't duplicates
+    validator.validate(pd.DataFrame({"id": [3, 4]}))
+    with pytest.raises(errors.SchemaErrors) as exc:
+        validator.finish()
+    # the aggregate check is evaluated on the batches that weren't rolled
+    # back
+    assert exc.value.failure_cases.check.tolist() == ["<lambda>"]
+
+
+def test_validated_frame() -> None:
+    """Test that appended rows are validated against the previous rows."""
+    schema = DataFrameSchema(
+        {
+            "id": Column(int, unique=True),
+            "x": Column(float, [Check.ge(0), Check(lambda s: s.sum() < 10)]),
+            "tag": Column(str, nullable=True),
+        },
+    )
+    frame = ValidatedFrame(
+        schema, pd.DataFrame({"id": [1, 2], "x": [1.0, 2.0], "tag": "a"})
+    )
+    frame.append(pd.DataFrame({"id": [3], "x": [3.0], "tag": [None]}))
+    assert len(frame) == 3
+    assert frame.data["id"].tolist() == [1, 2, 3]
+    assert frame.data.pandera.schema is schema
+
+    invalid_rows = [
+        # duplicates of previous rows
+        pd.DataFrame({"id": [4, 1], "x": [0.0, 0.0], "tag": "b"}),
+        # the sum of x over all rows fails the aggregate check
+        pd.DataFrame({"id": [4], "x": [4.0], "tag": "b"}),
+        pd.DataFrame({"id": [4], "x": [-1.0], "tag": "b"}),
+    ]
+    for rows in invalid_rows:
+        with pytest.raises(errors.SchemaError):
+            frame.append(rows)
+    # the frame is unchanged by invalid rows
+    frame.append(pd.DataFrame({"id": [4], "x": [3.5], "tag": "b"}))
+    assert frame.data["id"].tolist() == [1, 2, 3, 4]
+
+    # aggregate checks are evaluated on the rows of the frame, which aren't
+    # copied by the validator
+    assert not frame._validator._aggregate_data
+
+    statistics = frame.statistics
+    assert statistics["count"].to_dict() == {"id": 4, "x": 4, "tag": 3}
+    assert statistics["null_count"].to_dict() == {"id": 0, "x": 0, "tag": 1}
+    assert statistics["min"].to_dict() == {"id": 1, "x": 1.0, "tag": "a"}
+    assert statistics["max"].to_dict() == {"id": 4, "x": 3.5, "tag": "b"}
+
+
+def test_validated_frame_lazy() -> None:
+    """Test that all errors of appended rows are raised in lazy mode."""
+    schema = DataFrameSchema(
+        {"id": Column(int, unique=True), "x": Column(int, Check.ge(0))}
+    )
+    frame = ValidatedFrame(
+        schema, pd.DataFrame({"id": [1, 2], "x": [0, 0]}), lazy=True
+    )
+    for _ in range(2):
+        with pytest.raises(errors.SchemaErrors) as exc:
+            frame.append(pd.DataFrame({"id": [2, 3], "x": [-1, 0]}))
+        failure_cases = exc.value.failure_cases
+        assert failure_cases.failure_case.tolist() == [-1, 2]
+    assert frame.append(pd.DataFrame({"id": [3], "x": [0]})).data[
+        "id"
+    ].tolist() == [1, 2, 3]
+
+
+def test_column_sketch() -> None:
+    """Test that column statistics are merged across appends."""
+    sketch = ColumnSketch().update(pd.Series([np.nan, np.nan]))
+    assert sketch == ColumnSketch(0, 2)
+    sketch = sketch.update(pd.Series([3.0, np.nan, 1.0]))
+    assert sketch == ColumnSketch(2, 3, 1.0, 3.0)
+    sketch = sketch.update(pd.Series([5.0]))
+    assert sketch == ColumnSketch(3, 3, 1.0, 5.0)
+    # values that can't be ordered have no minimum and maximum
+    sketch = sketch.update(pd.Series(["a"]))
+    assert sketch == ColumnSketch(4, 3)
+    assert sketch.update(pd.Series([0.0])) == ColumnSketch(5, 3)
+
+
+def test_dataframe_accessor_append() -> None:
+    """Test appending rows to a validated dataframe with the accessor."""
+    schema = DataFrameSchema({"id": Column(int, unique=True)})
+    df = schema(pd.DataFrame({"id": [1, 2]}))
+    appended = df.pandera.append(pd.DataFrame({"id": [3]}))
+    assert appended["id"].tolist() == [1, 2, 3]
+    assert appended.pandera.schema is schema
+    assert df["id"].tolist() == [1, 2]
+
+    validated_frame = appended.pandera._validated_frame
+    appended = appended.pandera.append(pd.DataFrame({"id": [4]}))
+    assert appended.pandera._validated_frame is validated_frame
+    with pytest.raises(errors.SchemaError):
+        appended.pandera.append(pd.DataFrame({"id": [1]}))
+    # appending to a dataframe that was appended to before rebuilds the
+    # state of the validation
+    assert df.pandera.append(pd.DataFrame({"id": [4]}))["id"].tolist() == [
+        1,
+        2,
+        4,
+    ]
+    with pytest.raises(ValueError, match="validated by a DataFrameSchema"):
+        pd.DataFrame({"id": [1]}).pandera.append(pd.DataFrame({"id": [2]}))
@@ -1,6 +1,7 @@
 """Tests schema creation and validation from type annotations."""
 # pylint:disable=missing-class-docstring,missing-function-docstring,too-few-public-methods
 import re
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal  # pylint:disable=C0415
 from typing import Any, Iterable, Optional
 
@@ -687,6 +688,32 @@ def test_config() -> None:
     assert expected == Child.to_schema()
 
 
+def test_config_concurrent_validation() -> None:
+    """Test that Config options for concurrent validation are passed to the
+    DataFrameSchema."""
+    with ThreadPoolExecutor(max_workers=2) as thread_pool:
+
+        class Schema(pa.SchemaModel):
+            a: Series[int] = pa.Field(gt=0)
+            b: Series[int] = pa.Field(gt=0)
+
+            class Config:
+                n_jobs = 2
+
+        class ExecutorSchema(Schema):
+            class Config:
+                executor = thread_pool
+
+        assert Schema.to_schema().n_jobs == 2
+        assert ExecutorSchema.to_schema().executor is thread_pool
+
+        df = pd.DataFrame({"a": [1, -1], "b": [-1, 1]})
+        for schema in (Schema, ExecutorSchema):
+            with pytest.raises(pa.errors.SchemaErrors) as exc:
+                schema.validate(df, lazy=True)
+            assert exc.value.failure_cases["column"].tolist() == ["a", "b"]
+
+
 class Input(pa.SchemaModel):
     a: Series[int]
     b: Series[int]
@@ -3,6 +3,7 @@
 import pandas as pd
 import pytest
 
+import pandera as pa
 from pandera.engines import pandas_engine
 from pandera.errors import ParserError
 
@@ -42,3 +43,93 @@ def test_pandas_data_type_coerce(data_type):
         data_type().coerce(pd.Series(["1", "2", "a"]))
     except ParserError as exc:
         assert exc.failure_cases.shape[0] > 0
+
+
+def test_pandas_engine_dtype_cache():
+    """Test that the data types of columns are resolved from the cache."""
+    pandas_engine.Engine.clear_dtype_cache()
+    data_type = pd.Series([1, 2]).dtype
+    assert pandas_engine.Engine.dtype(data_type) is (
+        pandas_engine.Engine.dtype(data_type)
+    )
+
+    # unordered categories in a different order are equal, but aren't the
+    # same data type
+    categories = pandas_engine.Engine.dtype(pd.CategoricalDtype(["a", "b"]))
+    reversed_categories = pandas_engine.Engine.dtype(
+        pd.CategoricalDtype(["b", "a"])
+    )
+    assert categories.type.categories.tolist() == ["a", "b"]
+    assert reversed_categories.type.categories.tolist() == ["b", "a"]
+
+
+@pytest.mark.parametrize(
+    "data, data_type, expected_dtype",
+    [
+        [[1, 2, 100], pandas_engine.CompactInt(), "int8"],
+        [["1", "-300"], pandas_engine.CompactInt(), "int16"],
+        [[1, 200], pandas_engine.CompactInt(), "int16"],
+        [[1, 200], pandas_engine.CompactInt(unsigned=True), "uint8"],
+        [[-1, 200], pandas_engine.CompactInt(unsigned=True), "int16"],
+        [[1.0, None, 2 ** 40], pandas_engine.CompactInt(), "Int64"],
+        [[1.0, None], pandas_engine.CompactInt(unsigned=True), "UInt8"],
+        [[0.5, 1.25, None], pandas_engine.CompactFloat(), "float32"],
+        [[0.1], pandas_engine.CompactFloat(), "float64"],
+        [[0.1], pandas_engine.CompactFloat(rtol=1e-6), "float32"],
+        [[1e300], pandas_engine.CompactFloat(rtol=1e-6), "float64"],
+        [list("aab"), pandas_engine.CompactCategory(), "object"],
+        [list("aaab"), pandas_engine.CompactCategory(), "object"],
+        [list("aaaab"), pandas_engine.CompactCategory(), "category"],
+        [
+            [1, 1, 1],
+            pandas_engine.CompactCategory(dtype=float, max_cardinality=0.9),
+            "category",
+        ],
+    ],
+)
+def test_compact_data_types(data, data_type, expected_dtype):
+    """Test that compact data types coerce data to the smallest data type
+    that represents its values, and accept the data types they coerce to."""
+    data = pd.Series(data)
+    coerced = data_type.coerce(data)
+    assert coerced.dtype == expected_dtype
+    assert data_type.check(pandas_engine.Engine.dtype(coerced.dtype))
+    assert pandas_engine.Engine.dtype(data_type) is data_type
+    assert not data_type.check(pandas_engine.Engine.dtype(bool))
+
+
+def test_compact_data_types_dataframe():
+    """Test that compact data types coerce each column of a dataframe and
+    validate data in one pass."""
+    df = pd.DataFrame({"a": [1, 2], "b": [1000, 2]})
+    coerced = pandas_engine.CompactInt().coerce(df)
+    assert coerced.dtypes.tolist() == ["int8", "int16"]
+
+    schema = pa.DataFrameSchema(
+        {
+            "int": pa.Column(pandas_engine.CompactInt(), coerce=True),
+            "float": pa.Column(pandas_engine.CompactFloat(), coerce=True),
+            "str": pa.Column(
+                pandas_engine.CompactCategory(),
+                pa.Check.isin(["a", "b"]),
+                coerce=True,
+            ),
+        }
+    )
+    features = pd.DataFrame(
+        {"int": range(100), "float": [0.5] * 100, "str": ["a", "b"] * 50}
+    )
+    validated = schema.validate(features)
+    assert validated.dtypes.astype(str).tolist() == [
+        "int8",
+        "float32",
+        "category",
+    ]
+    assert (
+        validated.memory_usage(deep=True).sum()
+        < features.memory_usage(deep=True).sum()
+    )
+    pd.testing.assert_frame_equal(schema.validate(validated), validated)
+
+    with pytest.raises(pa.errors.SchemaError, match="CompactInt"):
+        schema.validate(features.assign(int=["x"] * 100))
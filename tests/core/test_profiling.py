@@ -0,0 +1,161 @@
+"""Tests for the profiling of validation."""
+# pylint: disable=redefined-outer-name
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import (
+    Check,
+    Column,
+    DataFrameSchema,
+    Index,
+    SeriesSchema,
+    profiling,
+)
+from pandera.profiling import PROFILE_COLUMNS, profile
+from pandera.reports import ValidationReport
+
+
+@pytest.fixture
+def schema() -> DataFrameSchema:
+    """Schema with column, index and dataframe checks and coercion."""
+    return DataFrameSchema(
+        {
+            "a": Column(int, [Check.ge(0), Check(lambda s: s.cumsum() >= 0)]),
+            "b": Column(float, Check.lt(10), coerce=True),
+        },
+        checks=Check(lambda df: df["a"] >= df["b"], name="a_ge_b"),
+        index=Index(int, Check.ge(0)),
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_profile(schema, n_jobs) -> None:
+    """Test that checks, coercions and schema components are measured."""
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 10})
+    with profile() as validation_profile:
+        schema.validate(df, n_jobs=n_jobs)
+    assert validation_profile.duration is not None
+    assert validation_profile.duration > 0
+
+    records = validation_profile.to_frame()
+    assert records.columns.tolist() == PROFILE_COLUMNS
+    assert (records["n_rows"] == 1000).all()
+    assert (records["duration"] >= 0).all()
+    assert (records["allocated_bytes"] >= 0).all()
+
+    by_check = validation_profile.by_check()
+    assert by_check["duration"].is_monotonic_decreasing
+    assert set(
+        by_check[["schema_context", "column", "check"]]
+        .fillna("")
+        .itertuples(index=False, name=None)
+    ) == {
+        ("Column", "a", "greater_than_or_equal_to(0)"),
+        ("Column", "a", "<lambda>"),
+        ("Column", "b", "less_than(10)"),
+        ("Column", "b", "coerce_dtype('float64')"),
+        ("DataFrameSchema", "", "a_ge_b"),
+        ("Index", "", "greater_than_or_equal_to(0)"),
+    }
+    # the cumulative sum allocates a new array. Allocations are traced for
+    # the whole process, so they're only checked without concurrency, and
+    # temporary allocations are only measured from python 3.9.
+    if n_jobs == 1 and profiling._RESET_PEAK:
+        assert (
+            by_check.set_index("check").loc["<lambda>", "allocated_bytes"]
+            >= df["a"].nbytes
+        )
+
+    by_column = validation_profile.by_column()
+    assert sorted(by_column["column"].fillna("")) == ["", "a", "b"]
+    # the validation of a column includes its checks
+    a_duration = by_column.set_index("column").loc["a", "duration"]
+    assert (
+        a_duration >= by_check.loc[by_check["column"] == "a", "duration"].sum()
+    )
+
+
+def test_profile_without_memory_tracing(schema) -> None:
+    """Test that allocations aren't measured without memory tracing."""
+    df = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+    with profile(trace_memory=False) as validation_profile:
+        schema.validate(df)
+    records = validation_profile.to_frame()
+    assert not records.empty
+    assert records["allocated_bytes"].isna().all()
+
+
+def test_profile_net_allocations(schema, monkeypatch) -> None:
+    """Test that net allocations are measured when tracemalloc can't reset
+    its peak."""
+    monkeypatch.setattr(profiling, "_RESET_PEAK", False)
+    monkeypatch.delattr(profiling.tracemalloc, "reset_peak", raising=False)
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 10})
+    with profile() as validation_profile:
+        schema.validate(df)
+    records = validation_profile.to_frame()
+    assert records["allocated_bytes"].notna().all()
+    assert (records["allocated_bytes"] >= 0).all()
+    # the coerced column is kept after the coercion
+    coercion = records["check"] == "coerce_dtype('float64')"
+    assert (records.loc[coercion, "allocated_bytes"] >= df["b"].nbytes).all()
+
+
+def test_profile_inactive(schema, monkeypatch) -> None:
+    """Test that validation isn't measured outside of profiles."""
+
+    def _span(*args, **kwargs):
+        raise AssertionError("validation was measured")
+
+    monkeypatch.setattr(profiling, "_Span", _span)
+    schema.validate(pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}))
+
+    with profile() as validation_profile:
+        pass
+    schema.validate(pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]}))
+    assert validation_profile.to_frame().empty
+
+
+def test_profile_nested() -> None:
+    """Test that nested profiles record the same measurements."""
+    schema = SeriesSchema(
+        int, [Check(lambda s: s >= 0), Check(lambda s: s <= 10)]
+    )
+    with profile() as outer:
+        schema.validate(pd.Series([1, 2]))
+        with profile(trace_memory=False) as inner:
+            schema.validate(pd.Series([1, 2, 3]))
+    assert len(outer.to_frame()) == 6
+    inner_records = inner.to_frame()
+    assert inner_records["n_rows"].tolist() == [3, 3, 3]
+    assert inner_records["check"].tolist() == ["<lambda>", "<lambda>", None]
+    pd.testing.assert_frame_equal(
+        inner_records.drop(columns=["allocated_bytes", "duration"]),
+        outer.to_frame()
+        .iloc[3:]
+        .reset_index(drop=True)
+        .drop(columns=["allocated_bytes", "duration"]),
+    )
+
+
+def test_profile_report(schema) -> None:
+    """Test that reports have the time spent in the failing checks."""
+    df = pd.DataFrame({"a": [-1, 20], "b": ["1", "10"]})
+    with profile() as validation_profile:
+        summary = schema.validate_summary(df)
+    report = ValidationReport.from_summary(summary, validation_profile)
+    assert report.failures["check"].tolist() == [
+        "greater_than_or_equal_to(0)",
+        "<lambda>",
+        "less_than(10)",
+        "a_ge_b",
+    ]
+    assert report.failures["duration"].notna().all()
+    assert (
+        ValidationReport.from_summary(summary)
+        .failures["duration"]
+        .isna()
+        .all()
+    )
@@ -0,0 +1,158 @@
+"""Tests for summary reports of validation."""
+# pylint: disable=redefined-outer-name
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, SeriesSchema, errors
+from pandera.reports import REPORT_DTYPES, ValidationReport, ValidationSummary
+
+
+@pytest.fixture
+def schema() -> DataFrameSchema:
+    """Schema with checks on columns and on the dataframe."""
+    return DataFrameSchema(
+        {
+            "a": Column(int, [Check.ge(0), Check.lt(90)]),
+            "b": Column(float),
+            "c": Column(str, unique=True),
+        },
+        checks=Check(lambda df: df["a"] != 50),
+    )
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Dataframe with rows failing all the checks of the schema."""
+    return pd.DataFrame(
+        {
+            "a": np.arange(1000) % 100 - 5,
+            "b": np.where(np.arange(1000) % 8 == 0, np.nan, 1.0),
+            "c": [str(i % 900) for i in range(1000)],
+        }
+    )
+
+
+def test_summary_report(schema, df, monkeypatch) -> None:
+    """Test that the failures of each check are counted."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("failure cases shouldn't be collected")
+
+    monkeypatch.setattr(
+        errors.SchemaErrors, "_parse_schema_errors", staticmethod(fail)
+    )
+    summary = schema.validate_summary(df, random_state=0)
+    assert isinstance(summary, ValidationSummary)
+    assert not summary.passed
+    assert summary.n_rows == 1000
+    pd.testing.assert_frame_equal(summary.data, df)
+
+    failures = summary.failures.set_index("check")
+    assert failures["column"].tolist() == ["a", "a", "b", "c", None]
+    expected = {
+        "greater_than_or_equal_to(0)": 50,
+        "less_than(90)": 50,
+        "not_nullable": 125,
+        "field_uniqueness": 100,
+        "<lambda>": 10,
+    }
+    assert failures["n_failures"].to_dict() == expected
+    assert failures["failure_ratio"].to_dict() == {
+        key: n / 1000 for key, n in expected.items()
+    }
+    assert summary.n_failures == sum(expected.values())
+
+    examples = failures["examples"]
+    assert all(len(values) == 5 for values in examples)
+    assert all(-5 <= v < 0 for v in examples["greater_than_or_equal_to(0)"])
+    assert all(v >= 90 for v in examples["less_than(90)"])
+    assert all(np.isnan(v) for v in examples["not_nullable"])
+
+
+def test_summary_report_passed(schema) -> None:
+    """Test the summary of data that passes validation."""
+    valid = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0], "c": ["x", "y"]})
+    summary = schema.validate_summary(valid)
+    assert summary.passed
+    assert summary.failures.empty
+    assert summary.n_failures == 0
+    pd.testing.assert_frame_equal(summary.data, valid)
+
+
+def test_summary_report_rows_subset(schema, df) -> None:
+    """Test that failure ratios are relative to the validated rows."""
+    summary = schema.validate_summary(df, head=100, tail=100)
+    assert summary.n_rows == 200
+    failures = summary.failures.set_index("check")
+    assert failures.loc["less_than(90)", "failure_ratio"] == 0.05
+
+
+def test_summary_report_non_row_errors(schema, df) -> None:
+    """Test that errors that don't concern rows have no failure count."""
+    summary = schema.validate_summary(
+        df.astype({"a": float}).drop(columns="b")
+    )
+    failures = summary.failures.set_index("check")
+    assert failures.loc["dtype('int64')", "examples"] == ["float64"]
+    for key in ["dtype('int64')", "column_in_dataframe"]:
+        assert failures.loc[key, "n_failures"] is pd.NA
+        assert np.isnan(failures.loc[key, "failure_ratio"])
+
+
+def test_summary_report_series() -> None:
+    """Test summary reports of series schemas."""
+    summary = SeriesSchema(int, Check.gt(3)).validate_summary(
+        pd.Series([1, 2, 5])
+    )
+    assert summary.failures["n_failures"].tolist() == [2]
+    assert summary.failures["examples"].tolist() == [[1, 2]]
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "ipc"])
+def test_validation_report(schema, df, tmp_path, file_format) -> None:
+    """Test that reports have typed columns and can be written to files."""
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df.rename(columns={"b": 1}), lazy=True)
+    report = ValidationReport.from_schema_errors(exc.value, random_state=0)
+    assert not report.passed
+    assert report.n_rows == 1000
+    assert report.failures.dtypes.to_dict() == REPORT_DTYPES
+    assert report.failures["column"].fillna("").tolist() == [
+        "",
+        "a",
+        "a",
+        "c",
+        "",
+    ]
+    assert all(
+        isinstance(value, str)
+        for examples in report.failures["examples"]
+        for value in examples
+    )
+
+    table = report.to_arrow()
+    assert str(table.schema.field("examples").type) == "list<item: string>"
+    path = tmp_path / f"report.{file_format}"
+    getattr(report, f"to_{file_format}")(path)
+    read_report = getattr(ValidationReport, f"read_{file_format}")(path)
+    assert read_report.n_rows == report.n_rows
+    pd.testing.assert_frame_equal(read_report.failures, report.failures)
+
+
+def test_validation_report_from_summary(schema, df) -> None:
+    """Test that reports are created from summaries."""
+    summary = schema.validate_summary(df, random_state=0)
+    report = ValidationReport.from_summary(summary)
+    assert report.failures["n_failures"].tolist() == (
+        summary.failures["n_failures"].tolist()
+    )
+    assert report.failures["examples"].iloc[0] == [
+        str(value) for value in summary.failures["examples"].iloc[0]
+    ]
+
+    valid = pd.DataFrame({"a": [1], "b": [1.0], "c": ["x"]})
+    report = ValidationReport.from_summary(schema.validate_summary(valid))
+    assert report.passed
+    assert ValidationReport.from_arrow(report.to_arrow()).passed
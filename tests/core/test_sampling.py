@@ -0,0 +1,155 @@
+"""Tests for sampling-based validation."""
+# pylint: disable=redefined-outer-name
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandera import Check, Column, DataFrameSchema, Index
+from pandera.sampling import SamplingValidator, _normal_quantile
+
+
+@pytest.fixture
+def schema() -> DataFrameSchema:
+    """Schema with column, index and dataframe checks."""
+    return DataFrameSchema(
+        {
+            "a": Column(int, [Check.ge(0), Check.lt(90)]),
+            "group": Column(str),
+        },
+        checks=Check.expr("a != 50"),
+        index=Index(int, Check.ge(0)),
+    )
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    """Dataframe with rows failing some of the checks of the schema."""
+    return pd.DataFrame(
+        {
+            "a": np.arange(10_000) % 100,
+            "group": np.where(np.arange(10_000) % 10 == 0, "rare", "common"),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "probability, quantile",
+    [
+        (0.5, 0.0),
+        (0.025, -1.959963984540054),
+        (0.95, 1.6448536269514722),
+        (0.975, 1.959963984540054),
+        (0.995, 2.5758293035489004),
+    ],
+)
+def test_normal_quantile(probability, quantile) -> None:
+    """Test the quantiles of the standard normal distribution."""
+    assert _normal_quantile(probability) == pytest.approx(quantile, abs=1e-9)
+
+
+def test_sampling_validator(schema, df) -> None:
+    """Test that failure rates are estimated from a sample of rows."""
+    report = SamplingValidator(
+        schema, sample_size=1000, random_state=0
+    ).validate(df)
+    assert report.sample_size == 1000
+    assert report.population_size == len(df)
+    assert not report.passed
+
+    sample = df.iloc[report.positions]
+    failure_rates = report.failure_rates.set_index(
+        ["schema_context", "check_number"]
+    )
+    assert failure_rates.loc[("Column", 0), "n_failed"] == 0
+    assert (
+        failure_rates.loc[("Column", 1), "n_failed"]
+        == (sample["a"] >= 90).sum()
+    )
+    assert (
+        failure_rates.loc[("DataFrameSchema", 0), "n_failed"]
+        == (sample["a"] == 50).sum()
+    )
+    assert failure_rates.loc[("Index", 0), "n_failed"] == 0
+    # the true failure rates are within the confidence intervals
+    for key, rate in [(("Column", 1), 0.1), (("DataFrameSchema", 0), 0.01)]:
+        lower, upper = failure_rates.loc[key, ["lower", "upper"]]
+        assert lower <= rate <= upper
+
+
+def test_sampling_validator_whole_population(schema, df) -> None:
+    """Test that failure rates are exact when the sample is the whole
+    dataframe."""
+    report = SamplingValidator(schema, sample_size=len(df)).validate(df)
+    failure_rates = report.failure_rates
+    assert (failure_rates["lower"] == failure_rates["upper"]).all()
+    assert failure_rates["failure_rate"].tolist() == [0.0, 0.1, 0.0, 0.01]
+    assert report.max_error == 0
+
+
+def test_sampling_validator_adaptive_sample_size(schema, df) -> None:
+    """Test that the sample grows until the target error is met."""
+    report = SamplingValidator(
+        schema, sample_size=100, max_error=0.02, random_state=0
+    ).validate(df)
+    assert report.sample_size > 100
+    assert report.max_error <= 0.02
+
+    report = SamplingValidator(
+        schema,
+        sample_size=100,
+        max_error=0.001,
+        max_sample_size=400,
+        random_state=0,
+    ).validate(df)
+    assert report.sample_size == 400
+    assert report.max_error > 0.001
+
+
+def test_sampling_validator_stratified(schema, df) -> None:
+    """Test that strata are sampled proportionally to their size."""
+    for seed in range(5):
+        report = SamplingValidator(
+            schema, sample_size=55, strata="group", random_state=seed
+        ).validate(df)
+        counts = df.iloc[report.positions]["group"].value_counts()
+        assert counts.to_dict() == {"common": 49, "rare": 6}
+        assert len(np.unique(report.positions)) == 55
+
+
+def test_sampling_validator_dtype_errors(schema, df) -> None:
+    """Test that errors that don't concern rows have no failure rate."""
+    report = SamplingValidator(schema, sample_size=100).validate(
+        df.astype({"a": float})
+    )
+    failure_rates = report.failure_rates.set_index("check")
+    assert failure_rates.loc["dtype('int64')", "failure_rate"] is not None
+    assert np.isnan(failure_rates.loc["dtype('int64')", "failure_rate"])
+
+
+def test_sampling_validator_stream(schema, df) -> None:
+    """Test that streams are sampled uniformly with reservoir sampling."""
+    chunks = [df.iloc[start : start + 700] for start in range(0, len(df), 700)]
+    counts = np.zeros(10)
+    for seed in range(10):
+        report = SamplingValidator(
+            schema, sample_size=200, random_state=seed
+        ).validate_stream(iter(chunks))
+        assert report.population_size == len(df)
+        assert report.sample_size == 200
+        assert len(np.unique(report.positions)) == 200
+        failure_rates = report.failure_rates.set_index(
+            ["schema_context", "check_number"]
+        )
+        assert (
+            failure_rates.loc[("Column", 1), "n_failed"]
+            == (df["a"].iloc[report.positions] >= 90).sum()
+        )
+        counts += np.bincount(report.positions // 1000, minlength=10)
+    # each block of 1000 rows is expected to have 200 of the sampled rows
+    assert (counts > 150).all()
+
+    report = SamplingValidator(schema, sample_size=200).validate_stream(
+        [df.iloc[:50], df.iloc[50:120]]
+    )
+    np.testing.assert_array_equal(report.positions, np.arange(120))
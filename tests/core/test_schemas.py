@@ -1,7 +1,9 @@
 """Testing creation and manipulation of DataFrameSchema objects."""
+
 # pylint: disable=too-many-lines,redefined-outer-name
 
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import partial
 from typing import Any, Callable, Dict, List, Tuple, Type, Union
@@ -10,6 +12,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import pandera.failure_cases
 from pandera import (
     Category,
     Check,
@@ -21,6 +24,7 @@ from pandera import (
     SeriesSchema,
     String,
     errors,
+    vectorized_checks,
 )
 from pandera.engines.pandas_engine import Engine
 from pandera.schemas import SeriesSchemaBase
@@ -698,6 +702,21 @@ def test_sample_dataframe_schema() -> None:
         assert schema.validate(df, sample=100, random_state=seed).equals(df)
 
 
+def test_head_tail_sample_duplicated_rows() -> None:
+    """Test that duplicated rows are validated when validating the head, tail
+    or a sample of a dataframe, while overlapping rows are validated once."""
+    df = pd.DataFrame({"col1": [1, 1, 2, 3, 3]}, index=[0, 0, 1, 2, 3])
+    schema = DataFrameSchema({"col1": Column(int, unique=True)})
+    for kwargs in [{"head": 2}, {"tail": 2}, {"sample": 5}]:
+        with pytest.raises(errors.SchemaError, match="duplicate"):
+            schema.validate(df, **kwargs)
+
+    schema = DataFrameSchema(
+        {"col1": Column(int, Check(lambda s: len(s) == 5))}
+    )
+    schema.validate(df, head=3, tail=3, sample=2, random_state=0)
+
+
 def test_dataframe_schema_str_repr() -> None:
     """Test the __str__ and __repr__ methods which are used for cleanly
     printing/logging of a DataFrameSchema."""
@@ -1306,6 +1325,46 @@ def test_lazy_dataframe_unique() -> None:
         assert list(errors_df["index"].values) == [0, 3, 0, 3]
 
 
+def test_lazy_failure_case_reporting(monkeypatch) -> None:
+    """Test that failure cases and error messages are built on access."""
+    reshaped = []
+    reshape_failure_cases = pandera.failure_cases.reshape_failure_cases
+
+    def _reshape_failure_cases(*args):
+        reshaped.append(args)
+        return reshape_failure_cases(*args)
+
+    monkeypatch.setattr(
+        pandera.failure_cases, "reshape_failure_cases", _reshape_failure_cases
+    )
+    schema = DataFrameSchema(
+        {"a": Column(int, Check.ge(0)), "b": Column(int, Check.lt(2))}
+    )
+    data = pd.DataFrame({"a": [-1, 0, -2], "b": [1, 2, 3]})
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(data, lazy=True)
+    assert exc.value.error_counts == {"schema_component_check": 2}
+    assert exc.value._failure_cases is None
+    assert exc.value._message is None
+
+    failure_cases = exc.value.failure_cases
+    assert failure_cases.failure_case.tolist() == [-1, -2, 2, 3]
+    assert exc.value.failure_cases is failure_cases
+    assert "A total of 2 schema errors were found" in str(exc.value)
+    assert exc.value.args == (str(exc.value),)
+    # failure cases of series are stored without reshaping them
+    assert not reshaped
+
+    with pytest.raises(errors.SchemaError) as schema_error:
+        schema.validate(data)
+    assert not reshaped
+    assert "failure cases:" in str(schema_error.value)
+    assert schema_error.value.failure_cases is not None
+    assert schema_error.value.failure_cases.failure_case.tolist() == [-1, -2]
+    assert len(reshaped) == 1
+
+
 @pytest.mark.parametrize(
     "schema, data, expectation",
     [
@@ -1544,6 +1603,329 @@ def test_schema_coerce_inplace_validation(
         assert df["column"].dtype == from_dtype
 
 
+@pytest.mark.parametrize(
+    "from_dtype,to_dtype",
+    [
+        [float, int],
+        [int, float],
+        [object, int],
+        [int, object],
+    ],
+)
+def test_schema_coerce_copy_free_validation(
+    from_dtype: Type, to_dtype: Type
+) -> None:
+    """Test that copy=False never modifies the validated dataframe."""
+    from_dtype = (
+        from_dtype if from_dtype is not int else str(Engine.dtype(from_dtype))
+    )
+    to_dtype = to_dtype if to_dtype is not int else str(Engine.dtype(to_dtype))
+    df = pd.DataFrame(
+        {
+            "column": pd.Series([1, 2, 6], dtype=from_dtype),
+            "untouched": pd.Series([True, False, True]),
+        }
+    )
+    schema = DataFrameSchema(
+        {
+            "column": Column(to_dtype, coerce=True),
+            "untouched": Column(bool, coerce=True),
+        },
+        index=Index(str, coerce=True),
+    )
+    validated_df = schema.validate(df, copy=False)
+
+    assert validated_df["column"].dtype == to_dtype
+    assert validated_df.index.dtype == object
+    assert df["column"].dtype == from_dtype
+    assert df.index.dtype == "int64"
+    # columns that aren't changed by coercion aren't copied
+    assert np.shares_memory(
+        validated_df["untouched"].values, df["untouched"].values
+    )
+
+
+def test_copy_free_validation_no_coercion() -> None:
+    """Test that copy=False shares all data when nothing is coerced."""
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [1.0, 2.0, 3.0]})
+    schema = DataFrameSchema(
+        {"a": Column(int, coerce=True), "b": Column(float)}
+    )
+    validated_df = schema.validate(df, copy=False)
+    assert validated_df is not df
+    for col in df:
+        assert np.shares_memory(validated_df[col].values, df[col].values)
+
+    series_schema = SeriesSchema(int, coerce=True)
+    validated_series = series_schema.validate(df["a"], copy=False)
+    assert np.shares_memory(validated_series.values, df["a"].values)
+    validated_series = series_schema.validate(df["a"])
+    assert not np.shares_memory(validated_series.values, df["a"].values)
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+@pytest.mark.parametrize(
+    "columns",
+    [
+        ["a", "b", "c", "d"],
+        ["a", "b", "a", "d"],
+        pd.MultiIndex.from_tuples(
+            [("x", "a"), ("x", "b"), ("y", "a"), ("y", "b")],
+            names=["first", "second"],
+        ),
+    ],
+)
+def test_coerce_dtype_columns(columns, inplace: bool) -> None:
+    """Test that coerced columns replace the columns of the dataframe at
+    once, keeping their order and the metadata of the dataframe."""
+    df = pd.DataFrame(
+        [["1", 1.0, "2", True], ["3", 4.0, "5", False]],
+        columns=columns,
+        index=pd.Index([10, 20], name="idx"),
+    )
+    df.attrs["source"] = "test"
+    schema = DataFrameSchema(
+        {
+            column: Column(dtype, coerce=True, name=column)
+            for column, dtype in zip(df.columns, [int, int, int, bool])
+        }
+    )
+    coerced = schema.coerce_dtype(df, inplace=inplace)
+
+    assert coerced.columns.equals(df.columns)
+    assert coerced.columns.names == df.columns.names
+    assert coerced.index.equals(df.index)
+    assert coerced.attrs == {"source": "test"}
+    assert coerced.iloc[:, :3].dtypes.tolist() == [np.dtype("int64")] * 3
+    assert coerced.iloc[:, 0].tolist() == [1, 3]
+    assert coerced.iloc[:, 2].tolist() == [2, 5]
+    assert (coerced is df) == inplace
+    assert (df.iloc[:, 0].dtype == "int64") == inplace
+
+
+def test_coerce_dtype_columns_failure() -> None:
+    """Test that the columns that can be coerced are coerced in the data of
+    the error when other columns can't."""
+    df = pd.DataFrame({"a": ["1", "2"], "b": ["x", "3"], "c": [1.0, 2.0]})
+    schema = DataFrameSchema(
+        {col: Column(int, coerce=True) for col in df.columns}
+    )
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.coerce_dtype(df)
+    assert exc.value.data.dtypes.tolist() == [
+        np.dtype("int64"),
+        np.dtype(object),
+        np.dtype("int64"),
+    ]
+    assert df.dtypes.tolist() == ["object", "object", "float64"]
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    assert set(exc.value.failure_cases["column"]) == {"b"}
+
+
+def test_validation_plan_cache() -> None:
+    """Test that validation plans are reused for dataframes with the same
+    columns and data types, and rebuilt when the schema changes."""
+    # pylint: disable=protected-access
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0)),
+            "num_.+": Column(float, Check.lt(10), regex=True),
+        },
+        strict=True,
+    )
+    plan_cache = schema._validation_plans
+    df = pd.DataFrame({"a": [1, 2], "num_1": [1.0, 2.0], "num_2": [3.0, 4.0]})
+    schema.validate(df)
+    plan = plan_cache.get(schema, df)
+    assert len(plan_cache) == 1
+    assert [c.name for c in plan.components] == ["a", "num_1", "num_2"]
+
+    # same shaped batches reuse the plan
+    schema.validate(df * 2)
+    assert plan_cache.get(schema, df * 2) is plan
+    assert len(plan_cache) == 1
+
+    # different columns or data types build a new plan
+    schema.validate(df[["a", "num_1"]])
+    with pytest.raises(errors.SchemaErrors):
+        schema.validate(df.astype({"a": "int32"}), lazy=True)
+    assert len(plan_cache) == 3
+
+    # modifying the schema never returns a stale plan
+    schema.columns["num_.+"].checks = [Check.lt(5)]
+    with pytest.raises(errors.SchemaError, match="less_than"):
+        schema.validate(df * 2)
+    schema.columns["extra"] = Column(int).set_name("extra")
+    with pytest.raises(errors.SchemaError, match="column 'extra' not in"):
+        schema.validate(df)
+
+    # checks added in place to columns that only had a data type are run
+    schema = DataFrameSchema({"a": Column(int, nullable=True)})
+    schema.validate(df)
+    schema.columns["a"].checks.append(Check.gt(100))
+    with pytest.raises(errors.SchemaError, match="greater_than"):
+        schema.validate(df)
+
+    # setting any attribute of the schema builds a new plan
+    plan_cache = schema._validation_plans
+    plan = plan_cache.get(schema, df)
+    schema.coerce = True
+    assert plan_cache.get(schema, df) is not plan
+
+    # plan caches and state versions don't affect copies or the equality of
+    # schemas, and copies never share state versions
+    schema_copy = copy.deepcopy(schema)
+    assert len(schema_copy._validation_plans) == 0
+    assert schema_copy == schema
+    assert (
+        schema_copy.columns["a"]._state_version.number
+        != schema.columns["a"]._state_version.number
+    )
+
+
+def test_batch_dtype_check(monkeypatch) -> None:
+    """Test that the data types of columns are checked together, and that
+    columns with only a data type aren't validated separately."""
+    # pylint: disable=protected-access
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, nullable=True),
+            "b": Column(float, Check.ge(0), nullable=True),
+            "c": Column(str, nullable=True),
+            "d": Column(nullable=True),
+        }
+    )
+    df = pd.DataFrame(
+        {"a": [1.0, 2.0], "b": [1, 2], "c": ["x", "y"], "d": [1, 2]}
+    )
+    plan = schema._validation_plans.get(schema, df)
+    assert [c.name for c in plan.dtype_components] == ["a", "c"]
+    assert [c.name for c in plan.components] == ["a", "b", "c", "d"]
+    assert not schema.columns["a"]._dtype_checked_by_dataframe
+
+    validated_names = []
+    validate = SeriesSchemaBase.validate
+
+    def _validate(self, check_obj, *args, **kwargs):
+        validated_names.append(self.name)
+        return validate(self, check_obj, *args, **kwargs)
+
+    monkeypatch.setattr(SeriesSchemaBase, "validate", _validate)
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    assert validated_names == ["b", "d"]
+    failure_cases = exc.value.failure_cases
+    assert failure_cases["check"].tolist() == [
+        "dtype('int64')",
+        "dtype('float64')",
+    ]
+    assert failure_cases["failure_case"].tolist() == ["float64", "int64"]
+    with pytest.raises(
+        errors.SchemaError,
+        match="expected series 'a' to have type int64, got float64",
+    ):
+        schema.validate(df)
+
+    # data types of duplicated column names are checked separately
+    validated_names.clear()
+    duplicated_df = pd.concat([df, df[["a"]]], axis="columns")
+    assert not schema._validation_plans.get(
+        schema, duplicated_df
+    ).dtype_components
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(duplicated_df, lazy=True)
+    assert validated_names == ["a", "b", "c", "d"]
+    assert exc.value.failure_cases["check"].tolist() == [
+        "dtype('int64')",
+        "dtype('float64')",
+    ]
+
+
+def test_batch_dtype_check_error_order() -> None:
+    """Test that the wrong data types checked together are reported in the
+    order of the columns, after the other errors of preceding columns."""
+    schema = DataFrameSchema(
+        {"a": Column(int), "b": Column(int, nullable=True)}
+    )
+    df = pd.DataFrame({"a": [1.0, None], "b": [1.0, 2.0]})
+    with pytest.raises(errors.SchemaError, match="non-nullable series 'a'"):
+        schema.validate(df)
+
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(df, lazy=True)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases["check"].tolist() == [
+        "not_nullable",
+        "dtype('int64')",
+        "dtype('int64')",
+    ]
+    assert failure_cases["column"].tolist() == ["a", "a", "b"]
+
+
+def test_batch_dtype_check_coercion_failure() -> None:
+    """Test that columns that fail to coerce only report the coercion
+    failure, and not a wrong data type."""
+    schema = DataFrameSchema({"a": Column(int, coerce=True)})
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.validate(pd.DataFrame({"a": ["x", "1"]}), lazy=True)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases["check"].tolist() == ["coerce_dtype('int64')"]
+    assert failure_cases["index"].dtype == np.dtype("int64")
+    assert exc.value.error_counts == {"schema_component_check": 2}
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, -1])
+def test_concurrent_validation(n_jobs: int) -> None:
+    """Test that concurrent validation gives the same results as serial
+    validation, with errors reported in schema order."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0)),
+            "b": Column(float, Check.lt(10), coerce=True),
+            "c": Column(str, Check.isin(["x", "y"])),
+        },
+        checks=Check(lambda df: df["a"] < df["b"]),
+        index=Index(int, Check.ge(0)),
+    )
+    valid_df = pd.DataFrame({"a": [1, 2], "b": [2, 3], "c": ["x", "y"]})
+    validated_df = schema.validate(valid_df, n_jobs=n_jobs)
+    assert validated_df["b"].dtype == np.dtype(float)
+
+    invalid_df = pd.DataFrame(
+        {"a": [-1, 2], "b": [20, 1], "c": ["x", "z"]}, index=[-1, 0]
+    )
+    with pytest.raises(errors.SchemaErrors) as serial_exc:
+        schema.validate(invalid_df, lazy=True)
+    with pytest.raises(errors.SchemaErrors) as concurrent_exc:
+        schema.validate(invalid_df, lazy=True, n_jobs=n_jobs)
+    pd.testing.assert_frame_equal(
+        serial_exc.value.failure_cases, concurrent_exc.value.failure_cases
+    )
+    with pytest.raises(errors.SchemaError, match="greater_than_or_equal_to"):
+        schema.validate(invalid_df, n_jobs=n_jobs)
+
+
+def test_concurrent_validation_executor() -> None:
+    """Test validation with a user-provided executor."""
+    df = pd.DataFrame({"a": [1, 2], "b": [-1, 1]})
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        schema = DataFrameSchema(
+            {"a": Column(int, Check.gt(0)), "b": Column(int, Check.gt(0))},
+            executor=executor,
+        )
+        # copies of the schema share the executor
+        assert copy.deepcopy(schema).executor is executor
+        with pytest.raises(errors.SchemaErrors) as exc:
+            schema.validate(df, lazy=True)
+        assert set(exc.value.failure_cases["column"]) == {"b"}
+        validated_df = DataFrameSchema({"a": Column(int)}).validate(
+            df, executor=executor
+        )
+        pd.testing.assert_frame_equal(validated_df, df)
+
+
 @pytest.fixture
 def schema_simple() -> DataFrameSchema:
     """Simple schema fixture."""
@@ -1860,3 +2242,248 @@ def test_unique_and_set_duplicates_setters() -> None:
     assert test_schema.unique == ["a"]
     test_schema.unique = None
     assert not test_schema.unique
+
+
+def test_fused_checks() -> None:
+    """Test that fused built-in checks report the checks that actually fail."""
+    checks = [
+        Check.ge(0),
+        Check.le(10, raise_warning=True),
+        Check.notin([5]),
+        Check.lt(100, ignore_na=False),
+        Check(lambda s: s < 100),
+    ]
+    schema = DataFrameSchema({"a": Column(float, checks, nullable=True)})
+    schema.validate(pd.DataFrame({"a": [0.0, 1.0, 10.0]}))
+
+    df = pd.DataFrame({"a": [-1.0, 5.0, np.nan, 20.0, 1.0]})
+    with pytest.warns(UserWarning, match="less_than_or_equal_to"):
+        with pytest.raises(errors.SchemaErrors) as exc:
+            schema.validate(df, lazy=True)
+    failure_cases = exc.value.failure_cases.sort_values("check_number")
+    assert failure_cases.check.tolist() == [
+        "greater_than_or_equal_to(0)",
+        "notin({5})",
+        "less_than(100)",
+    ]
+    assert failure_cases["index"].tolist() == [0, 1, 2]
+
+
+def test_fail_fast_checks() -> None:
+    """Test that checks stop at the first block of rows with failure cases
+    when validation isn't lazy."""
+    n_rows = 1_000_000
+    calls = []
+
+    def positive(x):
+        calls.append(x)
+        return x >= 0
+
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check(positive, element_wise=True)),
+            "b": Column(float, [Check.ge(0), Check.lt(1, n_failure_cases=3)]),
+        },
+        checks=Check.expr("a <= b * 10", n_failure_cases=2),
+    )
+    df = pd.DataFrame({"a": np.arange(n_rows) - 15, "b": np.zeros(n_rows)})
+    with pytest.raises(errors.SchemaError) as exc:
+        schema.validate(df)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases is not None
+    # the default number of failure cases is reported
+    assert failure_cases.failure_case.tolist() == list(range(-15, -5))
+    assert len(calls) < n_rows
+
+    df = pd.DataFrame(
+        {"a": np.zeros(n_rows, dtype=int), "b": np.arange(n_rows, dtype=float)}
+    )
+    with pytest.raises(errors.SchemaError) as exc:
+        schema.validate(df)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases is not None
+    assert failure_cases.failure_case.tolist() == [1.0, 2.0, 3.0]
+    assert len(exc.value.check_output) < n_rows
+
+    # all failure cases are reported with lazy validation
+    with pytest.raises(errors.SchemaErrors) as lazy_exc:
+        schema.validate(df.iloc[:100], lazy=True)
+    assert lazy_exc.value.error_counts == {"schema_component_check": 1}
+    assert len(lazy_exc.value.failure_cases) == 3
+
+    df = pd.DataFrame({"a": np.arange(n_rows), "b": np.full(n_rows, 0.5)})
+    with pytest.raises(errors.SchemaError, match="expr") as exc:
+        schema.validate(df)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases is not None
+    assert failure_cases["index"].unique().tolist() == [6, 7]
+
+
+@pytest.mark.parametrize(
+    "n_failure_cases, n_evaluated", [(2, 10), (12, 30), (None, 10)]
+)
+@pytest.mark.parametrize("schema_cls", [DataFrameSchema, SeriesSchema])
+def test_fail_fast_n_failure_cases(
+    monkeypatch, schema_cls, n_failure_cases, n_evaluated
+) -> None:
+    """Test that checks stop evaluating rows at the first block with failure
+    cases, or once their number of failure cases is found if it's set."""
+    monkeypatch.setattr(vectorized_checks, "FUSED_BLOCK_SIZE", 10)
+    evaluated = []
+
+    def positive(x):
+        evaluated.append(x)
+        return x > 0
+
+    check = Check(positive, element_wise=True, n_failure_cases=n_failure_cases)
+    # every other row fails the check, with distinct failure cases
+    values = np.where(np.arange(100) % 2, 1, -np.arange(100))
+    if schema_cls is SeriesSchema:
+        schema = SeriesSchema(int, check)
+        data = pd.Series(values)
+    else:
+        schema = DataFrameSchema({"a": Column(int, check)})
+        data = pd.DataFrame({"a": values})
+    with pytest.raises(errors.SchemaError):
+        schema.validate(data)
+    assert len(evaluated) == n_evaluated
+
+    # lazy validation evaluates all rows
+    evaluated.clear()
+    with pytest.raises(errors.SchemaErrors):
+        schema.validate(data, lazy=True)
+    assert len(evaluated) == 100
+
+
+def test_quarantine() -> None:
+    """Test that rows failing coercion or checks are quarantined."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0, n_failure_cases=1), coerce=True),
+            "b": Column(str, Check.ne("z")),
+        },
+        checks=Check(lambda df: df["a"] < 100),
+    )
+    df = pd.DataFrame(
+        {
+            "a": ["1", "foo", "-1", "2", "-3", "200", "3"],
+            "b": ["x", "y", "x", None, "x", "x", "z"],
+        }
+    )
+    valid, quarantined, report = schema.quarantine(df)
+    expected = pd.DataFrame({"a": [1], "b": ["x"]})
+    pd.testing.assert_frame_equal(valid, expected)
+    assert valid.pandera.schema is schema
+    # quarantined rows aren't coerced, and all the rows that fail a check
+    # are quarantined even if the check only reports one failure case
+    pd.testing.assert_frame_equal(quarantined, df.iloc[1:])
+
+    failures = report.failures.set_index("check")
+    assert failures["n_failures"].to_dict() == {
+        "coerce_dtype('int64')": 1,
+        "greater_than_or_equal_to(0)": 2,
+        "not_nullable": 1,
+        "not_equal_to(z)": 1,
+        "<lambda>": 1,
+    }
+    assert report.n_rows == len(df)
+
+    # duplicated index labels are handled by position
+    df.index = [0, 0, 1, 1, 2, 2, 3]
+    valid, quarantined, _ = schema.quarantine(df)
+    pd.testing.assert_frame_equal(valid, expected.set_axis([0]))
+    pd.testing.assert_frame_equal(quarantined, df.iloc[1:])
+
+    # null duplicates fail the uniqueness of a nullable column
+    schema = DataFrameSchema({"a": Column(float, unique=True, nullable=True)})
+    df = pd.DataFrame({"a": [np.nan, np.nan, 1.0]})
+    valid, quarantined, report = schema.quarantine(df)
+    pd.testing.assert_frame_equal(valid, df.iloc[[0, 2]])
+    pd.testing.assert_frame_equal(quarantined, df.iloc[[1]])
+    assert report.failures["check"].tolist() == ["field_uniqueness"]
+
+
+def test_quarantine_non_row_errors() -> None:
+    """Test that errors that don't concern rows are raised."""
+    schema = DataFrameSchema(
+        {"a": Column(int, Check.ge(0)), "b": Column(int)},
+        checks=Check(lambda df: df["a"].sum() > 0),
+    )
+    with pytest.raises(errors.SchemaErrors) as exc:
+        schema.quarantine(pd.DataFrame({"a": [1, -1, -2], "b": [1.0, 2, 3]}))
+    assert {
+        error_dict["error"].check for error_dict in exc.value.schema_errors
+    } == {"dtype('int64')", schema.checks[0]}
+
+    valid, quarantined, report = schema.quarantine(
+        pd.DataFrame({"a": [1, -1, 2], "b": [1, 2, 3]})
+    )
+    assert valid["a"].tolist() == [1, 2]
+    assert quarantined["a"].tolist() == [-1]
+    assert not report.passed
+
+
+def test_row_mask_quarantine_input_unchanged() -> None:
+    """Test that row_mask and quarantine don't modify the dataframe."""
+    schema = DataFrameSchema(
+        {"a": Column(int, Check.ge(0), coerce=True)}, strict="filter"
+    )
+    df = pd.DataFrame({"a": ["1", "-1", "2"], "extra": ["x", "y", "z"]})
+    original = df.copy()
+
+    assert schema.row_mask(df).tolist() == [True, False, True]
+    pd.testing.assert_frame_equal(df, original)
+
+    valid, quarantined, _ = schema.quarantine(df)
+    pd.testing.assert_frame_equal(df, original)
+    assert valid.columns.tolist() == ["a"]
+    # quarantined rows are returned as they are in the dataframe
+    pd.testing.assert_frame_equal(quarantined, original.iloc[[1]])
+
+    # columns that don't need coercion are filtered out too
+    df = pd.DataFrame({"a": [1, -1, 2], "extra": ["x", "y", "z"]})
+    original = df.copy()
+    assert schema.row_mask(df).tolist() == [True, False, True]
+    _, quarantined, _ = schema.quarantine(df)
+    pd.testing.assert_frame_equal(df, original)
+    pd.testing.assert_frame_equal(quarantined, original.iloc[[1]])
+
+
+def test_row_mask() -> None:
+    """Test that the mask of rows passing validation is returned."""
+    schema = DataFrameSchema(
+        {
+            "a": Column(int, Check.ge(0, n_failure_cases=1), coerce=True),
+            "b": Column(float, Check(lambda x: x < 1, element_wise=True)),
+        },
+        checks=Check.expr("a > b"),
+        index=Index(int, Check.ne(5)),
+    )
+    df = pd.DataFrame(
+        {
+            "a": ["1", "2", "-1", "3", "x", "3", "2"],
+            "b": [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 2.0],
+        },
+        index=[0, 0, 1, 1, 0, 5, 3],
+    )
+    original = df.copy()
+    mask = schema.row_mask(df)
+    assert isinstance(mask, np.ndarray)
+    assert mask.tolist() == [True, True, False, True, False, False, False]
+    pd.testing.assert_frame_equal(df, original)
+
+    valid = df.iloc[:2].astype({"a": int})
+    np.testing.assert_array_equal(
+        schema.row_mask(valid.assign(b=[0.5, -1.0])), [True, True]
+    )
+
+    # no row passes errors that don't concern rows
+    schema = DataFrameSchema({"a": Column(int), "c": Column(int)})
+    np.testing.assert_array_equal(schema.row_mask(valid), [False, False])
+
+    # null duplicates fail the uniqueness of a nullable column
+    schema = DataFrameSchema({"a": Column(float, unique=True, nullable=True)})
+    np.testing.assert_array_equal(
+        schema.row_mask(pd.DataFrame({"a": [np.nan, np.nan, 1.0]})),
+        [True, False, True],
+    )
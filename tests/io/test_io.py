@@ -610,6 +610,19 @@ def test_to_yaml_custom_dataframe_check():
     # `test_to_yaml_lambda_check`
 
 
+def test_to_yaml_expression_check():
+    """Tests that expression checks are serialized as expression strings."""
+    schema = pandera.DataFrameSchema(
+        {"a": pandera.Column(int), "b": pandera.Column(float)},
+        checks=[pandera.Check.expr("a > b * 2", ignore_na=True)],
+    )
+    serialized = pandera.io.to_yaml(schema)
+    assert "expr: a > b * 2" in serialized
+    loaded = pandera.io.from_yaml(serialized)
+    assert loaded == schema
+    assert loaded.checks[0].ignore_na
+
+
 def test_to_yaml_bugfix_warn_unregistered_global_checks():
     """Ensure that unregistered global checks raises a warning."""
     # pylint: disable=no-self-use
@@ -35,7 +35,15 @@ for data_type in pandas_engine.Engine.get_registered_dtypes():
         getattr(data_type, "bit_width", -1) > 64
         or is_category(data_type)
         or data_type
-        in (pandas_engine.Interval, pandas_engine.Period, pandas_engine.Sparse)
+        in (
+            pandas_engine.Interval,
+            pandas_engine.Period,
+            pandas_engine.Sparse,
+            # compact data types only coerce data to other data types
+            pandas_engine.CompactInt,
+            pandas_engine.CompactFloat,
+            pandas_engine.CompactCategory,
+        )
     ):
         continue
     SUPPORTED_DTYPES.add(pandas_engine.Engine.dtype(data_type))